@@ -0,0 +1,18 @@
+# Generated by Django 5.0.8 on 2026-10-18 07:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0003_user_email_user_is_2fa_enabled_user_totp_secret_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='picture_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -53,6 +53,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     picture = models.ImageField(
         "Image Profile", upload_to="img/profile", null=True, blank=True
     )
+    picture_variants = models.JSONField(default=dict, blank=True)  # {format: {width: name}}
 
 
     totp_secret = models.CharField(max_length=32, blank=True, null=True)
@@ -3,3 +3,7 @@ from ..models import User
 
 def count_users() -> int:
     return User.objects.count()
+
+
+def get_user_id_by_username(username: str) -> int | None:
+    return User.objects.filter(username=username).values_list("id", flat=True).first()
@@ -1,6 +1,8 @@
 from django.db.utils import IntegrityError
 from django.contrib.auth.validators import UnicodeUsernameValidator
 from core.logger import logging
+from core.images import schedule_image_variants
+from apps.content.services.version import bump_owner_version
 from ..models import User
 from ..validators import validate_password
 
@@ -16,3 +18,18 @@ def create_user(username: str, password: str) -> User | None:
     except IntegrityError:
         logging.info("User creation was repeating")
         return None
+
+
+def update_user_picture(user: User, picture) -> User:
+    """Replace the avatar; its resized variants are filled in asynchronously."""
+    user.picture = picture
+    user.picture_variants = {}
+    user.save(update_fields=["picture", "picture_variants"])
+    schedule_image_variants(
+        user,
+        "picture",
+        "picture_variants",
+        on_stored=lambda: bump_owner_version(user.id),
+    )
+    bump_owner_version(user.id)
+    return user
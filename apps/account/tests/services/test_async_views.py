@@ -0,0 +1,42 @@
+from django.core.cache import cache
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.connect.models import Connection
+from apps.content.services.content import create_post
+from ...models import User
+
+
+class ProfileDetailViewTests(TransactionTestCase):
+    """Committed data, since concurrent queries use their own connections."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.owner = User.objects.create(username="owner")
+        self.friend = User.objects.create(username="friend")
+        Connection.objects.create(requester=self.owner, receiver=self.friend, is_accept=True)
+        create_post(self.owner, "first #django")
+        create_post(self.owner, "second")
+
+    def test_profile_counts(self):
+        url = reverse("api:account:profile_detail", args=["owner"])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["connections_count"], 1)
+        self.assertEqual(response.data["posts_count"], 2)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(
+            self.client.get(reverse("api:account:profile_detail", args=["nobody"])).status_code,
+            404,
+        )
+
+    def test_private_profile_needs_a_connection(self):
+        User.objects.filter(id=self.owner.id).update(is_private=True)
+        url = reverse("api:account:profile_detail", args=["owner"])
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.force_authenticate(self.friend)
+        self.assertEqual(self.client.get(url).status_code, 200)
@@ -1,6 +1,7 @@
 import uuid
 import pyotp
-from django.shortcuts import get_object_or_404
+from asgiref.sync import sync_to_async
+from django.shortcuts import get_object_or_404, aget_object_or_404
 from django.core.mail import send_mail
 from django.conf import settings
 from django.utils.crypto import get_random_string
@@ -10,6 +11,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import serializers, status
+from adrf.views import APIView as AsyncAPIView
 from drf_spectacular.utils import (
     extend_schema,
     OpenApiResponse,
@@ -20,10 +22,14 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.connect.selectors.connection import count_connections
 from apps.content.selectors.content import get_content_by_owner
-from apps.connect.selectors.connection import user_connected_to
+from apps.content.services.version import bump_owner_version, get_owner_version_key
+from apps.connect.selectors.connection import auser_connected_to
 from core import logger
+from core.concurrency import gather_queries
+from core.conditional import get_not_modified_response, get_validators, set_validators
+from core.images import get_variant_urls
 from .models import User
-from .services.user import create_user
+from .services.user import create_user, update_user_picture
 from .validators import validate_password
 from .services.password import (
     send_password_reset_code,
@@ -131,6 +137,7 @@ class ProfileUpdateAPIView(APIView):
 
         try:
             srz.save()
+            bump_owner_version(user.id)
             return Response(self.OutputProfileUpdateSerializer(user).data)
         except Exception as e:
             logger.error(f"Error updating profile info for {user.username}: {e}")
@@ -165,7 +172,8 @@ class ProfileAvatarUpdateAPIView(APIView):
         srz.is_valid(raise_exception=True)
 
         try:
-            srz.save()
+            if "picture" in srz.validated_data:
+                update_user_picture(user, srz.validated_data["picture"])
             return Response(srz.data)
         except Exception as e:
             logger.error(f"Error updating profile picture for {user.username}: {e}")
@@ -175,13 +183,15 @@ class ProfileAvatarUpdateAPIView(APIView):
             )
 
 
-class ProfileRetrieveAPIView(APIView):
+class ProfileRetrieveAPIView(AsyncAPIView):
     """
     Retrieves a user's profile.
     Shows public data to all users, but includes email for the profile owner.
     """
 
     class OutputProfileSerializer(serializers.ModelSerializer):
+        picture_variants = serializers.SerializerMethodField()
+
         connections_count = serializers.IntegerField()
 
         posts_count = serializers.IntegerField()
@@ -193,11 +203,15 @@ class ProfileRetrieveAPIView(APIView):
                 "full_name",
                 "bio",
                 "picture",
+                "picture_variants",
                 "is_private",
                 "connections_count",
                 "posts_count",
             )
 
+        def get_picture_variants(self, obj) -> dict:
+            return get_variant_urls(obj.picture_variants, self.context.get("request"))
+
     class OutputSelfProfileSerializer(OutputProfileSerializer):
         class Meta:
             model = User
@@ -206,6 +220,7 @@ class ProfileRetrieveAPIView(APIView):
                 "full_name",
                 "bio",
                 "picture",
+                "picture_variants",
                 "is_private",
                 "connections_count",
                 "posts_count",
@@ -237,33 +252,41 @@ class ProfileRetrieveAPIView(APIView):
         },
         tags=["Profile"],
     )
-    def get(self, request, username: str):
+    async def get(self, request, username: str):
         # If the user is viewing their own profile
-        if request.user.is_authenticated and request.user.username == username:
+        is_self = request.user.is_authenticated and request.user.username == username
+        if is_self:
             user_obj = request.user
-            srz_data = self.OutputSelfProfileSerializer(
-                user_obj, context={"request": request}
-            ).data
         else:
-            user_obj = get_object_or_404(User, username=username)
+            user_obj = await aget_object_or_404(User, username=username)
             # Check for privacy settings
             if user_obj.is_private:
-                if not request.user.is_authenticated or not user_connected_to(
+                if not request.user.is_authenticated or not await auser_connected_to(
                     request.user, user_obj
                 ):
                     return Response(
                         {"detail": "This profile is private."},
                         status=status.HTTP_403_FORBIDDEN,
                     )
-            srz_data = self.OutputProfileSerializer(
-                user_obj, context={"request": request}
-            ).data
 
-        # Add aggregated counts
-        srz_data["connections_count"] = count_connections(user_obj)
-        srz_data["posts_count"] = get_content_by_owner(user_obj.username).count()
+        etag, last_modified = await sync_to_async(get_validators)(
+            request, [get_owner_version_key(user_obj.id)]
+        )
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        # Add aggregated counts, both read at the same time
+        user_obj.connections_count, user_obj.posts_count = await gather_queries(
+            lambda: count_connections(user_obj),
+            lambda: get_content_by_owner(user_obj.username).count(),
+        )
 
-        return Response(srz_data)
+        serializer_class = (
+            self.OutputSelfProfileSerializer if is_self else self.OutputProfileSerializer
+        )
+        srz_data = serializer_class(user_obj, context={"request": request}).data
+        return set_validators(Response(srz_data), etag, last_modified)
 
 
 class LoginView(APIView):
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from .models import Comment
 
 @admin.register(Comment)
@@ -7,15 +8,20 @@ class CommentAdmin(admin.ModelAdmin):
     list_filter = ("created_at", "user")
     search_fields = ("text", "user__username", "content__description")
     readonly_fields = ("created_at", "likes_count")
+    list_select_related = ("user", "content")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(likes_total=Count("likes"))
 
     def short_text(self, obj):
         return (obj.text[:75] + "...") if len(obj.text) > 75 else obj.text
     short_text.short_description = "Comment Text"
 
     def reply_to(self, obj):
-        return obj.reply.id if obj.reply else "-"
+        return obj.reply_id or "-"
     reply_to.short_description = "Reply To (Comment ID)"
 
     def likes_count(self, obj):
-        return obj.likes.count()
+        return obj.likes_total
     likes_count.short_description = "Number of Likes"
+    likes_count.admin_order_field = "likes_total"
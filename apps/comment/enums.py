@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class CacheKeyPrefix(Enum):
+    COMMENTS_VERSION = "comments_version"
+
+    def key(self, suffix: str):
+        return f"{self.value}:{suffix}"
@@ -1,11 +1,32 @@
 from apps.comment.models import Comment
 from apps.content.models import Content
 from django.shortcuts import get_object_or_404
+from core.conditional import bump_versions
+from .enums import CacheKeyPrefix
+
+
+def get_comments_version_key(content_id) -> str:
+    """Changes whenever a comment, reply or comment like of the content changes."""
+    return CacheKeyPrefix.COMMENTS_VERSION.key(content_id)
+
 
 def create_comment(user, content_id, text, reply_id=None):
     content = get_object_or_404(Content, pk=content_id)
     reply = Comment.objects.filter(pk=reply_id).first() if reply_id else None
-    return Comment.objects.create(user=user, content=content, text=text, reply=reply)
+    comment = Comment.objects.create(user=user, content=content, text=text, reply=reply)
+    bump_versions([get_comments_version_key(content.id)])
+    return comment
 
 def delete_comment(comment):
-    comment.delete()
\ No newline at end of file
+    comment.delete()
+    bump_versions([get_comments_version_key(comment.content_id)])
+
+def toggle_comment_like(comment, user) -> bool:
+    if comment.likes.filter(id=user.id).exists():
+        comment.likes.remove(user)
+        liked = False
+    else:
+        comment.likes.add(user)
+        liked = True
+    bump_versions([get_comments_version_key(comment.content_id)])
+    return liked
@@ -0,0 +1,40 @@
+import time
+from unittest import mock
+from django.core.cache import cache
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.account.models import User
+from apps.content.services.content import create_post
+
+
+class CommentListCreateViewTests(TransactionTestCase):
+    """Committed data, since concurrent queries use their own connections."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.owner = User.objects.create(username="owner")
+        self.friend = User.objects.create(username="friend")
+        self.post = create_post(self.owner, "first #django")
+
+    def test_comments_list_and_create(self):
+        url = reverse("api:comment:comment-list-create", args=[self.post.id])
+        self.client.force_authenticate(self.friend)
+        response = self.client.post(url, {"text": "nice"})
+        self.assertEqual(response.status_code, 201)
+
+        self.client.force_authenticate(None)
+        self.assertEqual([c["text"] for c in self.client.get(url).data], ["nice"])
+
+    def test_relative_times_expire_the_etag(self):
+        url = reverse("api:comment:comment-list-create", args=[self.post.id])
+        self.client.force_authenticate(self.friend)
+        self.client.post(url, {"text": "nice"})
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with mock.patch("time.time", return_value=time.time() + 120):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
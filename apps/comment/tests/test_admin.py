@@ -0,0 +1,19 @@
+from django.test import TestCase
+from django.urls import reverse
+from apps.account.models import User
+from apps.content.services.content import create_post
+from ..services import create_comment
+
+
+class CommentAdminTests(TestCase):
+    def test_changelist_has_no_n_plus_one(self):
+        # The query inspector raises on repeated statements under tests
+        admin = User.objects.create(username="admin", is_admin=True, is_superuser=True)
+        for index in range(6):
+            user = User.objects.create(username=f"user{index}")
+            post = create_post(user, f"post {index}")
+            create_comment(user=user, content_id=post.id, text="hi")
+        self.client.force_login(admin)
+
+        response = self.client.get(reverse("admin:comment_comment_changelist"))
+        self.assertEqual(response.status_code, 200)
@@ -1,32 +1,55 @@
+import time
+from asgiref.sync import sync_to_async
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from drf_spectacular.utils import extend_schema
-from .services import create_comment, delete_comment
+from adrf.views import APIView as AsyncAPIView
+from core.conditional import get_not_modified_response, get_validators, set_validators
+from core.response_cache import cache_anonymous_response
+from .services import (
+    create_comment,
+    delete_comment,
+    toggle_comment_like,
+    get_comments_version_key,
+)
 from .selectors import list_comments, list_replies, get_comment_with_counts
 from .serializers import CommentSerializer, CommentCreateSerializer
 from .permissions import IsCommentOwner
 from apps.comment.models import Comment
 
+# created_at is rendered relative to now ("5 minutes ago"), so copies of a
+# comment list go stale within this many seconds even without writes.
+RELATIVE_TIME_WINDOW = 60
 
-class CommentListCreateAPIView(APIView):
+
+class CommentListCreateAPIView(AsyncAPIView):
     def get_permissions(self):
         if self.request.method == "POST":
             return [IsAuthenticated()]
         return [AllowAny()]
 
     @extend_schema(request=CommentCreateSerializer, responses=CommentSerializer(many=True), auth=[])
-    def get(self, request, content_id):
-        comments = list_comments(content_id)
+    async def get(self, request, content_id):
+        since = int(time.time()) // RELATIVE_TIME_WINDOW * RELATIVE_TIME_WINDOW * 10**9
+        etag, last_modified = await sync_to_async(get_validators)(
+            request, [get_comments_version_key(content_id)], since
+        )
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        comments = [comment async for comment in list_comments(content_id)]
         serializer = CommentSerializer(comments, many=True)
-        return Response(serializer.data)
+        return set_validators(Response(serializer.data), etag, last_modified)
 
     @extend_schema(request=CommentCreateSerializer, responses=CommentSerializer)
-    def post(self, request, content_id):
+    async def post(self, request, content_id):
+        # adrf needs every handler of a view to be async
         serializer = CommentCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        comment = create_comment(
+        comment = await sync_to_async(create_comment)(
             user=request.user,
             content_id=content_id,
             text=serializer.validated_data["text"],
@@ -49,9 +72,12 @@ class CommentDeleteAPIView(APIView):
 
 class ReplyListAPIView(APIView):
     authentication_classes = []
+    response_cache_timeout = RELATIVE_TIME_WINDOW
 
     @extend_schema(responses=CommentSerializer(many=True))
+    @cache_anonymous_response
     def get(self, request, content_id, comment_id):
+        self.response_cache_tags = [get_comments_version_key(content_id)]
         replies = list_replies(content_id, comment_id)
         serializer = CommentSerializer(replies, many=True)
         return Response(serializer.data)
@@ -66,11 +92,5 @@ class CommentLikeToggleAPIView(APIView):
         if not comment:
             return Response({"detail": "Comment not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        if request.user in comment.likes.all():
-            comment.likes.remove(request.user)
-            liked = False
-        else:
-            comment.likes.add(request.user)
-            liked = True
-
+        liked = toggle_comment_like(comment, request.user)
         return Response({"liked": liked}, status=status.HTTP_200_OK)
\ No newline at end of file
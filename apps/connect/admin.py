@@ -13,17 +13,18 @@ class ConnectionAdmin(admin.ModelAdmin):
         "receiver__username",
     )
     list_editable = ("is_accept",)
+    list_select_related = ("requester", "receiver")
     ordering = ("-created_at",)
 
     def requester_link(self, obj):
-        url = reverse("admin:account_user_change", args=[obj.requester.pk])
+        url = reverse("admin:account_user_change", args=[obj.requester_id])
         return format_html('<a href="{}">{}</a>', url, obj.requester.username)
 
     requester_link.short_description = "Requester"
     requester_link.admin_order_field = "requester__username"
 
     def receiver_link(self, obj):
-        url = reverse("admin:account_user_change", args=[obj.receiver.pk])
+        url = reverse("admin:account_user_change", args=[obj.receiver_id])
         return format_html('<a href="{}">{}</a>', url, obj.receiver.username)
 
     receiver_link.short_description = "Receiver"
@@ -19,9 +19,20 @@ def list_connections(user: User) -> list[User]:
     ]
 
 
+def list_connection_ids(user: User) -> set[int]:
+    pairs = Connection.objects.accepted().filter(
+        Q(requester=user) | Q(receiver=user)
+    ).values_list("requester_id", "receiver_id")
+    return {peer for pair in pairs for peer in pair} - {user.pk}
+
+
 def user_connected_to(user1: User, user2: User) -> bool:
     return Connection.objects.between(user1, user2, is_accept=True).exists()
 
 
+async def auser_connected_to(user1: User, user2: User) -> bool:
+    return await Connection.objects.between(user1, user2, is_accept=True).aexists()
+
+
 def count_connections(user: User) -> int:
     return Connection.objects.accepted_with(user).count()
@@ -1,6 +1,8 @@
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from apps.account.models import User
+from apps.content.services.timeline import connect_timelines, disconnect_timelines
+from apps.content.services.version import bump_owner_version
 from ..models import Connection
 
 
@@ -36,6 +38,8 @@ def request_connection(
             return False, ErrorMessages.connection_exist
         reverse.is_accept = True
         reverse.save()
+        connect_timelines(requester, receiver)
+        bump_owner_version(requester.id, receiver.id)
         return True, reverse
 
     try:
@@ -44,6 +48,9 @@ def request_connection(
             receiver=receiver,
             is_accept=not receiver.is_private,
         )
+        if connection.is_accept:
+            connect_timelines(requester, receiver)
+            bump_owner_version(requester.id, receiver.id)
         return True, connection
     except ValidationError as e:
         return False, str(e)
@@ -69,6 +76,8 @@ def accept_connection(requester: User, receiver: User) -> bool:
         return False
     connection.is_accept = True
     connection.save()
+    connect_timelines(requester, receiver)
+    bump_owner_version(requester.id, receiver.id)
     return True
 
 
@@ -78,6 +87,8 @@ def remove_connection(requester: User, receiver: User) -> bool:
         connection = Connection.objects.between(requester, receiver).first()
         if connection:
             connection.delete()
+            disconnect_timelines(requester, receiver)
+            bump_owner_version(requester.id, receiver.id)
             return True
         return False
     except IntegrityError:
@@ -0,0 +1,18 @@
+from django.test import TestCase
+from django.urls import reverse
+from apps.account.models import User
+from ..models import Connection
+
+
+class ConnectionAdminTests(TestCase):
+    def test_changelist_has_no_n_plus_one(self):
+        # The query inspector raises on repeated statements under tests
+        admin = User.objects.create(username="admin", is_admin=True, is_superuser=True)
+        owner = User.objects.create(username="owner")
+        for index in range(6):
+            user = User.objects.create(username=f"user{index}")
+            Connection.objects.create(requester=user, receiver=owner, is_accept=False)
+        self.client.force_login(admin)
+
+        response = self.client.get(reverse("admin:connect_connection_changelist"))
+        self.assertEqual(response.status_code, 200)
@@ -8,13 +8,15 @@ class BaseContentAdmin(admin.ModelAdmin):
     readonly_fields = ["likes_count", "created_at", "updated_at"]
     list_display = ("id", "owner", "likes_count", "created_at", "thumbnail_preview")
     list_filter = ("created_at", "owner")
+    list_select_related = ("owner",)
     search_fields = ("description", "owner__username", "owner__email")
     ordering = ("-created_at",)
 
     def likes_count(self, obj):
-        return obj.likes.count()
+        return obj.like_count
 
     likes_count.short_description = "Likes"
+    likes_count.admin_order_field = "like_count"
 
     def thumbnail_preview(self, obj):
         if obj.thumbnail:
@@ -44,11 +46,12 @@ class MediaAdmin(BaseContentAdmin):
 
 @admin.register(Hashtag)
 class HashtagAdmin(admin.ModelAdmin):
-    list_display = ("id", "name", "content_count")
+    list_display = ("id", "name", "content_count", "updated_at")
     search_fields = ("name",)
     ordering = ("name",)
 
     def content_count(self, obj):
-        return obj.contents.count()
+        return obj.usage_count
 
     content_count.short_description = "Used in"
+    content_count.admin_order_field = "usage_count"
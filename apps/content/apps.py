@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class ContentConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.content"
+
+    def ready(self):
+        from django.conf import settings
+
+        if settings.CONTENT_LIKE_WRITE_BEHIND:
+            from .services.like import like_buffer
+
+            like_buffer.start()
@@ -1,18 +1,24 @@
 from typing import Any
-from django.http import HttpRequest
+from django.http import Http404, HttpRequest
 from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
+from core.conditional import get_not_modified_response, get_validators, set_validators
+from core.pagination import PaginatedAPIViewMixin
+from core.response_cache import cache_anonymous_response
+from apps.account.selectors.user import get_user_id_by_username
 from .models import Post, MediaContent, Content
-from .selectors.content import (
-    get_posts_by_owner,
-    get_media_content_by_owner,
-    get_content_by_owner,
-    get_connection_content,
-)
+from .selectors.content import get_content_rows_by_owner
 from .selectors.hashtag import get_media_contents_by_hashtag, get_posts_by_hashtag,get_contents_by_hashtag
+from .selectors.like import get_like_context, get_like_context_for_ids
+from .selectors.media import get_media_access_token, get_media_access_window
+from .services.version import (
+    get_hashtag_version_key,
+    get_liker_version_key,
+    get_owner_version_key,
+)
 from .services.content import (
     create_post,
     create_media_content,
@@ -30,20 +36,41 @@ __all__ = [
 ]
 
 
-class UserContentListAPIView(APIView):
+class UserContentListAPIView(PaginatedAPIViewMixin, APIView):
     model = None
     serializer_class = None
 
+    @cache_anonymous_response
     def get(self, request, username):
-        if self.model is Post:
-            contents = get_posts_by_owner(username)
-        elif self.model is MediaContent:
-            contents = get_media_content_by_owner(username)
-        else: # Model is Content
-            contents = get_content_by_owner(username)
-
-        srz = self.serializer_class(contents, many=True)
-        return Response(srz.data)
+        # Validators are checked before any content is loaded. Pages of an
+        # unknown owner would be tagged with a version nothing ever bumps.
+        owner_id = get_user_id_by_username(username)
+        if owner_id is None:
+            raise Http404
+        owner_version_key = get_owner_version_key(owner_id)
+        self.response_cache_tags = [owner_version_key]
+        version_keys = [owner_version_key]
+        since = 0
+        if request.user.is_authenticated:
+            version_keys.append(get_liker_version_key(request.user.id))
+            # Pages carry the viewer's media token, renewed every window.
+            since = get_media_access_window() * 10**9
+        etag, last_modified = get_validators(request, version_keys, since)
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        # Pages are large, so rows go through the values-based fast path
+        rows = self.paginate_queryset(
+            get_content_rows_by_owner(
+                self.model, username, self.serializer_class.get_row_fields()
+            )
+        )
+        context = get_like_context_for_ids(request.user, [row["id"] for row in rows])
+        data = self.serializer_class.rows_to_representation(rows, context)
+        return set_validators(
+            self.get_paginated_response(data), etag, last_modified
+        )
 
 
 class CreateContentAPIView(APIView):
@@ -73,7 +100,8 @@ class CreateContentAPIView(APIView):
             if not created:
                 return Response({"detail": content}, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response(self.output_serializer_class(content).data)
+        context = {"media_token": get_media_access_token(request.user)}
+        return Response(self.output_serializer_class(content, context=context).data)
 
 
 class UpdateDeleteContentAPIView(APIView):
@@ -108,7 +136,11 @@ class UpdateDeleteContentAPIView(APIView):
             content_obj, description=srz_data.get("description")
         )
 
-        return Response(self.output_serializer_class(updated_content).data)
+        srz = self.output_serializer_class(
+            updated_content,
+            context=get_like_context(request.user, [updated_content]),
+        )
+        return Response(srz.data)
 
     def delete(self, request, pk):
         content_obj = self.get_object(pk)
@@ -117,7 +149,7 @@ class UpdateDeleteContentAPIView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class SearchContentAPIView(APIView):
+class SearchContentAPIView(PaginatedAPIViewMixin, APIView):
     model = None
     serializer_class = None
 
@@ -129,15 +161,26 @@ class SearchContentAPIView(APIView):
         else:
             return get_contents_by_hashtag(hashtag_name)
 
+    @cache_anonymous_response
     def get(self, request):
         search_query = self.request.GET.get("q", None)
+        self.response_cache_tags = [get_hashtag_version_key(search_query)]
         contents = self.get_queryset(search_query)
+        if contents is None:
+            return Response(status=status.HTTP_204_NO_CONTENT)
 
-        if contents:
-            srz = self.serializer_class(contents, many=True)
-            return Response(srz.data)
+        page = self.paginate_queryset(contents)
+        if not page and self.paginator.cursor_query_param not in request.query_params:
+            return Response(status=status.HTTP_204_NO_CONTENT)
 
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        self.response_cache_tags += {
+            get_owner_version_key(content.owner_id) for content in page
+        }
+
+        srz = self.serializer_class(
+            page, many=True, context=get_like_context(request.user, page)
+        )
+        return self.get_paginated_response(srz.data)
 
 
 # class RecommendContentAPIView(APIView):
@@ -0,0 +1,10 @@
+from datetime import timedelta
+
+# Explore only scores content created inside this window.
+EXPLORE_WINDOW = timedelta(days=7)
+
+TRENDING_WINDOW = timedelta(hours=24)
+TRENDING_RANKING_SIZE = 200
+TRENDING_RANKING_TIMEOUT = 60 * 60 * 2
+
+SEARCH_CACHE_TIMEOUT = 60 * 5
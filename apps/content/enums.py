@@ -0,0 +1,53 @@
+import re
+from enum import Enum
+
+
+class CacheKeyPrefix(Enum):
+    TRENDING = "trending"
+    SEARCH = "search"
+    SEARCH_VERSION = "search_version"
+    SEARCH_STATS = "search_stats"
+    LIKE_OVERLAY = "like_overlay"
+    OWNER_VERSION = "owner_version"
+    LIKER_VERSION = "liker_version"
+    HASHTAG_VERSION = "hashtag_version"
+    CONTENT_ITEM = "content_item"
+    CONTENT_VERSION = "content_version"
+
+    def key(self, suffix: str):
+        return f"{self.value}:{suffix}"
+
+
+SEARCH_TERM_PATTERN = re.compile(r"\w+")
+# Every cached search page depends on it, bulk loads bump it.
+SEARCH_ALL_VERSION_KEY = CacheKeyPrefix.SEARCH_VERSION.key("all")
+
+
+def get_content_item_key(content_id: int) -> str:
+    """Serialized content row, shared by every viewer (no like state)."""
+    return CacheKeyPrefix.CONTENT_ITEM.key(content_id)
+
+
+def get_content_version_key(content_id: int) -> str:
+    """Time of the last write to a content, guards the item cache fills."""
+    return CacheKeyPrefix.CONTENT_VERSION.key(content_id)
+
+
+def get_like_overlay_key(user_id: int, content_id: int) -> str:
+    return CacheKeyPrefix.LIKE_OVERLAY.key(f"{user_id}:{content_id}")
+
+
+def get_search_terms(text: str) -> set[str]:
+    return set(SEARCH_TERM_PATTERN.findall(text.lower()))
+
+
+def get_search_version_keys(terms=(), hashtags=(), content_types=()) -> list[str]:
+    """
+    Version keys of search scopes. Writes bump the scopes of the content they
+    touch, a cached search page depends on the scopes of its query.
+    """
+    return [
+        *(CacheKeyPrefix.SEARCH_VERSION.key(f"term:{term}") for term in terms),
+        *(CacheKeyPrefix.SEARCH_VERSION.key(f"hashtag:{name.lower()}") for name in hashtags),
+        *(CacheKeyPrefix.SEARCH_VERSION.key(f"type:{content_type}") for content_type in content_types),
+    ]
@@ -0,0 +1,122 @@
+import heapq
+import threading
+import time
+from datetime import timedelta
+from bisect import bisect_left, bisect_right, insort
+from django.db import connection
+from core.logger import get_application_logger
+from .models import Hashtag
+
+logger = get_application_logger()
+
+# Pull usage changes from the database at most this often (seconds).
+HASHTAG_INDEX_REFRESH_INTERVAL = 30
+# Rebuild from scratch this often to drop hashtags removed by the sweeper.
+HASHTAG_INDEX_REBUILD_INTERVAL = 60 * 60
+# updated_at is the writer's transaction start time, so re-read a short overlap
+# to catch transactions that committed after our last sync.
+HASHTAG_INDEX_SYNC_OVERLAP = timedelta(minutes=1)
+
+
+class HashtagPrefixIndex:
+    """
+    In-process prefix index over hashtag names.
+
+    Entries are `(lowercased name, name)` pairs kept in a sorted array, so the
+    hashtags of a prefix are one contiguous slice found with two binary
+    searches. Usage counts live in a dict next to it.
+
+    Requests only ever pay for the incremental `refresh`. Full rebuilds run
+    on a background thread, one at a time, while requests keep serving the
+    current index; a new process serves no suggestions until its first
+    build lands.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: list[tuple[str, str]] = []
+        self.usage: dict[str, int] = {}
+        self.built = False
+        self.rebuilding = False
+        self.synced_until = None  # newest Hashtag.updated_at seen
+        self.refreshed_at = 0.0
+        self.rebuilt_at = 0.0
+
+    def rebuild(self) -> None:
+        started_at = time.monotonic()
+        rows = list(Hashtag.objects.values_list("name", "usage_count", "updated_at"))
+        entries = sorted((name.lower(), name) for name, _, _ in rows)
+        usage = {name: usage for name, usage, _ in rows}
+        with self.lock:
+            self.entries, self.usage = entries, usage
+            self.synced_until = max((updated for _, _, updated in rows), default=None)
+            self.refreshed_at = self.rebuilt_at = started_at
+            self.built = True
+
+    def rebuild_in_background(self) -> None:
+        try:
+            self.rebuild()
+        except Exception:
+            logger.exception("Hashtag index rebuild failed")
+        finally:
+            connection.close()  # the thread's own connection
+            with self.lock:
+                self.rebuilding = False
+
+    def refresh(self) -> None:
+        """Apply hashtags created or re-counted since the last sync."""
+        if not self.built:
+            return
+        rows = Hashtag.objects.values_list("name", "usage_count", "updated_at")
+        if self.synced_until is not None:
+            rows = rows.filter(updated_at__gte=self.synced_until - HASHTAG_INDEX_SYNC_OVERLAP)
+        rows = list(rows)
+        with self.lock:
+            for name, usage, updated_at in rows:
+                self._set(name, usage)
+                self.synced_until = max(self.synced_until or updated_at, updated_at)
+
+    def add(self, names) -> None:
+        """Make newly linked hashtags suggestible right away in this process."""
+        with self.lock:
+            for name in names:
+                self._set(name, max(self.usage.get(name, 0), 1))
+
+    def _set(self, name: str, usage: int) -> None:
+        if name not in self.usage:
+            insort(self.entries, (name.lower(), name))
+        self.usage[name] = usage
+
+    def refresh_if_stale(self) -> None:
+        now = time.monotonic()
+        with self.lock:
+            rebuild = not self.rebuilding and now - self.rebuilt_at > HASHTAG_INDEX_REBUILD_INTERVAL
+            refresh = self.built and now - self.refreshed_at > HASHTAG_INDEX_REFRESH_INTERVAL
+            # Claimed under the lock, so concurrent requests do not repeat the work.
+            self.rebuilding = self.rebuilding or rebuild
+            if refresh:
+                self.refreshed_at = now
+
+        if rebuild:
+            threading.Thread(
+                target=self.rebuild_in_background, name="hashtag-index-rebuild", daemon=True
+            ).start()
+        if refresh:
+            self.refresh()
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[tuple[str, int]]:
+        prefix = prefix.lower()
+        with self.lock:
+            start = bisect_left(self.entries, (prefix,))
+            end = bisect_right(self.entries, (prefix + "\uffff",))
+            candidates = (self.entries[i][1] for i in range(start, end))
+            # nlargest is stable, so ties keep alphabetical order.
+            top = heapq.nlargest(
+                limit,
+                (name for name in candidates if self.usage[name] > 0),
+                key=self.usage.__getitem__,
+            )
+            return [(name, self.usage[name]) for name in top]
+
+
+hashtag_index = HashtagPrefixIndex()
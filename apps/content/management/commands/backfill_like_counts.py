@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from apps.content.models import Content
+
+ContentLike = Content.likes.through
+
+
+class Command(BaseCommand):
+    help = "Recompute Content.like_count from the likes table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of content ids updated per statement.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        likes = (
+            ContentLike.objects.filter(content_id=OuterRef("pk"))
+            .order_by()
+            .values("content_id")
+            .annotate(total=Count("*"))
+            .values("total")
+        )
+
+        updated = 0
+        last_id = 0
+        while True:
+            ids = list(
+                Content.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            updated += Content.objects.filter(id__in=ids).update(
+                like_count=Coalesce(Subquery(likes), Value(0))
+            )
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {updated} like counters."))
@@ -0,0 +1,61 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from apps.content.models import Content, MediaContent, Post
+from apps.content.serializers import (
+    ContentOutputSerializer,
+    MediaContentOutputSerializer,
+    PostOutputSerializer,
+)
+
+SERIALIZERS = {
+    "content": (Content, ContentOutputSerializer),
+    "post": (Post, PostOutputSerializer),
+    "media": (MediaContent, MediaContentOutputSerializer),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the model serializers with the values-based fast path on a page "
+        "of existing contents (query and encoding time)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--type", choices=SERIALIZERS, default="content")
+        parser.add_argument("--page-size", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args, **options):
+        model, serializer_class = SERIALIZERS[options["type"]]
+        page_size, repeat = options["page_size"], options["repeat"]
+        context = {}  # the endpoints serialize without a request, urls stay relative
+        queryset = model.objects.order_by("-created_at", "-id")
+
+        def serialize_instances():
+            page = list(queryset.select_related("owner")[:page_size])
+            return serializer_class(page, many=True, context=context).data
+
+        def serialize_rows():
+            rows = queryset.values(*serializer_class.get_row_fields())[:page_size]
+            return serializer_class.rows_to_representation(rows, context)
+
+        expected = [dict(item) for item in serialize_instances()]
+        if not expected:
+            raise CommandError("No contents to serialize, generate some data first.")
+        if serialize_rows() != expected:
+            raise CommandError("The fast path does not match the serializer output.")
+
+        timings = {}
+        for name, serialize in (("serializer", serialize_instances), ("rows", serialize_rows)):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                serialize()
+            timings[name] = (time.perf_counter() - start) / repeat * 1000
+            self.stdout.write(f"{name:<10} {timings[name]:8.2f} ms/page")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(expected)} rows per page, "
+                f"{timings['serializer'] / timings['rows']:.1f}x faster with rows"
+            )
+        )
@@ -0,0 +1,19 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from apps.content.services.upload import clean_stale_media_uploads
+
+
+class Command(BaseCommand):
+    help = "Delete chunked media uploads that were abandoned before completion."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=24,
+            help="Delete uploads that have not received a chunk for this many hours.",
+        )
+
+    def handle(self, *args, **options):
+        deleted = clean_stale_media_uploads(timedelta(hours=options["hours"]))
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} stale uploads."))
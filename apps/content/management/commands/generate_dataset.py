@@ -0,0 +1,42 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from apps.content.services.dataset import USERS_PER_SCALE, DatasetGenerator
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk load a synthetic social graph (users, connections, contents, likes, "
+        "hashtags, comments) for load and capacity testing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1.0,
+            help=f"Size factor, {USERS_PER_SCALE} users per unit; the other tables follow.",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+        parser.add_argument(
+            "--days", type=int, default=30, help="Time window of the generated activity."
+        )
+        parser.add_argument(
+            "--password", default="password", help="Password of every generated user."
+        )
+
+    def handle(self, *args, **options):
+        if options["scale"] <= 0:
+            raise CommandError("--scale must be positive.")
+
+        started = time.monotonic()
+        counts = DatasetGenerator(
+            scale=options["scale"],
+            seed=options["seed"],
+            days=options["days"],
+            password=options["password"],
+        ).run()
+        for name, count in counts.items():
+            self.stdout.write(f"{name:<17} {count}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated the dataset in {time.monotonic() - started:.1f}s.")
+        )
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from apps.account.models import User
+from apps.content.services.timeline import rebuild_timeline, TIMELINE_BACKFILL_LIMIT
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized home timelines from accepted connections."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", help="Only rebuild this user's timeline.")
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=TIMELINE_BACKFILL_LIMIT,
+            help="Recent contents copied per connection.",
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_active=True)
+        if options["username"]:
+            users = users.filter(username=options["username"])
+
+        count = 0
+        for user in users.iterator():
+            rebuild_timeline(user, limit=options["limit"])
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} timelines."))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from apps.content.services.explore import refresh_explore_scores
+
+
+class Command(BaseCommand):
+    help = "Refresh the precomputed explore scores from content changed since the last run."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Recompute every content inside the explore window.",
+        )
+
+    def handle(self, *args, **options):
+        refreshed = refresh_explore_scores(full=options["full"])
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {refreshed} explore scores."))
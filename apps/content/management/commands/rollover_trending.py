@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from apps.content.services.trending import rollover_trending
+
+
+class Command(BaseCommand):
+    help = "Drop expired hourly like buckets and rebuild the cached trending ranking."
+
+    def handle(self, *args, **options):
+        ranking = rollover_trending()
+        self.stdout.write(self.style.SUCCESS(f"Ranked {len(ranking)} trending contents."))
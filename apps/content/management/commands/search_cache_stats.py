@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from apps.content.services.search import get_search_cache_stats, reset_search_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Show the hit rate of the content search result cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the counters after printing them.",
+        )
+
+    def handle(self, *args, **options):
+        stats = get_search_cache_stats()
+        self.stdout.write(
+            f"hits={stats['hits']} misses={stats['misses']} hit_rate={stats['hit_rate']:.2%}"
+        )
+        if options["reset"]:
+            reset_search_cache_stats()
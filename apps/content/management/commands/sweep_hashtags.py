@@ -0,0 +1,19 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from apps.content.services.hashtag import sweep_unused_hashtags
+
+
+class Command(BaseCommand):
+    help = "Delete hashtags that are no longer used by any content."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=24,
+            help="Keep unused hashtags for this many hours before deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        deleted = sweep_unused_hashtags(timedelta(hours=options["grace_hours"]))
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} unused hashtags."))
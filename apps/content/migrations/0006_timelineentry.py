@@ -0,0 +1,30 @@
+# Generated by Django 5.0.8 on 2026-10-18 07:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0005_mediacontent_remove_hashtag_reels_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimelineEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField()),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='content.content')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', '-created_at', '-content'], name='content_tim_user_id_1ed483_idx'), models.Index(fields=['user', 'owner'], name='content_tim_user_id_8e6b76_idx')],
+                'unique_together': {('user', 'content')},
+            },
+        ),
+    ]
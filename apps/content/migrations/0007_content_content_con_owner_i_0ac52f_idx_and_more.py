@@ -0,0 +1,23 @@
+# Generated by Django 5.0.8 on 2026-10-18 07:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0006_timelineentry'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['owner', '-created_at', '-id'], name='content_con_owner_i_0ac52f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['-created_at', '-id'], name='content_con_created_a2e9eb_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.8 on 2026-10-18 07:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0007_content_content_con_owner_i_0ac52f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='like_count',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.8 on 2026-10-18 07:09
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0008_content_like_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExploreScore',
+            fields=[
+                ('content', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='explore_score', serialize=False, to='content.content')),
+                ('like_score', models.PositiveIntegerField(default=0)),
+                ('recency_score', models.PositiveSmallIntegerField(default=0)),
+                ('hashtag_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, size=None)),
+                ('content_created_at', models.DateTimeField(db_index=True)),
+                ('refreshed_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['hashtag_ids'], name='content_exp_hashtag_9b1c80_gin')],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.8 on 2026-10-18 07:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0009_explorescore'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentLikeBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(db_index=True)),
+                ('likes', models.IntegerField(default=0)),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='like_buckets', to='content.content')),
+            ],
+            options={
+                'unique_together': {('content', 'hour')},
+            },
+        ),
+    ]
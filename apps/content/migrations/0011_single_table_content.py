@@ -0,0 +1,107 @@
+# Generated by Django 5.0.8 on 2026-10-18 07:12
+
+from django.db import migrations, models
+
+
+def copy_media_columns(apps, schema_editor):
+    Content = apps.get_model("content", "Content")
+    LegacyMediaContent = apps.get_model("content", "MediaContent")
+    table = Content._meta.db_table
+
+    # One set-based statement instead of an UPDATE per media row.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} AS c "
+            "SET content_type = 'media', media_type = m.legacy_media_type, file = m.legacy_file "
+            f"FROM {LegacyMediaContent._meta.db_table} AS m "
+            "WHERE c.id = m.content_ptr_id"
+        )
+
+
+def restore_child_tables(apps, schema_editor):
+    Content = apps.get_model("content", "Content")
+    LegacyPost = apps.get_model("content", "Post")
+    LegacyMediaContent = apps.get_model("content", "MediaContent")
+    table = Content._meta.db_table
+
+    # Raw inserts: saving a multi-table child through the ORM would rewrite the parent row.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {LegacyPost._meta.db_table} (content_ptr_id) "
+            f"SELECT id FROM {table} WHERE content_type = 'post'"
+        )
+        cursor.execute(
+            f"INSERT INTO {LegacyMediaContent._meta.db_table} "
+            "(content_ptr_id, legacy_media_type, legacy_file) "
+            f"SELECT id, COALESCE(media_type, ''), COALESCE(file, '') FROM {table} "
+            "WHERE content_type = 'media'"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0010_contentlikebucket'),
+    ]
+
+    operations = [
+        # Rename first so the legacy child fields do not clash with the new parent ones.
+        migrations.RenameField(
+            model_name='mediacontent',
+            old_name='media_type',
+            new_name='legacy_media_type',
+        ),
+        migrations.RenameField(
+            model_name='mediacontent',
+            old_name='file',
+            new_name='legacy_file',
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='content_type',
+            field=models.CharField(choices=[('post', 'Post'), ('media', 'Media')], default='post', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='file',
+            field=models.FileField(blank=True, null=True, upload_to='media/content'),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='media_type',
+            field=models.CharField(blank=True, choices=[('video', 'Video'), ('audio', 'Audio')], max_length=10, null=True),
+        ),
+        migrations.RunPython(copy_media_columns, restore_child_tables),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['content_type', '-created_at', '-id'], name='content_con_content_7cb52d_idx'),
+        ),
+        migrations.DeleteModel(
+            name='MediaContent',
+        ),
+        migrations.DeleteModel(
+            name='Post',
+        ),
+        migrations.CreateModel(
+            name='MediaContent',
+            fields=[
+            ],
+            options={
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('content.content',),
+        ),
+        migrations.CreateModel(
+            name='Post',
+            fields=[
+            ],
+            options={
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('content.content',),
+        ),
+    ]
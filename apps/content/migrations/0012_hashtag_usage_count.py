@@ -0,0 +1,39 @@
+# Generated by Django 5.0.8 on 2026-10-18 07:14
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_usage_count(apps, schema_editor):
+    Hashtag = apps.get_model("content", "Hashtag")
+    ContentHashtag = Hashtag.contents.through
+    usage = (
+        ContentHashtag.objects.filter(hashtag_id=OuterRef("pk"))
+        .order_by()
+        .values("hashtag_id")
+        .annotate(total=Count("*"))
+        .values("total")
+    )
+    Hashtag.objects.update(usage_count=Coalesce(Subquery(usage), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0011_single_table_content'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hashtag',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name='hashtag',
+            name='usage_count',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(backfill_usage_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.8 on 2026-10-18 07:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0014_mediaupload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='thumbnail_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.8 on 2026-10-18 07:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0015_content_thumbnail_variants'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['thumbnail'], name='content_thumbnail_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['file'], name='content_file_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
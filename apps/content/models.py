@@ -1,10 +1,27 @@
+import uuid
 from django.db import models
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.exceptions import ValidationError
 from apps.account.models import User
 
 
-class Content(models.Model):  # multi-table inheritance
+class ContentManager(models.Manager):
+    def get_queryset(self):
+        # search_vector is only used inside search queries, never worth fetching.
+        return super().get_queryset().defer("search_vector")
+
+
+class Content(models.Model):  # single table, typed through proxy models
+    CONTENT_TYPE_CHOICES = (("post", "Post"), ("media", "Media"))
+    MEDIA_TYPE_CHOICES = (("video", "Video"), ("audio", "Audio"))
+
+    content_type = models.CharField(
+        max_length=10, choices=CONTENT_TYPE_CHOICES, default="post"
+    )
     thumbnail = models.ImageField(upload_to="content/img", blank=True, null=True)
+    thumbnail_variants = models.JSONField(default=dict, blank=True)  # {format: {width: name}}
     description = models.CharField(max_length=512)
     owner = models.ForeignKey(
         User,
@@ -14,19 +31,76 @@ class Content(models.Model):  # multi-table inheritance
         db_index=True,
     )
     likes = models.ManyToManyField(User, related_name="content_likes", blank=True)
+    like_count = models.PositiveIntegerField(default=0, db_index=True)  # maintained by like services
+    # Media only columns, empty for posts
+    media_type = models.CharField(
+        max_length=10, choices=MEDIA_TYPE_CHOICES, blank=True, null=True
+    )
+    file = models.FileField(upload_to="media/content", blank=True, null=True)
+    search_vector = models.GeneratedField(
+        expression=SearchVector("description", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ContentManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner", "-created_at", "-id"]),
+            models.Index(fields=["-created_at", "-id"]),
+            models.Index(fields=["content_type", "-created_at", "-id"]),
+            # media gateway lookups by storage name (equality and variant prefix)
+            models.Index(
+                fields=["thumbnail"],
+                name="content_thumbnail_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+            models.Index(
+                fields=["file"], name="content_file_idx", opclasses=["varchar_pattern_ops"]
+            ),
+            GinIndex(fields=["search_vector"], name="content_search_vector_idx"),
+            GinIndex(
+                fields=["description"],
+                name="content_description_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
+
+
+class TypedContentManager(ContentManager):
+    """Limit a proxy model to the rows of its own content type."""
+
+    def __init__(self, content_type: str):
+        super().__init__()
+        self.content_type = content_type
+
+    def get_queryset(self):
+        return super().get_queryset().filter(content_type=self.content_type)
+
 
 class Post(Content):
-    pass
+    CONTENT_TYPE = "post"
+
+    objects = TypedContentManager(CONTENT_TYPE)
+
+    class Meta:
+        proxy = True
+
+    def save(self, *args, **kwargs):
+        self.content_type = self.CONTENT_TYPE
+        super().save(*args, **kwargs)
 
 
 class MediaContent(Content):
-    MEDIA_TYPE_CHOICES = (("video", "Video"), ("audio", "Audio"))
+    CONTENT_TYPE = "media"
+
+    objects = TypedContentManager(CONTENT_TYPE)
 
-    media_type = models.CharField(max_length=10, choices=MEDIA_TYPE_CHOICES)
-    file = models.FileField(upload_to="media/content")
+    class Meta:
+        proxy = True
 
     def clean(self):
         if not self.file:
@@ -35,6 +109,7 @@ class MediaContent(Content):
             raise ValidationError("Invalid media type.")
 
     def save(self, *args, **kwargs):
+        self.content_type = self.CONTENT_TYPE
         self.full_clean()  # Need for apply clean logic
         super().save(*args, **kwargs)
 
@@ -42,6 +117,91 @@ class MediaContent(Content):
 class Hashtag(models.Model):
     name = models.CharField(max_length=64, unique=True, db_index=True)
     contents = models.ManyToManyField("Content", related_name="hashtags", blank=True)
+    usage_count = models.PositiveIntegerField(default=0, db_index=True)  # maintained by hashtag services
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.name
+
+
+class TimelineEntry(models.Model):
+    """Materialized home timeline row: `content` shows up in `user`'s feed."""
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="timeline_entries"
+    )
+    content = models.ForeignKey(
+        Content, on_delete=models.CASCADE, related_name="timeline_entries"
+    )
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    created_at = models.DateTimeField()  # copied from content.created_at
+
+    class Meta:
+        unique_together = ["user", "content"]
+        indexes = [
+            models.Index(fields=["user", "-created_at", "-content"]),
+            models.Index(fields=["user", "owner"]),
+        ]
+
+
+class ExploreScore(models.Model):
+    """
+    User independent parts of the explore score of a recent content.
+    Refreshed incrementally by the `refresh_explore_scores` command.
+    """
+
+    content = models.OneToOneField(
+        Content,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="explore_score",
+    )
+    like_score = models.PositiveIntegerField(default=0)
+    recency_score = models.PositiveSmallIntegerField(default=0)
+    hashtag_ids = ArrayField(models.BigIntegerField(), default=list, blank=True)
+    content_created_at = models.DateTimeField(db_index=True)
+    refreshed_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        indexes = [GinIndex(fields=["hashtag_ids"])]
+
+
+class ContentLikeBucket(models.Model):
+    """Net like activity of a content during one hour, used by trending."""
+
+    content = models.ForeignKey(
+        Content, on_delete=models.CASCADE, related_name="like_buckets"
+    )
+    hour = models.DateTimeField(db_index=True)
+    likes = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ["content", "hour"]
+
+
+class MediaUpload(models.Model):
+    """A resumable, chunked upload that becomes a MediaContent once complete."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="media_uploads"
+    )
+    description = models.CharField(max_length=512)
+    media_type = models.CharField(max_length=10, choices=Content.MEDIA_TYPE_CHOICES)
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    received_size = models.BigIntegerField(default=0)
+    part_digests = ArrayField(models.CharField(max_length=64), default=list, blank=True)
+    content = models.OneToOneField(
+        Content,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="upload",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    @property
+    def is_complete(self) -> bool:
+        return self.content_id is not None
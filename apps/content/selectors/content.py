@@ -1,7 +1,5 @@
-from django.db.models import Count
 from apps.account.models import User
-from apps.connect.selectors.connection import list_connections
-from ..models import Post, MediaContent,Content
+from ..models import Post, MediaContent, Content, TimelineEntry
 
 
 def get_post_by_id(post_id: int) -> Post:
@@ -12,27 +10,50 @@ def get_media_content_by_id(mc_id: int) -> MediaContent:
     return MediaContent.objects.select_related('owner').filter(id=mc_id).first()
 
 
-def get_posts_by_owner(username: str) -> Post:
-    return Post.objects.filter(owner__username=username).select_related('owner').prefetch_related('hashtags').annotate(like_count=Count('likes'))
+def get_content_by_owner(username: str) -> list[Content]:
+    contents = Content.objects.filter(owner__username=username).select_related('owner').prefetch_related('hashtags').order_by('-created_at', '-id')
+    return contents
 
-def get_media_content_by_owner(username: str) -> MediaContent:
-    return MediaContent.objects.filter(owner__username=username).select_related('owner').prefetch_related('hashtags').annotate(like_count=Count('likes'))
+
+def get_content_rows_by_owner(model, username: str, fields):
+    """`values()` rows of a user's contents of `model` (Content, Post or MediaContent)."""
+    return (
+        model.objects.filter(owner__username=username)
+        .order_by('-created_at', '-id')
+        .values(*fields)
+    )
 
 
-def get_content_by_owner(username: str) -> list[Content]:
-    contents = Content.objects.filter(owner__username=username).select_related('owner').prefetch_related('hashtags').annotate(like_count=Count('likes'))
-    return contents
+def get_content_rows(content_ids: list[int], fields):
+    return Content.objects.filter(id__in=content_ids).values(*fields)
 
 
-def get_connection_content(user: User):
-    connected_users = list_connections(user)
+def get_timeline_entries(user: User):
     return (
-        Content.objects.filter(owner__in=connected_users)
-        .order_by("-created_at")
+        TimelineEntry.objects.filter(user=user)
+        .only("content_id", "created_at")
+        .order_by("-created_at", "-content_id")
+    )
+
+
+def get_contents_in_order(content_ids: list[int]) -> list[Content]:
+    contents = (
+        Content.objects.filter(id__in=content_ids)
+        .select_related('owner')
+        .prefetch_related('hashtags')
+        .in_bulk()
+    )
+    return [contents[cid] for cid in content_ids if cid in contents]
+
+
+async def aget_contents_in_order(content_ids: list[int]) -> list[Content]:
+    contents = await (
+        Content.objects.filter(id__in=content_ids)
         .select_related('owner')
         .prefetch_related('hashtags')
-        .annotate(like_count=Count('likes'))
+        .ain_bulk()
     )
+    return [contents[cid] for cid in content_ids if cid in contents]
 
 
 def get_contents_by_owner(username: str):
@@ -1,5 +1,6 @@
-from django.db.models import QuerySet,Count
+from django.db.models import QuerySet
 from ..models import Hashtag, Content, Post, MediaContent
+from ..hashtag_index import hashtag_index
 
 
 def get_hashtag_by_name(name: str) -> Hashtag | None:
@@ -13,19 +14,28 @@ def get_posts_by_hashtag(hashtag_name: str) -> QuerySet | None:
             Post.objects.filter(id__in=hashtag.contents.values_list('id', flat=True))
             .select_related('owner')
             .prefetch_related('hashtags')
-            .annotate(like_count=Count('likes'))
+            .order_by('-created_at', '-id')
         )
     return None
 
 def get_media_contents_by_hashtag(hashtag_name: str) -> QuerySet | None:
     hashtag = get_hashtag_by_name(hashtag_name)
     if hashtag:
-        return MediaContent.objects.filter(id__in=hashtag.contents.values_list('id', flat=True)).select_related('owner').prefetch_related('hashtags').annotate(like_count=Count('likes'))
+        return MediaContent.objects.filter(id__in=hashtag.contents.values_list('id', flat=True)).select_related('owner').prefetch_related('hashtags').order_by('-created_at', '-id')
     return None
 
 
 def get_contents_by_hashtag(hashtag_name: str) -> QuerySet | None:
     hashtag = get_hashtag_by_name(hashtag_name)
     if hashtag:
-        return Content.objects.filter(id__in=hashtag.contents.values_list('id', flat=True)).select_related('owner').prefetch_related('hashtags').annotate(like_count=Count('likes'))
+        return Content.objects.filter(id__in=hashtag.contents.values_list('id', flat=True)).select_related('owner').prefetch_related('hashtags').order_by('-created_at', '-id')
     return None
+
+
+def suggest_hashtags(prefix: str, limit: int = 10) -> list[tuple[str, int]]:
+    """Most used hashtags starting with `prefix`, as (name, usage_count) pairs."""
+    prefix = prefix.lstrip("#").strip()
+    if not prefix:
+        return []
+    hashtag_index.refresh_if_stale()
+    return hashtag_index.suggest(prefix, limit)
@@ -0,0 +1,76 @@
+import time
+from django.conf import settings
+from django.core.cache import cache
+from apps.account.models import User
+from ..models import Content
+from ..serializers import ContentOutputSerializer
+from ..enums import get_content_item_key, get_content_version_key
+from .content import get_content_rows
+from .like import get_like_context_for_ids
+
+
+def get_content_items(content_ids: list[int], user: User) -> list[dict]:
+    """
+    Serialized contents in the order of `content_ids`; unknown ids are skipped.
+    Rows are served from the per-object cache and the misses are loaded with
+    a single query. The like state of `user` is applied on top, so cached
+    items can be shared by every viewer.
+    """
+    item_keys = {get_content_item_key(cid): cid for cid in content_ids}
+    version_keys = {get_content_version_key(cid): cid for cid in content_ids}
+    cached = cache.get_many([*item_keys, *version_keys])
+    versions = {cid: cached[key] for key, cid in version_keys.items() if key in cached}
+    # Like `core.response_cache.is_fresh`: an entry built before the last
+    # write to its content is stale, even if it was stored after the write.
+    # Without a version the last write is unknown, so the entry is refilled.
+    entries = {
+        cid: cached[key]
+        for key, cid in item_keys.items()
+        if key in cached and cid in versions and cached[key]["built_at"] > versions[cid]
+    }
+
+    missing = [cid for cid in content_ids if cid not in entries]
+    if missing:
+        # Versions start before the build, so the entries stored below are fresh.
+        started_at = time.time_ns()
+        new_versions = {
+            get_content_version_key(cid): started_at for cid in missing if cid not in versions
+        }
+        if new_versions:
+            cache.set_many(new_versions, None)
+        built_at = time.time_ns()
+        rows = list(get_content_rows(missing, ContentOutputSerializer.get_row_fields()))
+        # Without a viewer, so the items carry no like state or media token.
+        fetched = {
+            row["id"]: {"item": item, "private": row["owner__is_private"], "built_at": built_at}
+            for row, item in zip(rows, ContentOutputSerializer.rows_to_representation(rows))
+        }
+        cache.set_many(
+            {get_content_item_key(cid): entry for cid, entry in fetched.items()},
+            settings.CONTENT_ITEM_CACHE_TIMEOUT,
+        )
+        entries.update(fetched)
+
+    content_ids = [cid for cid in content_ids if cid in entries]
+    context = get_like_context_for_ids(user, content_ids)
+    liked_ids = context.get("liked_ids", ())
+    like_count_deltas = context.get("like_count_deltas", {})
+    items = []
+    for cid in content_ids:
+        item = entries[cid]["item"]
+        item = {
+            **item,
+            "count_likes": item["count_likes"] + like_count_deltas.get(cid, 0),
+            "liked_by_me": cid in liked_ids,
+        }
+        if entries[cid]["private"]:
+            ContentOutputSerializer.add_media_token(item, context.get("media_token"))
+        items.append(item)
+    return items
+
+
+def content_exists(content_id: int) -> bool:
+    """Answered from the item cache when it holds the content, else by primary key."""
+    if cache.get(get_content_item_key(content_id)) is not None:
+        return True
+    return Content.objects.filter(id=content_id).exists()
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.core.cache import cache
+from apps.account.models import User
+from ..enums import get_like_overlay_key
+from ..models import Content
+from .media import get_media_access_token
+
+ContentLike = Content.likes.through
+
+
+def get_like_context(user: User, contents) -> dict:
+    """
+    Serializer context with the acting user's like state for a page of
+    contents, resolved with a single query on the likes table. Intents still
+    sitting in the write-behind buffer are applied on top, so the user sees
+    their own likes and counts right away. It also carries the user's media
+    access token for the file urls of private owners.
+    """
+    return get_like_context_for_ids(user, [content.id for content in contents])
+
+
+def get_like_context_for_ids(user: User, content_ids: list[int]) -> dict:
+    if not user.is_authenticated or not content_ids:
+        return {}
+
+    liked_ids = set(
+        ContentLike.objects.filter(
+            user_id=user.id, content_id__in=content_ids
+        ).values_list("content_id", flat=True)
+    )
+    like_count_deltas = {}
+    if settings.CONTENT_LIKE_WRITE_BEHIND:
+        for content_id, liked in get_pending_like_intents(user.id, content_ids).items():
+            if liked != (content_id in liked_ids):
+                like_count_deltas[content_id] = 1 if liked else -1
+                liked_ids ^= {content_id}
+    return {
+        "liked_ids": liked_ids,
+        "like_count_deltas": like_count_deltas,
+        "media_token": get_media_access_token(user),
+    }
+
+
+def get_pending_like_intents(user_id: int, content_ids) -> dict[int, bool]:
+    """Buffered intents of a user that may not be in the likes table yet."""
+    keys = {get_like_overlay_key(user_id, cid): cid for cid in content_ids}
+    return {keys[key]: liked for key, liked in cache.get_many(keys).items()}
@@ -0,0 +1,104 @@
+import posixpath
+import re
+import time
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core import signing
+from django.db.models import Q
+from apps.account.models import User
+from apps.connect.selectors.connection import user_connected_to
+from ..models import Content
+
+# Avatars are listed next to usernames everywhere, so they stay public.
+PUBLIC_MEDIA_PREFIXES = ("img/profile/",)
+VARIANT_NAME_RE = re.compile(r"^(?P<original>.+)\.\d+w\.(webp|jpg)$")
+MEDIA_ACCESS_SALT = "content.media-access"
+
+
+def normalize_media_name(name: str) -> str | None:
+    """Storage name of a requested media path, or None if it leaves MEDIA_ROOT."""
+    normalized = posixpath.normpath(name)
+    if normalized.startswith(("/", "..")) or normalized != name:
+        return None
+    return normalized
+
+
+def get_content_by_media_name(name: str) -> Content | None:
+    """The content whose file, thumbnail or thumbnail variant is stored as `name`."""
+    lookup = Q(file=name) | Q(thumbnail=name)
+    variant = VARIANT_NAME_RE.match(name)
+    if variant:
+        lookup |= Q(thumbnail=variant["original"])
+
+    contents = (
+        Content.objects.filter(lookup)
+        .select_related("owner")
+        .only("file", "thumbnail", "thumbnail_variants", "owner__is_private")
+    )
+    for content in contents:
+        if name in (content.file.name, content.thumbnail.name):
+            return content
+        if any(name in names.values() for names in content.thumbnail_variants.values()):
+            return content
+    return None
+
+
+def can_view_media_file(user: User, name: str) -> bool:
+    """
+    Same visibility rules as profiles: files of private owners are only
+    served to the owner and their connections. Unknown files are never served.
+    """
+    if name.startswith(PUBLIC_MEDIA_PREFIXES):
+        return True
+
+    content = get_content_by_media_name(name)
+    if content is None:
+        return False
+
+    owner = content.owner
+    if owner is None or not owner.is_private:
+        return True
+    if not user.is_authenticated:
+        return False
+    return user.id == owner.id or user_connected_to(user, owner)
+
+
+def get_media_access_window() -> int:
+    """
+    Start (unix seconds) of the current token window. Tokens are issued for
+    the window, so a viewer's token, and the pages carrying it, change once
+    per half token lifetime instead of on every request.
+    """
+    window = max(settings.MEDIA_ACCESS_TOKEN_MAX_AGE // 2, 1)
+    return int(time.time()) // window * window
+
+
+class MediaAccessSigner(signing.TimestampSigner):
+    def __init__(self):
+        super().__init__(salt=MEDIA_ACCESS_SALT)
+
+    def timestamp(self):
+        return signing.b62_encode(get_media_access_window())
+
+
+def get_media_access_token(user: User) -> str | None:
+    """
+    Short-lived signed credential of `user` for media urls. It only stands
+    in for the Authorization header; the gateway still applies the
+    visibility rules to the user it names. It stays valid for at least half
+    of MEDIA_ACCESS_TOKEN_MAX_AGE after it is handed out.
+    """
+    if not user.is_authenticated:
+        return None
+    return MediaAccessSigner().sign(str(user.id))
+
+
+def get_media_access_user(token: str):
+    """The active user a media access token was issued to, or an anonymous user."""
+    try:
+        user_id = MediaAccessSigner().unsign(
+            token, max_age=settings.MEDIA_ACCESS_TOKEN_MAX_AGE
+        )
+    except signing.BadSignature:  # also expired tokens
+        return AnonymousUser()
+    return User.objects.filter(id=user_id, is_active=True).first() or AnonymousUser()
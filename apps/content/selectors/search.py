@@ -1,7 +1,24 @@
+import hashlib
+import json
+import time
 from typing import Optional
-from django.db.models import QuerySet,Count
-from django.contrib.postgres.search import TrigramSimilarity
-from apps.content.models import Content, Post, MediaContent
+from django.core.cache import cache
+from django.db.models import QuerySet, FloatField, Q, F
+from django.db.models.functions import Cast, Greatest
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from apps.content.models import Content, Post, MediaContent, Hashtag
+from ..constants import SEARCH_CACHE_TIMEOUT
+from core.conditional import get_versions
+from core.response_cache import is_fresh
+from ..enums import (
+    CacheKeyPrefix,
+    SEARCH_ALL_VERSION_KEY,
+    get_search_terms,
+    get_search_version_keys,
+)
+from .content import get_contents_in_order
+
+ContentHashtag = Hashtag.contents.through
 
 
 def search_contents(query: Optional[str] = None, content_type: Optional[str] = None, hashtag: Optional[str] = None) -> QuerySet:
@@ -13,11 +30,97 @@ def search_contents(query: Optional[str] = None, content_type: Optional[str] = N
         qs = Content.objects.all()
 
     if hashtag:
-        qs = qs.filter(hashtags__name__iexact=hashtag)
+        # Resolve the tag first so scoring only runs on its contents.
+        hashtag_ids = list(Hashtag.objects.filter(name__iexact=hashtag).values_list("id", flat=True))
+        if not hashtag_ids:
+            return qs.none().order_by("-created_at", "-id")
+        qs = qs.filter(id__in=ContentHashtag.objects.filter(hashtag_id__in=hashtag_ids).values("content_id"))
 
     if query:
-        qs = qs.annotate(similarity=TrigramSimilarity("description", query))\
-               .filter(similarity__gt=0.11)\
-               .order_by("-similarity")
+        search_query = SearchQuery(query, config="simple", search_type="websearch")
+        # Both operators are served by GIN indexes (`@@` on search_vector, `%` on description).
+        # Cast the reals returned by postgres to double so cursor values round-trip exactly.
+        qs = qs.filter(Q(search_vector=search_query) | Q(description__trigram_similar=query))\
+               .annotate(rank=Cast(Greatest(SearchRank(F("search_vector"), search_query), TrigramSimilarity("description", query)), FloatField()))\
+               .order_by("-rank", "-id")
+    else:
+        qs = qs.order_by("-created_at", "-id")
+
+    return qs.select_related('owner').prefetch_related('hashtags')
+
+
+def search_contents_page(paginator, request, query: Optional[str] = None, content_type: Optional[str] = None, hashtag: Optional[str] = None) -> list[Content]:
+    """
+    One page of `search_contents`, served from the ranked id lists cached per
+    normalized (q, type, hashtag, cursor, limit). Entries are tagged with the
+    search scopes of their query and dropped once a write bumps one of them.
+    """
+    params = normalize_search_params(
+        query=query,
+        content_type=content_type,
+        hashtag=hashtag,
+        cursor=request.query_params.get(paginator.cursor_query_param),
+        limit=paginator.get_page_size(request),
+    )
+    key = get_search_cache_key(params)
+    entry = cache.get(key)
+    hit = entry is not None and is_fresh(entry)
+    record_search_cache_lookup(hit=hit)
+    if hit:
+        paginator.restore_page(request, entry["next_position"])
+        return get_contents_in_order(entry["ids"])
+
+    tags = get_search_tags(params)
+    get_versions(tags)  # start missing counters before the build
+    built_at = time.time_ns()
+    page = paginator.paginate_queryset(
+        search_contents(query=query, content_type=content_type, hashtag=hashtag), request
+    )
+    entry = {
+        "ids": [content.id for content in page],
+        "next_position": paginator.next_position,
+        "tags": tags,
+        "built_at": built_at,
+    }
+    cache.set(key, entry, SEARCH_CACHE_TIMEOUT)
+    return page
+
+
+def normalize_search_params(query, content_type, hashtag, cursor, limit) -> dict:
+    return {
+        "q": " ".join((query or "").lower().split()),
+        "type": content_type if content_type in ("post", "media") else None,
+        "hashtag": (hashtag or "").lower() or None,
+        "cursor": cursor or None,
+        "limit": limit,
+    }
+
+
+def get_search_tags(params: dict) -> list[str]:
+    """
+    Search scopes a page depends on. A hashtag filter only sees the contents
+    tagged with it; a text query only sees contents sharing one of its
+    words, except for trigram-only matches which wait for the entry timeout;
+    a plain listing sees every content of its type.
+    """
+    terms = get_search_terms(params["q"])
+    if params["hashtag"]:
+        scopes = get_search_version_keys(hashtags=[params["hashtag"]])
+    elif terms:
+        scopes = get_search_version_keys(terms=terms)
+    else:
+        scopes = get_search_version_keys(
+            content_types=[params["type"]] if params["type"] else ["post", "media"]
+        )
+    return [SEARCH_ALL_VERSION_KEY, *scopes]
+
+
+def get_search_cache_key(params: dict) -> str:
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    return CacheKeyPrefix.SEARCH.key(digest)
+
 
-    return qs.select_related('owner').prefetch_related('hashtags').annotate(like_count=Count('likes'))
\ No newline at end of file
+def record_search_cache_lookup(hit: bool) -> None:
+    key = CacheKeyPrefix.SEARCH_STATS.key("hits" if hit else "misses")
+    if not cache.add(key, 1, None):
+        cache.incr(key)
@@ -0,0 +1,52 @@
+from datetime import datetime
+from django.core.cache import cache
+from django.db.models import Sum
+from django.utils import timezone
+from ..constants import TRENDING_WINDOW, TRENDING_RANKING_SIZE, TRENDING_RANKING_TIMEOUT
+from ..enums import CacheKeyPrefix
+from ..models import ContentLikeBucket
+from .item import get_content_items
+
+
+def get_bucket_hour(at: datetime | None = None) -> datetime:
+    at = at or timezone.now()
+    return at.replace(minute=0, second=0, microsecond=0)
+
+
+def rank_trending_content(now: datetime | None = None) -> list[int]:
+    """
+    Ids of the TRENDING_RANKING_SIZE contents with the most likes inside the
+    sliding window. Contents of private or inactive owners are left out, the
+    ranking is shared by every viewer.
+    """
+    window_start = get_bucket_hour(now) - TRENDING_WINDOW
+    return list(
+        ContentLikeBucket.objects.filter(
+            hour__gt=window_start,
+            content__owner__is_active=True,
+            content__owner__is_private=False,
+        )
+        .values("content_id")
+        .annotate(score=Sum("likes"))
+        .filter(score__gt=0)
+        .order_by("-score", "-content_id")
+        .values_list("content_id", flat=True)[:TRENDING_RANKING_SIZE]
+    )
+
+
+def get_trending_ranking() -> list[int]:
+    key = CacheKeyPrefix.TRENDING.key("ranking")
+    ranking = cache.get(key)
+    if ranking is None:
+        ranking = rank_trending_content()
+        cache.set(key, ranking, TRENDING_RANKING_TIMEOUT)
+    return ranking
+
+
+def trending_content(user, limit: int = 20) -> list[dict]:
+    """
+    Serialized top contents by likes received inside the trending window,
+    highest score first. Reads the cached ranking and the per-object item
+    cache, so the cost follows `limit` and not the size of the window.
+    """
+    return get_content_items(get_trending_ranking()[:limit], user)
@@ -1,6 +1,24 @@
 import os
+from urllib.parse import urlencode
 from rest_framework import serializers
-from .models import Post, MediaContent, Content
+from django.conf import settings
+from django.core.files.storage import default_storage
+from core.images import get_variant_urls
+from .models import Post, MediaContent, Content, MediaUpload
+
+# Query parameter of the media access token, read by MediaGatewayAPIView.
+MEDIA_ACCESS_PARAM = "access"
+
+MEDIA_EXTENSIONS = {
+    "video": [".mp4", ".mkv", ".avi", ".mov"],
+    "audio": [".mp3", ".wav", ".aac", ".ogg"],
+}
+
+
+def validate_media_extension(filename: str, media_type: str):
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in MEDIA_EXTENSIONS[media_type]:
+        raise serializers.ValidationError({"file": f"File extension {ext} is not valid for {media_type}."})
 
 
 class ContentOutputSerializer(serializers.ModelSerializer):
@@ -12,17 +30,90 @@ class ContentOutputSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        if isinstance(instance, Post) or hasattr(instance, "post"):
-            data["content_type"] = "post"
-        elif isinstance(instance, MediaContent) or hasattr(instance, "mediacontent"):
-            data["content_type"] = "media"
-        else:
-            data["content_type"] = "unknown"
-        data["count_likes"] = getattr(instance, "like_count", instance.likes.count())
+        data["content_type"] = instance.content_type
+        data["thumbnail_variants"] = get_variant_urls(
+            instance.thumbnail_variants, self.context.get("request")
+        )
+        data["count_likes"] = instance.like_count + self.context.get(
+            "like_count_deltas", {}
+        ).get(instance.id, 0)
+        data["liked_by_me"] = instance.id in self.context.get("liked_ids", ())
         data["created_at"] = instance.created_at.timestamp()
+        if instance.owner is not None and instance.owner.is_private:
+            self.add_media_token(data, self.context.get("media_token"))
 
         return data
 
+    @staticmethod
+    def add_media_token(item: dict, token: str | None) -> dict:
+        """
+        Append the viewer's media access token to the file urls of an item.
+        Browsers load them from <img>/<video> tags without the Authorization
+        header, so private owners' files need the token to pass the gateway.
+        """
+        if not token:
+            return item
+        query = "?" + urlencode({MEDIA_ACCESS_PARAM: token})
+        for name in ("thumbnail", "file"):
+            if item.get(name):
+                item[name] += query
+        item["thumbnail_variants"] = {
+            fmt: {width: url + query for width, url in urls.items()}
+            for fmt, urls in item["thumbnail_variants"].items()
+        }
+        return item
+
+    # Fast path for large pages: rows from `QuerySet.values(*get_row_fields())`
+    # encoded straight to the same shape, without model instances or fields.
+
+    row_sources = {"user": "owner__username"}
+    file_fields = ("thumbnail", "file")
+
+    @classmethod
+    def get_row_fields(cls) -> tuple:
+        """Columns read by `rows_to_representation`, for `QuerySet.values()`."""
+        return tuple(cls.row_sources.get(name, name) for name in cls.Meta.fields) + (
+            "content_type",
+            "thumbnail_variants",
+            "like_count",
+            "created_at",
+            "owner__is_private",
+        )
+
+    @classmethod
+    def rows_to_representation(cls, rows, context: dict = None) -> list[dict]:
+        context = context or {}
+        request = context.get("request")
+        liked_ids = context.get("liked_ids", ())
+        like_count_deltas = context.get("like_count_deltas", {})
+        media_token = context.get("media_token")
+
+        def file_url(name):
+            if not name:
+                return None
+            url = default_storage.url(name)
+            return request.build_absolute_uri(url) if request else url
+
+        fields = [
+            (name, cls.row_sources.get(name, name), name in cls.file_fields)
+            for name in cls.Meta.fields
+        ]
+        data = []
+        for row in rows:
+            item = {
+                name: file_url(row[source]) if is_file else row[source]
+                for name, source, is_file in fields
+            }
+            item["content_type"] = row["content_type"]
+            item["thumbnail_variants"] = get_variant_urls(row["thumbnail_variants"], request)
+            item["count_likes"] = row["like_count"] + like_count_deltas.get(row["id"], 0)
+            item["liked_by_me"] = row["id"] in liked_ids
+            item["created_at"] = row["created_at"].timestamp()
+            if row["owner__is_private"]:
+                cls.add_media_token(item, media_token)
+            data.append(item)
+        return data
+
 
 class PostOutputSerializer(ContentOutputSerializer):
     class Meta:
@@ -72,16 +163,47 @@ class MediaContentInputSerializer(ContentInputSerializer):
         if media_type not in valid_media_types:
             raise serializers.ValidationError({"media_type": "Invalid media_type. Must be 'video' or 'audio'."})
 
-        ext = os.path.splitext(file.name)[1].lower()
-        video_exts = [".mp4", ".mkv", ".avi", ".mov"]
-        audio_exts = [".mp3", ".wav", ".aac", ".ogg"]
+        validate_media_extension(file.name, media_type)
+        return attrs
+    
+class MediaUploadInputSerializer(serializers.ModelSerializer):
+    """
+    Start a chunked media upload
+    """
+    size = serializers.IntegerField(min_value=1, max_value=settings.MEDIA_UPLOAD_MAX_SIZE)
 
-        if media_type == "video" and ext not in video_exts:
-            raise serializers.ValidationError({"file": f"File extension {ext} is not valid for video."})
-        if media_type == "audio" and ext not in audio_exts:
-            raise serializers.ValidationError({"file": f"File extension {ext} is not valid for audio."})
+    class Meta:
+        model = MediaUpload
+        fields = ("description", "media_type", "filename", "size")
 
+    def validate(self, attrs):
+        validate_media_extension(attrs["filename"], attrs["media_type"])
         return attrs
-    
+
+
+class MediaUploadCompleteInputSerializer(serializers.Serializer):
+    """
+    Finish a chunked media upload
+    """
+    thumbnail = serializers.ImageField(required=False)
+
+
+class MediaUploadOutputSerializer(serializers.ModelSerializer):
+    offset = serializers.IntegerField(source="received_size")
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = MediaUpload
+        fields = ("id", "filename", "media_type", "size", "offset", "chunk_size")
+
+    def get_chunk_size(self, obj) -> int:
+        return settings.MEDIA_UPLOAD_CHUNK_SIZE
+
+
 class ContentUpdateInputSerializer(serializers.Serializer):
     description = serializers.CharField(max_length=512)
+
+
+class HashtagSuggestionOutputSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    usage_count = serializers.IntegerField()
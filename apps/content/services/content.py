@@ -1,7 +1,17 @@
 from apps.account.models import User
 from django.core.exceptions import ValidationError
+from core.images import schedule_image_variants
 from ..models import Post, MediaContent, Content
 from .hashtag import link_hashtags_to_content, unlink_hashtags_from_content
+from .item import invalidate_content_items
+from .search import bump_search_versions
+from .timeline import fan_out_content, remove_content_from_timelines
+from .version import bump_owner_version
+
+
+def on_variants_stored(content: Content) -> None:
+    bump_owner_version(content.owner_id)
+    invalidate_content_items(content.id)
 
 
 def create_post(owner: User, description: str, thumbnail=None) -> Post:
@@ -9,13 +19,27 @@ def create_post(owner: User, description: str, thumbnail=None) -> Post:
         owner=owner, description=description, thumbnail=thumbnail
     )
     link_hashtags_to_content(post)
+    fan_out_content(post)
+    schedule_image_variants(
+        post,
+        "thumbnail",
+        "thumbnail_variants",
+        on_stored=lambda: on_variants_stored(post),
+    )
+    bump_search_versions("post", description)
+    bump_owner_version(owner.id)
 
     return post
 
 
 def delete_post(post: Post) -> None:
     unlink_hashtags_from_content(post)
+    remove_content_from_timelines(post)
+    content_id = post.id
     post.delete()
+    bump_search_versions("post", post.description)
+    bump_owner_version(post.owner_id)
+    invalidate_content_items(content_id)
 
 
 def create_media_content(
@@ -33,6 +57,15 @@ def create_media_content(
             thumbnail=thumbnail,
         )
         link_hashtags_to_content(media_content)
+        fan_out_content(media_content)
+        schedule_image_variants(
+            media_content,
+            "thumbnail",
+            "thumbnail_variants",
+            on_stored=lambda: on_variants_stored(media_content),
+        )
+        bump_search_versions("media", description)
+        bump_owner_version(owner.id)
         return True, media_content
     except ValidationError as e:
         return False, e
@@ -40,14 +73,22 @@ def create_media_content(
 
 def delete_media_content(media_content: MediaContent) -> None:
     unlink_hashtags_from_content(media_content)
+    remove_content_from_timelines(media_content)
+    content_id = media_content.id
     media_content.delete()
+    bump_search_versions("media", media_content.description)
+    bump_owner_version(media_content.owner_id)
+    invalidate_content_items(content_id)
 
 
 def update_content(content: Content, description: str = None) -> Content:
     if description:
-        unlink_hashtags_from_content(content)
+        previous_description = content.description
         content.description = description
-        link_hashtags_to_content(content)
         content.save()
+        link_hashtags_to_content(content)
+        bump_search_versions(content.content_type, previous_description, description)
+        bump_owner_version(content.owner_id)
+        invalidate_content_items(content.id)
 
     return content
@@ -0,0 +1,374 @@
+import random
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from itertools import accumulate
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+from apps.account.models import User
+from apps.comment.models import Comment
+from apps.connect.models import Connection
+from ..models import Content, Hashtag, TimelineEntry
+from .explore import refresh_explore_scores
+from .search import invalidate_search_cache
+from .timeline import TIMELINE_BACKFILL_LIMIT
+
+# Rows per unit of scale; every other table follows the number of users.
+USERS_PER_SCALE = 10_000
+MEAN_CONNECTIONS = 20  # per user
+MEAN_CONTENTS = 8  # per user
+MEAN_LIKES = 30  # per user
+MEAN_COMMENTS = 2  # per content
+MEAN_COMMENT_LIKES = 1  # per comment
+HASHTAGS_PER_USER = 0.05
+ACCEPTED_RATIO = 0.85
+PRIVATE_RATIO = 0.1
+MEDIA_RATIO = 0.1
+REPLY_RATIO = 0.3
+HASHTAG_ZIPF_EXPONENT = 1.07
+
+WORDS = (
+    "morning coffee city trip sunset beach friends music concert book movie "
+    "game code python django food dinner weekend run bike photo art design "
+    "study work home garden cat dog rain snow summer winter night party"
+).split()
+
+
+class CopyStream:
+    """File-like object feeding generated rows to `COPY ... FROM STDIN`."""
+
+    def __init__(self, rows):
+        self.lines = ("\t".join(map(format_copy_value, row)) + "\n" for row in rows)
+        self.pending = ""
+
+    def read(self, size=-1):
+        chunks, length = [self.pending], len(self.pending)
+        for line in self.lines:
+            chunks.append(line)
+            length += len(line)
+            if 0 <= size <= length:
+                break
+        data = "".join(chunks)
+        if size < 0:
+            self.pending = ""
+            return data
+        self.pending = data[size:]
+        return data[:size]
+
+
+def format_copy_value(value) -> str:
+    # Generated text never contains tabs, newlines or backslashes.
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def copy_rows(cursor, model, columns, rows) -> None:
+    cursor.copy_expert(
+        f"COPY {model._meta.db_table} ({', '.join(columns)}) FROM STDIN",
+        CopyStream(rows),
+    )
+
+
+def get_next_id(cursor, model) -> int:
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {model._meta.db_table}")
+    return cursor.fetchone()[0]
+
+
+def reset_sequence(cursor, model) -> None:
+    table = model._meta.db_table
+    cursor.execute(
+        f"SELECT setval(pg_get_serial_sequence(%s, 'id'), COALESCE(MAX(id), 1)) FROM {table}",
+        [table],
+    )
+
+
+class WeightedSampler:
+    """Draws indexes with probability proportional to their weight."""
+
+    def __init__(self, rng: random.Random, weights):
+        self.rng = rng
+        self.cum_weights = list(accumulate(weights))
+        self.total = self.cum_weights[-1]
+
+    def __call__(self) -> int:
+        return bisect_left(self.cum_weights, self.rng.random() * self.total)
+
+
+class DatasetGenerator:
+    """
+    Synthetic social graph for load and capacity tests, bulk loaded with COPY:
+    users with power-law activity and connection degrees, contents tagged
+    from a Zipf distributed hashtag vocabulary, skewed likes, and comment
+    threads with replies. Derived tables (timelines, explore scores) are
+    rebuilt set-based at the end. The same seed and scale give the same data.
+    """
+
+    def __init__(self, scale: float = 1.0, seed: int = 0, days: int = 30, password: str = "password"):
+        self.rng = random.Random(seed)
+        self.now = timezone.now()
+        self.days = days
+        self.password = make_password(password, salt="dataset")
+        self.user_count = max(int(USERS_PER_SCALE * scale), 10)
+        self.counts = {}
+
+    def random_time(self, start: datetime, end: datetime) -> datetime:
+        return start + (end - start) * self.rng.random()
+
+    def run(self) -> dict[str, int]:
+        with transaction.atomic(), connection.cursor() as cursor:
+            self.generate_users(cursor)
+            self.generate_connections(cursor)
+            self.generate_hashtags(cursor)
+            self.generate_contents(cursor)
+            self.generate_comments(cursor)
+            for model in (User, Connection, Content, Hashtag, Comment):
+                reset_sequence(cursor, model)
+            self.build_timelines(cursor)
+            for model in (User, Connection, Content, Hashtag, Comment, TimelineEntry):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+            invalidate_search_cache()
+        self.counts["explore scores"] = refresh_explore_scores(full=True)
+        return self.counts
+
+    def generate_users(self, cursor) -> None:
+        self.first_user_id = get_next_id(cursor, User)
+        self.user_ids = range(self.first_user_id, self.first_user_id + self.user_count)
+        # Heavy-tailed activity drives posting, liking and connecting.
+        self.activity = [self.rng.paretovariate(1.5) for _ in self.user_ids]
+        self.pick_user = WeightedSampler(self.rng, self.activity)
+        joined_from = self.now - timedelta(days=self.days * 2)
+        joined_to = self.now - timedelta(days=self.days)
+
+        rows = (
+            (
+                user_id,
+                self.password,
+                False,
+                f"load_{user_id}",
+                f"Load User {user_id}",
+                self.rng.random() < PRIVATE_RATIO,
+                True,
+                False,
+                self.random_time(joined_from, joined_to),
+                "{}",
+                False,
+            )
+            for user_id in self.user_ids
+        )
+        copy_rows(
+            cursor,
+            User,
+            (
+                "id", "password", "is_superuser", "username", "full_name", "is_private",
+                "is_active", "is_admin", "joined_at", "picture_variants", "is_2fa_enabled",
+            ),
+            rows,
+        )
+        self.counts["users"] = self.user_count
+
+    def generate_connections(self, cursor) -> None:
+        target = self.user_count * MEAN_CONNECTIONS // 2
+        pairs = set()
+        for _ in range(target * 2):  # bounded retries for duplicates
+            if len(pairs) >= target:
+                break
+            first, second = self.pick_user(), self.pick_user()
+            if first != second:
+                pairs.add((min(first, second), max(first, second)))
+
+        start = self.now - timedelta(days=self.days)
+        rows = []
+        for first, second in sorted(pairs):
+            if self.rng.random() < 0.5:
+                first, second = second, first
+            rows.append(
+                (
+                    self.user_ids[first],
+                    self.user_ids[second],
+                    self.rng.random() < ACCEPTED_RATIO,
+                    self.random_time(start, self.now),
+                )
+            )
+        copy_rows(cursor, Connection, ("requester_id", "receiver_id", "is_accept", "created_at"), rows)
+        self.counts["connections"] = len(rows)
+
+    def generate_hashtags(self, cursor) -> None:
+        taken = set(Hashtag.objects.values_list("name", flat=True))
+        size = max(int(self.user_count * HASHTAGS_PER_USER), len(WORDS))
+        self.hashtag_names = []
+        index = 0
+        while len(self.hashtag_names) < size:
+            word = WORDS[index % len(WORDS)]
+            name = word if index < len(WORDS) else f"{word}{index // len(WORDS)}"
+            if name not in taken:
+                self.hashtag_names.append(name)
+            index += 1
+        self.first_hashtag_id = get_next_id(cursor, Hashtag)
+        self.pick_hashtag = WeightedSampler(
+            self.rng,
+            [1 / rank**HASHTAG_ZIPF_EXPONENT for rank in range(1, size + 1)],
+        )
+
+    def generate_contents(self, cursor) -> None:
+        self.first_content_id = get_next_id(cursor, Content)
+        start = self.now - timedelta(days=self.days)
+        mean_activity = sum(self.activity) / len(self.activity)
+
+        owners, created, tags = [], [], []
+        for user_index, activity in enumerate(self.activity):
+            for _ in range(round(MEAN_CONTENTS * activity / mean_activity * self.rng.random() * 2)):
+                owners.append(user_index)
+                created.append(self.random_time(start, self.now))
+                tags.append({self.pick_hashtag() for _ in range(self.rng.randint(0, 3))})
+        self.content_owners, self.content_created = owners, created
+
+        # Likes: active users like popular contents (Pareto popularity).
+        self.popularity = [self.rng.paretovariate(1.2) for _ in owners]
+        self.pick_content = WeightedSampler(self.rng, self.popularity)
+        likes = set()
+        for _ in range(self.user_count * MEAN_LIKES):
+            likes.add((self.pick_user(), self.pick_content()))
+        like_counts = [0] * len(owners)
+        for _, content_index in likes:
+            like_counts[content_index] += 1
+
+        def content_rows():
+            for index, owner in enumerate(owners):
+                words = " ".join(self.rng.choices(WORDS, k=self.rng.randint(3, 12)))
+                hashtags = " ".join(f"#{self.hashtag_names[tag]}" for tag in tags[index])
+                is_media = self.rng.random() < MEDIA_RATIO
+                content_id = self.first_content_id + index
+                yield (
+                    content_id,
+                    "media" if is_media else "post",
+                    "{}",
+                    f"{words} {hashtags}".strip(),
+                    self.user_ids[owner],
+                    like_counts[index],
+                    self.rng.choice(("video", "audio")) if is_media else None,
+                    f"media/content/load_{content_id}.mp4" if is_media else None,
+                    created[index],
+                    created[index],
+                )
+
+        copy_rows(
+            cursor,
+            Content,
+            (
+                "id", "content_type", "thumbnail_variants", "description", "owner_id",
+                "like_count", "media_type", "file", "created_at", "updated_at",
+            ),
+            content_rows(),
+        )
+        copy_rows(
+            cursor,
+            Content.likes.through,
+            ("user_id", "content_id"),
+            (
+                (self.user_ids[user], self.first_content_id + content)
+                for user, content in likes
+            ),
+        )
+
+        usage = [0] * len(self.hashtag_names)
+        for content_tags in tags:
+            for tag in content_tags:
+                usage[tag] += 1
+        used = [tag for tag, count in enumerate(usage) if count]
+        copy_rows(
+            cursor,
+            Hashtag,
+            ("id", "name", "usage_count", "updated_at"),
+            (
+                (self.first_hashtag_id + tag, self.hashtag_names[tag], usage[tag], self.now)
+                for tag in used
+            ),
+        )
+        copy_rows(
+            cursor,
+            Hashtag.contents.through,
+            ("hashtag_id", "content_id"),
+            (
+                (self.first_hashtag_id + tag, self.first_content_id + index)
+                for index, content_tags in enumerate(tags)
+                for tag in content_tags
+            ),
+        )
+        self.counts["contents"] = len(owners)
+        self.counts["likes"] = len(likes)
+        self.counts["hashtags"] = len(used)
+
+    def generate_comments(self, cursor) -> None:
+        if not self.content_owners:
+            return
+        first_comment_id = get_next_id(cursor, Comment)
+        threads = {}  # content index -> [(comment id, created_at)], for replies
+        rows = []
+        for offset in range(len(self.content_owners) * MEAN_COMMENTS):
+            content_index = self.pick_content()
+            comment_id = first_comment_id + offset
+            thread = threads.setdefault(content_index, [])
+            reply_id, after = None, self.content_created[content_index]
+            if thread and self.rng.random() < REPLY_RATIO:
+                reply_id, after = self.rng.choice(thread)
+            created_at = self.random_time(after, min(after + timedelta(days=2), self.now))
+            thread.append((comment_id, created_at))
+            rows.append(
+                (
+                    comment_id,
+                    self.first_content_id + content_index,
+                    self.user_ids[self.pick_user()],
+                    reply_id,
+                    " ".join(self.rng.choices(WORDS, k=self.rng.randint(2, 10))),
+                    created_at,
+                )
+            )
+        copy_rows(cursor, Comment, ("id", "content_id", "user_id", "reply_id", "text", "created_at"), rows)
+
+        comment_likes = {
+            (self.pick_user(), self.rng.randrange(len(rows)))
+            for _ in range(len(rows) * MEAN_COMMENT_LIKES)
+        }
+        copy_rows(
+            cursor,
+            Comment.likes.through,
+            ("user_id", "comment_id"),
+            (
+                (self.user_ids[user], first_comment_id + comment)
+                for user, comment in comment_likes
+            ),
+        )
+        self.counts["comments"] = len(rows)
+        self.counts["comment likes"] = len(comment_likes)
+
+    def build_timelines(self, cursor) -> None:
+        """Set-based `rebuild_timeline` of every generated user."""
+        cursor.execute(
+            f"""
+            INSERT INTO {TimelineEntry._meta.db_table} (user_id, content_id, owner_id, created_at)
+            SELECT peers.user_id, recent.id, recent.owner_id, recent.created_at
+            FROM (
+                SELECT requester_id AS user_id, receiver_id AS peer_id
+                FROM {Connection._meta.db_table}
+                WHERE is_accept AND requester_id >= %(first)s
+                UNION ALL
+                SELECT receiver_id, requester_id
+                FROM {Connection._meta.db_table}
+                WHERE is_accept AND requester_id >= %(first)s
+            ) peers
+            CROSS JOIN LATERAL (
+                SELECT id, owner_id, created_at
+                FROM {Content._meta.db_table}
+                WHERE owner_id = peers.peer_id
+                ORDER BY created_at DESC
+                LIMIT %(limit)s
+            ) recent
+            """,
+            {"first": self.first_user_id, "limit": TIMELINE_BACKFILL_LIMIT},
+        )
+        self.counts["timeline entries"] = cursor.rowcount
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import F, Max, Q
+from django.utils import timezone
+from ..constants import EXPLORE_WINDOW
+from ..models import Content, ExploreScore
+
+LIKE_WEIGHT = 2
+# (max age, score) pairs from the freshest bucket to the oldest one.
+RECENCY_BUCKETS = ((timedelta(days=1), 15), (timedelta(days=3), 8))
+RECENCY_DEFAULT = 3
+REFRESH_BATCH_SIZE = 1000
+
+
+def get_recency_score(created_at: datetime, now: datetime) -> int:
+    for max_age, score in RECENCY_BUCKETS:
+        if created_at >= now - max_age:
+            return score
+    return RECENCY_DEFAULT
+
+
+def get_changed_contents(window_start: datetime, full: bool = False):
+    contents = Content.objects.filter(created_at__gte=window_start)
+    if full:
+        return contents
+
+    last_run = ExploreScore.objects.aggregate(last=Max("refreshed_at"))["last"]
+    if last_run is None:
+        return contents
+
+    return contents.filter(
+        Q(updated_at__gte=last_run)
+        | Q(explore_score__isnull=True)
+        | ~Q(explore_score__like_score=F("like_count") * LIKE_WEIGHT)
+    )
+
+
+def age_recency_scores(now: datetime) -> None:
+    """Move rows whose content crossed a recency bucket boundary since the last run."""
+    fresher_scores = []
+    for max_age, score in RECENCY_BUCKETS:
+        fresher_scores.append(score)
+        ExploreScore.objects.filter(
+            content_created_at__lt=now - max_age, recency_score__in=fresher_scores
+        ).update(recency_score=_next_bucket_score(score))
+
+
+def _next_bucket_score(score: int) -> int:
+    scores = [bucket_score for _, bucket_score in RECENCY_BUCKETS] + [RECENCY_DEFAULT]
+    return scores[scores.index(score) + 1]
+
+
+def refresh_explore_scores(full: bool = False, now: datetime | None = None) -> int:
+    """
+    Upsert the precomputed score parts of content created inside the explore
+    window that changed since the previous run, age the recency buckets and
+    drop content that left the window. Returns the number of upserted rows.
+    """
+    now = now or timezone.now()
+    window_start = now - EXPLORE_WINDOW
+
+    ExploreScore.objects.filter(content_created_at__lt=window_start).delete()
+    age_recency_scores(now)
+
+    changed = (
+        get_changed_contents(window_start, full=full)
+        .order_by()
+        .values("id", "like_count", "created_at")
+        .annotate(
+            tag_ids=ArrayAgg(
+                "hashtags__id", distinct=True, filter=Q(hashtags__isnull=False)
+            )
+        )
+    )
+    scores = [
+        ExploreScore(
+            content_id=row["id"],
+            like_score=row["like_count"] * LIKE_WEIGHT,
+            recency_score=get_recency_score(row["created_at"], now),
+            hashtag_ids=row["tag_ids"] or [],
+            content_created_at=row["created_at"],
+            refreshed_at=now,
+        )
+        for row in changed
+    ]
+    ExploreScore.objects.bulk_create(
+        scores,
+        batch_size=REFRESH_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["content"],
+        update_fields=["like_score", "recency_score", "hashtag_ids", "refreshed_at"],
+    )
+    return len(scores)
@@ -1,36 +1,104 @@
 import re
-from django.db.utils import DataError
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Now
+from django.utils import timezone
 from core import logger
 from ..models import Hashtag, Content
+from ..hashtag_index import hashtag_index
+from .version import bump_hashtag_version
 
 HASHTAG_PATTERN = r"#(\w+)"
+HASHTAG_MAX_LENGTH = Hashtag._meta.get_field("name").max_length
+
+ContentHashtag = Hashtag.contents.through
 
 
 def extract_hashtags(description: str) -> list[str]:
     return re.findall(HASHTAG_PATTERN, description)
 
 
-def link_hashtags_to_content(content_instance: Content):
-    hashtags_in_description = extract_hashtags(content_instance.description)
-
-    for hashtag_name in hashtags_in_description:
-        try:
-            hashtag, _ = Hashtag.objects.get_or_create(name=hashtag_name)
-            hashtag.contents.add(content_instance)
-        except DataError:
-            logger.warning(f"Hashtag too long: {hashtag_name}")
+def get_valid_hashtags(names) -> set[str]:
+    valid = set()
+    for name in names:
+        if len(name) > HASHTAG_MAX_LENGTH:
+            logger.warning(f"Hashtag too long: {name}")
             continue
+        valid.add(name)
+    return valid
+
+
+def sync_content_hashtags(content_instance: Content, names) -> None:
+    """
+    Make the hashtags of a content match `names` using a constant number of
+    queries: missing hashtags are upserted in bulk, then only the through rows
+    that differ are inserted or deleted. Usage counters follow the diff;
+    unused hashtags are left for `sweep_unused_hashtags`.
+    """
+    names = get_valid_hashtags(names)
+    current = dict(
+        ContentHashtag.objects.filter(content_id=content_instance.id).values_list(
+            "hashtag__name", "hashtag_id"
+        )
+    )
+    to_add = names - current.keys()
+    removed_names = current.keys() - names
+    to_remove = [current[name] for name in removed_names]
+    if not to_add and not to_remove:
+        return
+
+    with transaction.atomic():
+        if to_add:
+            Hashtag.objects.bulk_create(
+                [Hashtag(name=name) for name in to_add], ignore_conflicts=True
+            )
+            added = Hashtag.objects.filter(name__in=to_add)
+            # Row locks taken here keep the sweeper off the tags we are reusing.
+            added.update(usage_count=F("usage_count") + 1, updated_at=Now())
+            hashtag_ids = added.values_list("id", flat=True)
+            ContentHashtag.objects.bulk_create(
+                [
+                    ContentHashtag(content_id=content_instance.id, hashtag_id=hashtag_id)
+                    for hashtag_id in hashtag_ids
+                ],
+                ignore_conflicts=True,
+            )
+
+        if to_remove:
+            ContentHashtag.objects.filter(
+                content_id=content_instance.id, hashtag_id__in=to_remove
+            ).delete()
+            Hashtag.objects.filter(id__in=to_remove).update(
+                usage_count=F("usage_count") - 1, updated_at=Now()
+            )
+        if to_add:
+            transaction.on_commit(lambda: hashtag_index.add(to_add))
+        bump_hashtag_version(*to_add, *removed_names)
+
+
+def link_hashtags_to_content(content_instance: Content):
+    sync_content_hashtags(
+        content_instance, extract_hashtags(content_instance.description)
+    )
 
 
 def unlink_hashtags_from_content(content_instance: Content):
-    hashtags_in_description = extract_hashtags(content_instance.description)
-    for hashtag_name in hashtags_in_description:
-        hashtag = Hashtag.objects.filter(name=hashtag_name).first()
-        if not hashtag:
-            logger.warning(f"Hashtag '{hashtag_name}' referenced but not found.")
-            continue
+    sync_content_hashtags(content_instance, [])
 
-        hashtag.contents.remove(content_instance)
 
-        if not hashtag.contents.exists():
-            hashtag.delete()
+def sweep_unused_hashtags(grace: timedelta, batch_size: int = 1000) -> int:
+    """Delete hashtags that have been unused for longer than `grace`."""
+    cutoff = timezone.now() - grace
+    deleted = 0
+    while True:
+        ids = list(
+            Hashtag.objects.filter(
+                usage_count=0, updated_at__lt=cutoff, contents__isnull=True
+            ).values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        # Re-check the counter in the delete itself in case a tag got reused meanwhile.
+        _, counts = Hashtag.objects.filter(id__in=ids, usage_count=0).delete()
+        deleted += counts.get(Hashtag._meta.label, 0)
@@ -0,0 +1,16 @@
+from django.core.cache import cache
+from django.db import transaction
+from core.conditional import bump_versions
+from ..enums import get_content_item_key, get_content_version_key
+
+
+def invalidate_content_items(*content_ids) -> None:
+    """
+    Drop the cached items once the surrounding transaction commits. The
+    version bump also rejects items that a concurrent fill read before the
+    commit and stores after it.
+    """
+    keys = [get_content_item_key(content_id) for content_id in content_ids]
+    if keys:
+        bump_versions(get_content_version_key(content_id) for content_id in content_ids)
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -1,15 +1,159 @@
+from collections import Counter
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from apps.account.models import User
+from core.write_behind import WriteBehindBuffer
+from ..enums import get_like_overlay_key
 from ..models import Content
+from ..selectors.item import content_exists
+from .item import invalidate_content_items
+from .trending import record_like_activity
+from .version import bump_liker_version, bump_owner_version
+
+ContentLike = Content.likes.through
 
 
 def like_content(user: User, content_id: int):
+    if settings.CONTENT_LIKE_WRITE_BEHIND:
+        return buffer_like_intent(user, content_id, liked=True)
+
     content = get_object_or_404(Content, id=content_id)
-    content.likes.add(user)
+    with transaction.atomic():
+        _, created = ContentLike.objects.get_or_create(
+            content_id=content.id, user_id=user.id
+        )
+        if created:
+            Content.objects.filter(id=content.id).update(
+                like_count=F("like_count") + 1
+            )
+            record_like_activity({content.id: 1})
+            bump_owner_version(content.owner_id)
+            bump_liker_version(user.id)
+            invalidate_content_items(content.id)
     return content
 
 
 def unlike_content(user: User, content_id: int):
+    if settings.CONTENT_LIKE_WRITE_BEHIND:
+        return buffer_like_intent(user, content_id, liked=False)
+
     content = get_object_or_404(Content, id=content_id)
-    content.likes.remove(user)
-    return content
\ No newline at end of file
+    with transaction.atomic():
+        deleted, _ = ContentLike.objects.filter(
+            content_id=content.id, user_id=user.id
+        ).delete()
+        if deleted:
+            Content.objects.filter(id=content.id).update(
+                like_count=F("like_count") - 1
+            )
+            record_like_activity({content.id: -1})
+            bump_owner_version(content.owner_id)
+            bump_liker_version(user.id)
+            invalidate_content_items(content.id)
+    return content
+
+
+def get_like_overlay_timeout() -> float:
+    # Must outlive the slowest flush so reads never fall back to stale rows.
+    return max(settings.CONTENT_LIKE_FLUSH_INTERVAL * 30, 60)
+
+
+def buffer_like_intent(user: User, content_id, liked: bool) -> None:
+    """
+    Queue a like/unlike without writing to the database. The latest intent is
+    also written to the shared cache so every worker reads it back for the
+    acting user until it has been flushed. Missing contents get a 404 like
+    the direct path; the check is usually served by the item cache.
+    """
+    try:
+        content_id = int(content_id)
+    except (TypeError, ValueError):
+        raise Http404
+    if content_id <= 0 or not content_exists(content_id):
+        raise Http404
+
+    cache.set(
+        get_like_overlay_key(user.id, content_id), liked, get_like_overlay_timeout()
+    )
+    bump_liker_version(user.id)  # the overlay already changed liked_by_me
+    like_buffer.add((user.id, content_id), liked)
+
+
+def apply_like_intents(intents: dict[tuple[int, int], bool]) -> dict[int, int]:
+    """
+    Apply coalesced `(user_id, content_id) -> liked` intents in bulk.
+    Intents on missing content are dropped. Only rows that actually changed
+    move the like counters and trending buckets. Returns the applied deltas.
+    """
+    likes = [key for key, liked in intents.items() if liked]
+    unlikes = [key for key, liked in intents.items() if not liked]
+    like_table = ContentLike._meta.db_table
+    content_table = Content._meta.db_table
+    user_table = User._meta.db_table
+
+    deltas = Counter()
+    with transaction.atomic(), connection.cursor() as cursor:
+        if likes:
+            cursor.execute(
+                f"""
+                INSERT INTO {like_table} (user_id, content_id)
+                SELECT v.user_id, v.content_id
+                FROM unnest(%s::bigint[], %s::bigint[]) AS v(user_id, content_id)
+                JOIN {content_table} c ON c.id = v.content_id
+                JOIN {user_table} u ON u.id = v.user_id
+                ON CONFLICT DO NOTHING
+                RETURNING content_id
+                """,
+                [[user_id for user_id, _ in likes], [cid for _, cid in likes]],
+            )
+            deltas.update(content_id for (content_id,) in cursor.fetchall())
+
+        if unlikes:
+            cursor.execute(
+                f"""
+                DELETE FROM {like_table} l
+                USING unnest(%s::bigint[], %s::bigint[]) AS v(user_id, content_id)
+                WHERE l.user_id = v.user_id AND l.content_id = v.content_id
+                RETURNING l.content_id
+                """,
+                [[user_id for user_id, _ in unlikes], [cid for _, cid in unlikes]],
+            )
+            deltas.subtract(content_id for (content_id,) in cursor.fetchall())
+
+        deltas = {cid: delta for cid, delta in deltas.items() if delta}
+        if deltas:
+            cursor.execute(
+                f"""
+                UPDATE {content_table} c SET like_count = c.like_count + v.delta
+                FROM unnest(%s::bigint[], %s::int[]) AS v(id, delta)
+                WHERE c.id = v.id
+                RETURNING c.owner_id
+                """,
+                [list(deltas), list(deltas.values())],
+            )
+            bump_owner_version(*{owner_id for (owner_id,) in cursor.fetchall()})
+            invalidate_content_items(*deltas)
+            record_like_activity(deltas)
+    return deltas
+
+
+def flush_like_intents(intents: dict[tuple[int, int], bool]) -> dict[int, int]:
+    """
+    Flush callback of `like_buffer`. The shared overlay holds the latest
+    intent across all workers, so it wins over this process's copy.
+    """
+    keys = {get_like_overlay_key(*key): key for key in intents}
+    for overlay_key, liked in cache.get_many(keys).items():
+        intents[keys[overlay_key]] = liked
+    return apply_like_intents(intents)
+
+
+like_buffer = WriteBehindBuffer(
+    flush_like_intents,
+    interval=settings.CONTENT_LIKE_FLUSH_INTERVAL,
+    name="content-like-buffer",
+)
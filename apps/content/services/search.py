@@ -0,0 +1,48 @@
+from django.core.cache import cache
+from core.conditional import bump_versions
+from ..enums import (
+    CacheKeyPrefix,
+    SEARCH_ALL_VERSION_KEY,
+    get_search_terms,
+    get_search_version_keys,
+)
+from .hashtag import extract_hashtags
+
+
+def bump_search_versions(content_type: str, *descriptions) -> None:
+    """
+    Invalidate the cached search pages a content write can change: queries
+    sharing a word with its old or new description, the hashtags it was or
+    is tagged with, and the unfiltered listings of its type. Pages of other
+    queries stay cached.
+    """
+    descriptions = [description or "" for description in descriptions]
+    bump_versions(
+        get_search_version_keys(
+            terms=set().union(*map(get_search_terms, descriptions)),
+            hashtags={name for description in descriptions for name in extract_hashtags(description)},
+            content_types=[content_type],
+        )
+    )
+
+
+def invalidate_search_cache() -> None:
+    """Invalidate every cached search page, after bulk loads."""
+    bump_versions([SEARCH_ALL_VERSION_KEY])
+
+
+def get_search_cache_stats() -> dict:
+    hits = cache.get(CacheKeyPrefix.SEARCH_STATS.key("hits"), 0)
+    misses = cache.get(CacheKeyPrefix.SEARCH_STATS.key("misses"), 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+    }
+
+
+def reset_search_cache_stats() -> None:
+    cache.delete_many(
+        [CacheKeyPrefix.SEARCH_STATS.key("hits"), CacheKeyPrefix.SEARCH_STATS.key("misses")]
+    )
@@ -0,0 +1,73 @@
+from apps.account.models import User
+from apps.connect.selectors.connection import list_connection_ids
+from ..models import Content, TimelineEntry
+
+# How many recent contents of a peer are copied into a timeline when a
+# connection is (re)established or a timeline is rebuilt.
+TIMELINE_BACKFILL_LIMIT = 200
+TIMELINE_BATCH_SIZE = 1000
+
+
+def fan_out_content(content: Content) -> None:
+    """Push a freshly created content into the timelines of its owner's connections."""
+    if content.owner_id is None:
+        return
+
+    peer_ids = list_connection_ids(content.owner)
+    TimelineEntry.objects.bulk_create(
+        [
+            TimelineEntry(
+                user_id=peer_id,
+                content_id=content.pk,
+                owner_id=content.owner_id,
+                created_at=content.created_at,
+            )
+            for peer_id in peer_ids
+        ],
+        batch_size=TIMELINE_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+def remove_content_from_timelines(content: Content) -> None:
+    TimelineEntry.objects.filter(content_id=content.pk).delete()
+
+
+def backfill_timeline(user: User, owner: User, limit: int = TIMELINE_BACKFILL_LIMIT):
+    """Copy the latest contents of `owner` into `user`'s timeline."""
+    recent = (
+        Content.objects.filter(owner=owner)
+        .order_by("-created_at")
+        .values_list("id", "created_at")[:limit]
+    )
+    TimelineEntry.objects.bulk_create(
+        [
+            TimelineEntry(
+                user_id=user.pk,
+                content_id=content_id,
+                owner_id=owner.pk,
+                created_at=created_at,
+            )
+            for content_id, created_at in recent
+        ],
+        batch_size=TIMELINE_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+def connect_timelines(user1: User, user2: User) -> None:
+    """Called once a connection between two users is accepted."""
+    backfill_timeline(user1, user2)
+    backfill_timeline(user2, user1)
+
+
+def disconnect_timelines(user1: User, user2: User) -> None:
+    """Called once a connection between two users is removed."""
+    TimelineEntry.objects.filter(user=user1, owner=user2).delete()
+    TimelineEntry.objects.filter(user=user2, owner=user1).delete()
+
+
+def rebuild_timeline(user: User, limit: int = TIMELINE_BACKFILL_LIMIT) -> None:
+    TimelineEntry.objects.filter(user=user).delete()
+    for peer in User.objects.filter(id__in=list_connection_ids(user)):
+        backfill_timeline(user, peer, limit=limit)
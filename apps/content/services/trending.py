@@ -0,0 +1,45 @@
+from datetime import datetime
+from django.core.cache import cache
+from django.db import connection
+from ..constants import TRENDING_WINDOW, TRENDING_RANKING_TIMEOUT
+from ..enums import CacheKeyPrefix
+from ..models import ContentLikeBucket
+from ..selectors.trending import get_bucket_hour, rank_trending_content
+
+
+def record_like_activity(deltas: dict[int, int], at: datetime | None = None) -> None:
+    """
+    Add like deltas (content id -> +n/-n) to the current hourly buckets.
+    An unlike is charged to the current hour because likes carry no timestamp.
+    """
+    hour = get_bucket_hour(at)
+    rows = [(content_id, hour, delta) for content_id, delta in deltas.items() if delta]
+    if not rows:
+        return
+
+    table = ContentLikeBucket._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"""
+            INSERT INTO {table} (content_id, hour, likes) VALUES (%s, %s, %s)
+            ON CONFLICT (content_id, hour)
+            DO UPDATE SET likes = {table}.likes + EXCLUDED.likes
+            """,
+            rows,
+        )
+
+
+def build_trending_ranking(now: datetime | None = None) -> list[int]:
+    """Rank content by likes inside the sliding window and cache the top ids."""
+    ranking = rank_trending_content(now)
+    cache.set(
+        CacheKeyPrefix.TRENDING.key("ranking"), ranking, TRENDING_RANKING_TIMEOUT
+    )
+    return ranking
+
+
+def rollover_trending(now: datetime | None = None) -> list[int]:
+    """Drop buckets that slid out of the window and rebuild the cached ranking."""
+    window_start = get_bucket_hour(now) - TRENDING_WINDOW
+    ContentLikeBucket.objects.filter(hour__lte=window_start).delete()
+    return build_trending_ranking(now)
@@ -0,0 +1,148 @@
+import hashlib
+import os
+from datetime import timedelta
+from django.conf import settings
+from django.core.files import File
+from django.db import OperationalError, transaction
+from django.utils import timezone
+from apps.account.models import User
+from ..models import MediaUpload
+from .content import create_media_content
+
+STREAM_BLOCK_SIZE = 64 * 1024
+
+
+class ErrorMessages:
+    already_completed = "Upload is already completed"
+    offset_mismatch = "Upload-Offset does not match the received size"
+    chunk_too_large = "Chunk is larger than the allowed chunk size"
+    size_exceeded = "Chunk goes past the declared upload size"
+    checksum_mismatch = "Chunk checksum does not match"
+    incomplete = "Upload is not complete yet"
+    busy = "Another chunk of this upload is being written"
+
+
+class ChunkedUploadFile(File):
+    """Assembled upload; exposing its path lets the storage move it instead of copying."""
+
+    def __init__(self, file, name, path):
+        super().__init__(file, name)
+        self.path = path
+
+    def temporary_file_path(self):
+        return self.path
+
+
+def get_upload_path(upload: MediaUpload) -> str:
+    return os.path.join(settings.MEDIA_UPLOAD_TEMP_ROOT, str(upload.id))
+
+
+def get_upload_checksum(upload: MediaUpload) -> str:
+    """S3 style multipart checksum: sha256 of the part digests plus the part count."""
+    digest = hashlib.sha256(b"".join(bytes.fromhex(d) for d in upload.part_digests))
+    return f"{digest.hexdigest()}-{len(upload.part_digests)}"
+
+
+def initiate_media_upload(
+    owner: User, description: str, media_type: str, filename: str, size: int
+) -> MediaUpload:
+    upload = MediaUpload.objects.create(
+        owner=owner,
+        description=description,
+        media_type=media_type,
+        filename=os.path.basename(filename),
+        size=size,
+    )
+    os.makedirs(settings.MEDIA_UPLOAD_TEMP_ROOT, exist_ok=True)
+    open(get_upload_path(upload), "wb").close()
+    return upload
+
+
+def write_media_upload_chunk(
+    upload: MediaUpload, offset: int, stream, length: int, checksum: str = None
+) -> tuple[bool, str | MediaUpload]:
+    """
+    Stream one chunk from `stream` to the upload file at `offset`, hashing it
+    on the fly. The upload row stays locked while the chunk is written so two
+    requests can never write the same upload at once.
+    """
+    if length > settings.MEDIA_UPLOAD_CHUNK_SIZE:
+        return False, ErrorMessages.chunk_too_large
+
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                upload = MediaUpload.objects.select_for_update(nowait=True).get(pk=upload.pk)
+        except OperationalError:
+            return False, ErrorMessages.busy
+        if upload.is_complete:
+            return False, ErrorMessages.already_completed
+        if offset != upload.received_size:
+            return False, ErrorMessages.offset_mismatch
+        if offset + length > upload.size:
+            return False, ErrorMessages.size_exceeded
+
+        digest = hashlib.sha256()
+        written = 0
+        with open(get_upload_path(upload), "r+b") as file:
+            file.seek(offset)
+            while written < length:
+                block = stream.read(min(STREAM_BLOCK_SIZE, length - written))
+                if not block:
+                    break
+                file.write(block)
+                digest.update(block)
+                written += len(block)
+            # Drop anything past the accepted data, e.g. a rejected or cut chunk.
+            if checksum and checksum.lower() != digest.hexdigest():
+                file.truncate(offset)
+                return False, ErrorMessages.checksum_mismatch
+            file.truncate(offset + written)
+
+        if written:
+            upload.received_size = offset + written
+            upload.part_digests.append(digest.hexdigest())
+            upload.save(update_fields=["received_size", "part_digests", "updated_at"])
+        return True, upload
+
+
+def complete_media_upload(upload: MediaUpload, thumbnail=None):
+    """Turn a fully received upload into a MediaContent."""
+    with transaction.atomic():
+        upload = MediaUpload.objects.select_for_update().get(pk=upload.pk)
+        if upload.is_complete:
+            return False, ErrorMessages.already_completed
+        if upload.received_size != upload.size:
+            return False, ErrorMessages.incomplete
+
+        path = get_upload_path(upload)
+        with open(path, "rb") as file:
+            created, result = create_media_content(
+                owner=upload.owner,
+                description=upload.description,
+                file=ChunkedUploadFile(file, upload.filename, path),
+                media_type=upload.media_type,
+                thumbnail=thumbnail,
+            )
+        if not created:
+            return False, result
+
+        upload.content = result
+        upload.save(update_fields=["content", "updated_at"])
+        return True, result
+
+
+def clean_stale_media_uploads(max_age: timedelta) -> int:
+    """Delete unfinished uploads that have not received a chunk for `max_age`."""
+    stale = MediaUpload.objects.filter(
+        content__isnull=True, updated_at__lt=timezone.now() - max_age
+    )
+    deleted = 0
+    for upload in stale.iterator():
+        try:
+            os.remove(get_upload_path(upload))
+        except FileNotFoundError:
+            pass
+        upload.delete()
+        deleted += 1
+    return deleted
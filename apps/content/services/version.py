@@ -0,0 +1,29 @@
+from core.conditional import bump_versions
+from ..enums import CacheKeyPrefix
+
+
+def get_owner_version_key(user_id: int) -> str:
+    """Changes whenever a user's profile or the contents they own change."""
+    return CacheKeyPrefix.OWNER_VERSION.key(user_id)
+
+
+def get_liker_version_key(user_id: int) -> str:
+    """Changes whenever a user likes or unlikes something (their liked_by_me flags)."""
+    return CacheKeyPrefix.LIKER_VERSION.key(user_id)
+
+
+def get_hashtag_version_key(name: str) -> str:
+    """Changes whenever a content is tagged with or untagged from the hashtag."""
+    return CacheKeyPrefix.HASHTAG_VERSION.key(name)
+
+
+def bump_owner_version(*user_ids) -> None:
+    bump_versions(get_owner_version_key(user_id) for user_id in user_ids if user_id)
+
+
+def bump_liker_version(user_id: int) -> None:
+    bump_versions([get_liker_version_key(user_id)])
+
+
+def bump_hashtag_version(*names) -> None:
+    bump_versions(get_hashtag_version_key(name) for name in names)
@@ -0,0 +1,36 @@
+from django.core.files.base import ContentFile
+from django.test import TestCase
+from apps.account.models import User
+from ...models import Content, Post, MediaContent
+from ...serializers import ContentOutputSerializer
+
+
+class ContentModelTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create(username="owner")
+        self.post = Post.objects.create(owner=self.owner, description="post")
+        self.media = MediaContent.objects.create(
+            owner=self.owner,
+            description="media",
+            media_type="audio",
+            file=ContentFile(b"data", name="song.mp3"),
+        )
+
+    def tearDown(self):
+        self.media.file.delete(save=False)
+
+    def test_proxies_share_one_table(self):
+        self.assertEqual(self.post.content_type, "post")
+        self.assertEqual(self.media.content_type, "media")
+        self.assertEqual(list(Post.objects.values_list("id", flat=True)), [self.post.id])
+        self.assertEqual(
+            list(MediaContent.objects.values_list("id", flat=True)), [self.media.id]
+        )
+        self.assertEqual(Content.objects.count(), 2)
+
+    def test_mixed_listing_resolves_type_without_extra_queries(self):
+        contents = list(Content.objects.select_related("owner").order_by("id"))
+        with self.assertNumQueries(0):
+            data = ContentOutputSerializer(contents, many=True).data
+
+        self.assertEqual([item["content_type"] for item in data], ["post", "media"])
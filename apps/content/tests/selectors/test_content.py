@@ -0,0 +1,56 @@
+from django.test import TestCase
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from apps.account.models import User
+from core.pagination import KeysetPagination
+from ...models import Post
+from ...selectors.content import get_content_by_owner
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.owner = User.objects.create(username="owner")
+        self.posts = [
+            Post.objects.create(owner=self.owner, description=f"post {i}")
+            for i in range(5)
+        ]
+        # Force identical timestamps so ordering falls back to the id tiebreaker.
+        Post.objects.filter(id__in=[p.id for p in self.posts[1:3]]).update(
+            created_at=self.posts[1].created_at
+        )
+
+    def paginate(self, params):
+        request = Request(self.factory.get("/", params))
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(get_content_by_owner("owner"), request)
+        return page, paginator
+
+    def test_walk_all_pages_without_duplicates(self):
+        seen = []
+        params = {"limit": 2}
+        while True:
+            page, paginator = self.paginate(params)
+            seen.extend(content.id for content in page)
+            if paginator.next_position is None:
+                break
+            params = {
+                "limit": 2,
+                "cursor": paginator.encode_cursor(paginator.next_position),
+            }
+
+        expected = list(
+            get_content_by_owner("owner").values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+        self.assertEqual(len(seen), 5)
+
+    def test_page_size_is_bounded(self):
+        page, paginator = self.paginate({"limit": 10_000})
+        self.assertEqual(paginator.page_size, KeysetPagination.max_page_size)
+        self.assertEqual(len(page), 5)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(NotFound):
+            self.paginate({"cursor": "not-a-cursor"})
@@ -0,0 +1,69 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.account.models import User
+from ...models import Content, MediaContent, Post
+from ...selectors.content import get_content_rows_by_owner
+from ...serializers import (
+    ContentOutputSerializer,
+    MediaContentOutputSerializer,
+    PostOutputSerializer,
+)
+
+
+class ContentRowsTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create(username="owner")
+        self.post = Post.objects.create(
+            owner=self.owner,
+            description="post",
+            thumbnail="content/img/a.png",
+            thumbnail_variants={"webp": {"80": "content/img/a.png.80w.webp"}},
+            like_count=3,
+        )
+        self.media = MediaContent.objects.create(
+            owner=self.owner,
+            description="media",
+            media_type="audio",
+            file="media/content/a.mp3",
+        )
+        self.context = {
+            "request": RequestFactory().get("/"),
+            "liked_ids": {self.post.id},
+            "like_count_deltas": {self.post.id: 1},
+        }
+
+    def test_rows_match_the_serializers(self):
+        for model, serializer_class in (
+            (Content, ContentOutputSerializer),
+            (Post, PostOutputSerializer),
+            (MediaContent, MediaContentOutputSerializer),
+        ):
+            with self.subTest(model=model.__name__):
+                contents = model.objects.filter(owner=self.owner).order_by("-created_at", "-id")
+                expected = serializer_class(contents, many=True, context=self.context).data
+                with self.assertNumQueries(1):
+                    rows = get_content_rows_by_owner(
+                        model, "owner", serializer_class.get_row_fields()
+                    )
+                    data = serializer_class.rows_to_representation(rows, self.context)
+                self.assertEqual(data, [dict(item) for item in expected])
+                self.assertEqual(
+                    [list(item) for item in data], [list(item) for item in expected]
+                )
+
+    def test_list_endpoints_keep_relative_urls(self):
+        cache.clear()
+        for url in (
+            reverse("api:content:user-content", args=["owner"]),
+            reverse("api:content:content-items") + f"?ids={self.post.id},{self.media.id}",
+        ):
+            with self.subTest(url=url):
+                data = APIClient().get(url).json()
+                items = data["results"] if "results" in data else data
+                self.assertEqual(
+                    {item["thumbnail"] for item in items if item["thumbnail"]},
+                    {"/media/content/img/a.png"},
+                )
+                self.assertTrue(all(item.get("file", "/").startswith("/") for item in items))
@@ -0,0 +1,55 @@
+import threading
+import time
+from unittest import mock
+from django.test import TestCase
+from apps.account.models import User
+from ...models import Post
+from ...selectors.hashtag import suggest_hashtags
+from ...services.content import create_post, delete_post
+from ...hashtag_index import hashtag_index, HASHTAG_INDEX_REBUILD_INTERVAL
+
+
+class SuggestHashtagsTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create(username="owner")
+        create_post(self.owner, "#python #pytest #Pandas")
+        create_post(self.owner, "#python #pandas")
+        create_post(self.owner, "#python #ruby")
+        hashtag_index.rebuild()
+
+    def test_prefix_ranked_by_usage(self):
+        self.assertEqual(
+            suggest_hashtags("#py"), [("python", 3), ("pytest", 1)]
+        )
+        self.assertEqual(suggest_hashtags("PA"), [("Pandas", 1), ("pandas", 1)])
+        self.assertEqual(suggest_hashtags("py", limit=1), [("python", 3)])
+        self.assertEqual(suggest_hashtags(""), [])
+
+    def test_incremental_refresh(self):
+        post = create_post(self.owner, "#pyramid")
+        delete_post(Post.objects.get(description="#python #ruby"))
+        hashtag_index.refresh()
+
+        self.assertEqual(
+            suggest_hashtags("py"), [("python", 2), ("pyramid", 1), ("pytest", 1)]
+        )
+        delete_post(post)
+        hashtag_index.refresh()
+        self.assertEqual(suggest_hashtags("r"), [])
+
+    def test_stale_index_is_rebuilt_once_in_the_background(self):
+        hashtag_index.rebuilt_at -= HASHTAG_INDEX_REBUILD_INTERVAL + 1
+        release = threading.Event()
+        with mock.patch.object(
+            hashtag_index, "rebuild", side_effect=lambda: release.wait(5)
+        ) as rebuild:
+            with self.assertNumQueries(0):  # requests keep serving the current index
+                for _ in range(3):
+                    self.assertEqual(suggest_hashtags("py", limit=1), [("python", 3)])
+            release.set()
+            deadline = time.monotonic() + 5
+            while hashtag_index.rebuilding and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        self.assertFalse(hashtag_index.rebuilding)
+        rebuild.assert_called_once()
@@ -0,0 +1,83 @@
+from unittest import mock
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.account.models import User
+from ...models import Post
+from ...selectors.content import get_content_rows
+from ...selectors.item import get_content_items
+from ...services.content import create_post, delete_post, update_content
+from ...services.like import like_content
+
+
+class ContentItemsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username="owner")
+        self.viewer = User.objects.create(username="viewer")
+        self.posts = [create_post(self.owner, f"post {i}") for i in range(3)]
+        self.ids = [post.id for post in reversed(self.posts)]
+
+    def test_misses_load_in_one_query_then_hit_the_cache(self):
+        with self.assertNumQueries(1):
+            items = get_content_items(self.ids + [0], AnonymousUser())
+        self.assertEqual([item["id"] for item in items], self.ids)
+        self.assertEqual(items[0]["user"], "owner")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_content_items(self.ids, AnonymousUser()), items)
+
+    def test_like_state_is_applied_per_viewer(self):
+        get_content_items(self.ids, AnonymousUser())
+        with self.captureOnCommitCallbacks(execute=True):
+            like_content(self.viewer, self.posts[0].id)
+
+        mine = get_content_items([self.posts[0].id], self.viewer)[0]
+        self.assertEqual((mine["count_likes"], mine["liked_by_me"]), (1, True))
+        other = get_content_items([self.posts[0].id], self.owner)[0]
+        self.assertEqual((other["count_likes"], other["liked_by_me"]), (1, False))
+
+    def test_writes_invalidate_items(self):
+        get_content_items(self.ids, AnonymousUser())
+        with self.captureOnCommitCallbacks(execute=True):
+            update_content(self.posts[0], description="edited")
+            delete_post(self.posts[1])
+
+        items = get_content_items(self.ids, AnonymousUser())
+        self.assertEqual([item["id"] for item in items], [self.posts[2].id, self.posts[0].id])
+        self.assertEqual(items[1]["description"], "edited")
+
+    def test_write_racing_with_a_fill_is_not_cached(self):
+        post_id = self.posts[0].id
+
+        def read_rows_then_update(*args):
+            rows = list(get_content_rows(*args))
+            # Commits between the fill's SELECT and its set_many.
+            with self.captureOnCommitCallbacks(execute=True):
+                update_content(Post.objects.get(id=post_id), description="edited")
+            return rows
+
+        with mock.patch("apps.content.selectors.item.get_content_rows", read_rows_then_update):
+            stale = get_content_items([post_id], AnonymousUser())
+        self.assertEqual(stale[0]["description"], "post 0")
+
+        self.assertEqual(
+            get_content_items([post_id], AnonymousUser())[0]["description"], "edited"
+        )
+        with self.assertNumQueries(0):
+            get_content_items([post_id], AnonymousUser())
+
+    def test_endpoints(self):
+        client = APIClient()
+        url = reverse("api:content:content-items")
+        response = client.get(url, {"ids": ",".join(map(str, self.ids))})
+        self.assertEqual([item["id"] for item in response.data], self.ids)
+        self.assertEqual(client.get(url, {"ids": "1,x"}).status_code, 400)
+        self.assertEqual(client.get(url).status_code, 400)
+
+        item_url = reverse("api:content:content-item", args=[self.posts[0].id])
+        self.assertEqual(client.get(item_url).data["id"], self.posts[0].id)
+        missing_url = reverse("api:content:content-item", args=[0])
+        self.assertEqual(client.get(missing_url).status_code, 404)
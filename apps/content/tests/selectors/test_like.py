@@ -0,0 +1,35 @@
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+from apps.account.models import User
+from ...models import Post
+from ...selectors.content import get_content_by_owner
+from ...selectors.like import get_like_context
+from ...serializers import ContentOutputSerializer
+from ...services.like import like_content
+
+
+class LikeContextTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create(username="owner")
+        self.viewer = User.objects.create(username="viewer")
+        self.posts = [
+            Post.objects.create(owner=self.owner, description=f"post {i}")
+            for i in range(3)
+        ]
+        like_content(self.viewer, self.posts[1].id)
+
+    def test_liked_by_me_for_a_page_in_one_query(self):
+        page = list(get_content_by_owner("owner"))
+        with self.assertNumQueries(1):
+            context = get_like_context(self.viewer, page)
+            data = ContentOutputSerializer(page, many=True, context=context).data
+
+        liked = {item["id"]: item["liked_by_me"] for item in data}
+        self.assertEqual(
+            liked,
+            {self.posts[0].id: False, self.posts[1].id: True, self.posts[2].id: False},
+        )
+
+    def test_anonymous_user_needs_no_query(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(get_like_context(AnonymousUser(), self.posts), {})
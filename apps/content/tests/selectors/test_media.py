@@ -0,0 +1,122 @@
+import time
+from unittest import mock
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.account.models import User
+from apps.connect.models import Connection
+from ...models import Post, MediaContent
+from ...selectors.media import (
+    can_view_media_file,
+    get_media_access_token,
+    normalize_media_name,
+)
+
+
+class MediaVisibilityTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create(username="owner", is_private=True)
+        self.friend = User.objects.create(username="friend")
+        self.stranger = User.objects.create(username="stranger")
+        Connection.objects.create(
+            requester=self.friend, receiver=self.owner, is_accept=True
+        )
+
+        self.post = Post.objects.create(
+            owner=self.owner,
+            description="private",
+            thumbnail="content/img/cat.png",
+            thumbnail_variants={"webp": {"80": "content/img/cat.png.80w.webp"}},
+        )
+        self.media = MediaContent.objects.create(
+            owner=self.owner,
+            description="song",
+            media_type="audio",
+            file="media/content/song.mp3",
+        )
+        Post.objects.create(
+            owner=self.stranger, description="public", thumbnail="content/img/dog.png"
+        )
+
+    def test_private_owner_files_are_limited_to_owner_and_connections(self):
+        names = (
+            "content/img/cat.png",
+            "content/img/cat.png.80w.webp",
+            "media/content/song.mp3",
+        )
+        for name in names:
+            self.assertTrue(can_view_media_file(self.owner, name))
+            self.assertTrue(can_view_media_file(self.friend, name))
+            self.assertFalse(can_view_media_file(self.stranger, name))
+            self.assertFalse(can_view_media_file(AnonymousUser(), name))
+
+    def test_variants_resolve_to_the_original_sharing_their_stem(self):
+        Post.objects.create(
+            owner=self.stranger,
+            description="public",
+            thumbnail="content/img/cat.jpg",
+            thumbnail_variants={"webp": {"80": "content/img/cat.jpg.80w.webp"}},
+        )
+        self.assertFalse(can_view_media_file(self.stranger, "content/img/cat.png.80w.webp"))
+        self.assertTrue(can_view_media_file(AnonymousUser(), "content/img/cat.jpg.80w.webp"))
+
+    def test_public_files_and_avatars(self):
+        self.assertTrue(can_view_media_file(AnonymousUser(), "content/img/dog.png"))
+        self.assertTrue(can_view_media_file(AnonymousUser(), "img/profile/me.jpg"))
+
+    def test_unknown_files_are_not_served(self):
+        self.assertFalse(can_view_media_file(self.owner, "content/img/cat.png.160w.webp"))
+        self.assertFalse(can_view_media_file(self.owner, "uploads/tmp/abc"))
+
+    def test_paths_outside_media_root_are_rejected(self):
+        self.assertIsNone(normalize_media_name("../settings.py"))
+        self.assertIsNone(normalize_media_name("img/profile/../../secret"))
+        self.assertEqual(normalize_media_name("img/profile/me.jpg"), "img/profile/me.jpg")
+
+
+@override_settings(MEDIA_X_ACCEL_REDIRECT=True)
+class MediaAccessTokenTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username="owner", is_private=True)
+        self.friend = User.objects.create(username="friend")
+        self.stranger = User.objects.create(username="stranger")
+        Connection.objects.create(
+            requester=self.friend, receiver=self.owner, is_accept=True
+        )
+        Post.objects.create(
+            owner=self.owner, description="private", thumbnail="content/img/cat.png"
+        )
+
+    def get_thumbnail_url(self, viewer):
+        client = APIClient()
+        client.force_authenticate(viewer)
+        response = client.get(reverse("api:content:user-content", args=["owner"]))
+        return response.data["results"][0]["thumbnail"]
+
+    def test_connected_viewer_fetches_without_the_header(self):
+        url = self.get_thumbnail_url(self.friend)
+        self.assertIn("?access=", url)
+
+        # Like an <img> tag: no Authorization header, only the url.
+        response = APIClient().get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Accel-Redirect"], "/protected-media/content/img/cat.png")
+
+        self.assertEqual(APIClient().get(url.split("?")[0]).status_code, 404)
+
+    def test_token_still_applies_the_visibility_rules(self):
+        url = self.get_thumbnail_url(self.stranger)
+        self.assertEqual(APIClient().get(url).status_code, 404)
+        self.assertEqual(
+            APIClient().get("/media/content/img/cat.png?access=forged").status_code, 404
+        )
+
+    def test_token_expires(self):
+        token = get_media_access_token(self.friend)
+        url = f"/media/content/img/cat.png?access={token}"
+        with mock.patch("time.time", return_value=time.time() + 2 * 60 * 60):
+            self.assertEqual(APIClient().get(url).status_code, 404)
+        self.assertEqual(APIClient().get(url).status_code, 200)
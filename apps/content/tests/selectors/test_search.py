@@ -0,0 +1,28 @@
+from django.test import TestCase
+from apps.account.models import User
+from ...selectors.search import search_contents
+from ...services.content import create_post
+
+
+class SearchContentsTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create(username="owner")
+        self.exact = create_post(self.owner, "django tips for beginners #python")
+        self.typo = create_post(self.owner, "djngo deployment notes")
+        self.other = create_post(self.owner, "gardening in spring #python")
+
+    def test_matches_words_and_similar_spellings(self):
+        ids = [content.id for content in search_contents("django")]
+        self.assertEqual(ids[0], self.exact.id)
+        self.assertIn(self.typo.id, ids)
+        self.assertNotIn(self.other.id, ids)
+
+    def test_ranked_by_rank_then_id(self):
+        ranks = [(c.rank, c.id) for c in search_contents("python")]
+        self.assertEqual(ranks, sorted(ranks, reverse=True))
+        self.assertEqual(len(ranks), 2)
+
+    def test_hashtag_prefilter(self):
+        self.assertEqual(list(search_contents("django", hashtag="missing")), [])
+        ids = [c.id for c in search_contents("spring", hashtag="PYTHON")]
+        self.assertEqual(ids, [self.other.id])
@@ -0,0 +1,58 @@
+from urllib.parse import parse_qs, urlparse
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from apps.account.models import User
+from core.pagination import KeysetPagination
+from ...selectors.search import search_contents_page
+from ...services.content import create_post, update_content
+from ...services.search import get_search_cache_stats
+
+
+class SearchCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.owner = User.objects.create(username="owner")
+        self.posts = [create_post(self.owner, f"django post {i}") for i in range(3)]
+
+    def search(self, params):
+        request = Request(self.factory.get("/", params))
+        paginator = KeysetPagination()
+        page = search_contents_page(
+            paginator, request, query=params.get("q"), hashtag=params.get("hashtag")
+        )
+        next_link = paginator.get_next_link()
+        cursor = parse_qs(urlparse(next_link).query)["cursor"] if next_link else None
+        return [content.id for content in page], cursor
+
+    def test_normalized_queries_share_entries(self):
+        first = self.search({"q": "Django  post", "limit": 2})
+        with self.assertNumQueries(2):  # hydrate the cached ids with their hashtags
+            second = self.search({"q": "django post", "limit": 2})
+
+        self.assertEqual(first, second)
+        stats = get_search_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_content_writes_invalidate_entries(self):
+        self.search({"q": "django"})
+        with self.captureOnCommitCallbacks(execute=True):
+            update_content(self.posts[0], "gardening")
+
+        ids, _ = self.search({"q": "django"})
+        self.assertNotIn(self.posts[0].id, ids)
+        self.assertEqual(get_search_cache_stats()["hits"], 0)
+
+    def test_only_matching_scopes_are_invalidated(self):
+        self.search({"q": "django"})
+        self.search({"hashtag": "garden"})
+        with self.captureOnCommitCallbacks(execute=True):
+            create_post(self.owner, "weekend #garden tips")
+
+        self.search({"q": "django"})
+        ids, _ = self.search({"hashtag": "garden"})
+        self.assertEqual(len(ids), 1)
+        stats = get_search_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 3))
@@ -0,0 +1,35 @@
+from django.core.cache import cache
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.account.models import User
+from apps.connect.models import Connection
+from ...selectors.explore import explore_content
+from ...services.content import create_post
+from ...services.explore import refresh_explore_scores
+from ...services.like import like_content
+
+
+class AsyncReadViewsTests(TransactionTestCase):
+    """Committed data, since concurrent queries use their own connections."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.owner = User.objects.create(username="owner")
+        self.friend = User.objects.create(username="friend")
+        Connection.objects.create(requester=self.owner, receiver=self.friend, is_accept=True)
+        self.first = create_post(self.owner, "first #django")
+        self.second = create_post(self.owner, "second")
+
+    def test_explore_matches_sync_selector(self):
+        viewer = User.objects.create(username="viewer")
+        like_content(self.friend, self.first.id)
+        refresh_explore_scores()
+
+        self.client.force_authenticate(viewer)
+        response = self.client.get(reverse("api:content:explore-content"))
+        self.assertEqual(
+            [item["id"] for item in response.data],
+            [content.id for content in explore_content(viewer)],
+        )
@@ -0,0 +1,54 @@
+from django.core.cache import cache
+from django.db.models import Count, F
+from django.test import TestCase
+from apps.account.models import User
+from apps.comment.models import Comment
+from apps.connect.models import Connection
+from ...models import Content, Hashtag, TimelineEntry
+from ...services.dataset import CopyStream, DatasetGenerator
+
+
+class DatasetGeneratorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_copy_stream_reads_in_chunks(self):
+        stream = CopyStream([(1, None, True), ("a b", False, "x")])
+        self.assertEqual(stream.read(3) + stream.read(100) + stream.read(), "1\t\\N\tt\na b\tf\tx\n")
+
+    def test_generated_data_is_consistent(self):
+        counts = DatasetGenerator(scale=0.005, seed=7).run()
+
+        self.assertEqual(User.objects.count(), counts["users"])
+        self.assertEqual(Connection.objects.count(), counts["connections"])
+        self.assertEqual(Content.objects.count(), counts["contents"])
+        self.assertEqual(Comment.objects.count(), counts["comments"])
+        self.assertEqual(TimelineEntry.objects.count(), counts["timeline entries"])
+        self.assertFalse(
+            Content.objects.annotate(likes_total=Count("likes"))
+            .exclude(like_count=F("likes_total"))
+            .exists()
+        )
+        self.assertFalse(
+            Hashtag.objects.annotate(contents_total=Count("contents"))
+            .exclude(usage_count=F("contents_total"))
+            .exists()
+        )
+        self.assertFalse(
+            Comment.objects.filter(reply__isnull=False)
+            .exclude(reply__content_id=F("content_id"))
+            .exists()
+        )
+        # Sequences continue after the copied ids.
+        last_id = User.objects.order_by("-id").values_list("id", flat=True)[0]
+        self.assertEqual(User.objects.create(username="after").id, last_id + 1)
+
+    def test_same_seed_same_data(self):
+        DatasetGenerator(scale=0.002, seed=3).run()
+        first = list(Content.objects.order_by("id").values_list("description", flat=True))
+        Content.objects.all().delete()
+        Hashtag.objects.all().delete()  # taken names are skipped
+
+        DatasetGenerator(scale=0.002, seed=3).run()
+        second = list(Content.objects.order_by("id").values_list("description", flat=True))
+        self.assertEqual(second, first)
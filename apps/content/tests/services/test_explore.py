@@ -0,0 +1,65 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.utils import timezone
+from apps.account.models import User
+from apps.connect.services.connection import request_connection
+from ...models import Content, ExploreScore
+from ...selectors.explore import explore_content
+from ...services.content import create_post
+from ...services.explore import refresh_explore_scores
+from ...services.like import like_content
+
+
+class ExploreScoreServicesTests(TestCase):
+    def setUp(self):
+        self.viewer = User.objects.create(username="viewer")
+        self.friend = User.objects.create(username="friend")
+        self.author = User.objects.create(username="author")
+        self.fan = User.objects.create(username="fan")
+        request_connection(self.viewer, self.friend)
+
+    def test_refresh_computes_content_level_parts(self):
+        post = create_post(self.author, "hello #python #django")
+        like_content(self.fan, post.id)
+
+        self.assertEqual(refresh_explore_scores(), 1)
+        score = ExploreScore.objects.get(content=post)
+        self.assertEqual(score.like_score, 2)
+        self.assertEqual(score.recency_score, 15)
+        self.assertEqual(len(score.hashtag_ids), 2)
+
+    def test_refresh_is_incremental(self):
+        first = create_post(self.author, "first")
+        second = create_post(self.author, "second")
+        refresh_explore_scores()
+
+        self.assertEqual(refresh_explore_scores(), 0)
+        like_content(self.fan, second.id)
+        self.assertEqual(refresh_explore_scores(), 1)
+        self.assertEqual(ExploreScore.objects.get(content=second).like_score, 2)
+        self.assertEqual(ExploreScore.objects.get(content=first).like_score, 0)
+
+    def test_refresh_ages_and_drops_content(self):
+        post = create_post(self.author, "old")
+        refresh_explore_scores()
+
+        later = timezone.now() + timedelta(days=2)
+        refresh_explore_scores(now=later)
+        self.assertEqual(ExploreScore.objects.get(content=post).recency_score, 8)
+
+        refresh_explore_scores(now=later + timedelta(days=6))
+        self.assertFalse(ExploreScore.objects.exists())
+
+    def test_explore_content_adds_social_score(self):
+        plain = create_post(self.author, "plain")
+        liked_by_friend = create_post(self.author, "liked by friend")
+        Content.objects.filter(id=plain.id).update(
+            created_at=liked_by_friend.created_at
+        )
+        like_content(self.friend, liked_by_friend.id)
+        like_content(self.fan, plain.id)
+        refresh_explore_scores()
+
+        results = explore_content(self.viewer, limit=2)
+        self.assertEqual([c.id for c in results], [liked_by_friend.id, plain.id])
+        self.assertEqual(explore_content(self.author), [])
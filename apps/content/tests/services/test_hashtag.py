@@ -0,0 +1,55 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from apps.account.models import User
+from ...models import Hashtag
+from ...services.content import create_post, update_content, delete_post
+from ...services.hashtag import sweep_unused_hashtags
+
+
+class HashtagServicesTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create(username="owner")
+
+    def tag_names(self, content):
+        return set(content.hashtags.values_list("name", flat=True))
+
+    def test_update_syncs_only_the_diff(self):
+        post = create_post(self.owner, "#a #b #c")
+        update_content(post, "#b #c #d")
+
+        self.assertEqual(self.tag_names(post), {"b", "c", "d"})
+        self.assertEqual(Hashtag.objects.get(name="a").usage_count, 0)
+        self.assertEqual(Hashtag.objects.get(name="b").usage_count, 1)
+
+    def test_query_count_does_not_depend_on_tag_count(self):
+        few = create_post(self.owner, "#t0")
+        many = create_post(self.owner, " ".join(f"#m{i}" for i in range(30)))
+
+        with CaptureQueriesContext(connection) as few_queries:
+            update_content(few, "#t1")
+        with self.assertNumQueries(len(few_queries)):
+            update_content(many, " ".join(f"#n{i}" for i in range(30)))
+
+    def test_unchanged_tags_are_not_rewritten(self):
+        post = create_post(self.owner, "#same text")
+        # save + select of the current tags
+        with self.assertNumQueries(2):
+            update_content(post, "#same new text")
+
+    def test_sweeper_deletes_unused_tags_after_grace(self):
+        kept = create_post(self.owner, "#shared")
+        removed = create_post(self.owner, "#shared #alone")
+        delete_post(removed)
+
+        self.assertEqual(Hashtag.objects.get(name="shared").usage_count, 1)
+        self.assertEqual(sweep_unused_hashtags(timedelta(hours=1)), 0)
+
+        stale = Hashtag.objects.get(name="alone").updated_at - timedelta(hours=2)
+        Hashtag.objects.update(updated_at=stale)
+        call_command("sweep_hashtags", "--grace-hours=1", stdout=StringIO())
+        self.assertEqual(set(Hashtag.objects.values_list("name", flat=True)), {"shared"})
+        self.assertEqual(self.tag_names(kept), {"shared"})
@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from PIL import Image
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from apps.account.models import User
+from apps.account.services.user import update_user_picture
+from core.images import get_variant_urls
+from ...models import Content
+from ...services.content import create_post
+
+
+def make_image(name="photo.png", size=(1000, 500), mode="RGBA", fmt="PNG"):
+    buffer = BytesIO()
+    Image.new(mode, size, "red").save(buffer, fmt)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type=f"image/{fmt.lower()}")
+
+
+class ImageVariantServicesTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        settings_override = override_settings(
+            MEDIA_ROOT=self.media_root,
+            IMAGE_VARIANT_WIDTHS=(80, 480, 960),
+            IMAGE_VARIANT_FORMATS=("webp", "jpeg"),
+            IMAGE_VARIANT_WORKERS=0,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root)
+
+        self.owner = User.objects.create(username="owner")
+
+    def test_variants_are_generated_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            post = create_post(self.owner, "sunset", thumbnail=make_image())
+        self.assertEqual(Content.objects.get(id=post.id).thumbnail_variants, {})
+
+        for callback in callbacks:
+            callback()
+        variants = Content.objects.get(id=post.id).thumbnail_variants
+
+        self.assertEqual(set(variants), {"webp", "jpeg"})
+        self.assertEqual(set(variants["webp"]), {"80", "480", "960"})
+        self.assertEqual(variants["jpeg"]["80"], f"{post.thumbnail.name}.80w.jpg")
+        with Image.open(os.path.join(self.media_root, variants["webp"]["480"])) as image:
+            self.assertEqual(image.format, "WEBP")
+            self.assertEqual(image.size, (480, 240))
+
+    def test_originals_sharing_a_stem_keep_their_own_variants(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            png = create_post(self.owner, "png", thumbnail=make_image("cat.png"))
+            jpg = create_post(
+                self.owner,
+                "jpg",
+                thumbnail=make_image("cat.jpg", size=(500, 1000), mode="RGB", fmt="JPEG"),
+            )
+        self.assertEqual(
+            os.path.splitext(png.thumbnail.name)[0], os.path.splitext(jpg.thumbnail.name)[0]
+        )
+
+        png_variants = Content.objects.get(id=png.id).thumbnail_variants
+        jpg_variants = Content.objects.get(id=jpg.id).thumbnail_variants
+        self.assertNotEqual(png_variants["webp"]["480"], jpg_variants["webp"]["480"])
+        with Image.open(os.path.join(self.media_root, png_variants["webp"]["480"])) as image:
+            self.assertEqual(image.size, (480, 240))
+        with Image.open(os.path.join(self.media_root, jpg_variants["webp"]["480"])) as image:
+            self.assertEqual(image.size, (480, 960))
+
+    def test_small_images_are_not_upscaled(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            post = create_post(
+                self.owner,
+                "icon",
+                thumbnail=make_image(size=(100, 100)),
+            )
+
+        variants = Content.objects.get(id=post.id).thumbnail_variants
+        self.assertEqual(set(variants["jpeg"]), {"80", "480"})
+        with Image.open(os.path.join(self.media_root, variants["jpeg"]["480"])) as image:
+            self.assertEqual(image.size, (100, 100))
+
+    def test_post_without_thumbnail_has_no_variants(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            post = create_post(self.owner, "text only")
+
+        self.assertEqual(Content.objects.get(id=post.id).thumbnail_variants, {})
+
+    def test_replaced_picture_keeps_newest_variants(self):
+        with self.captureOnCommitCallbacks(execute=False) as stale:
+            update_user_picture(self.owner, make_image("old.png"))
+        with self.captureOnCommitCallbacks(execute=True):
+            update_user_picture(self.owner, make_image("new.png"))
+        for callback in stale:
+            callback()  # the old avatar finishes last
+
+        self.owner.refresh_from_db()
+        self.assertTrue(self.owner.picture_variants["webp"]["80"].startswith("img/profile/new"))
+        urls = get_variant_urls(self.owner.picture_variants)
+        self.assertTrue(urls["webp"]["80"].startswith("/media/img/profile/new"))
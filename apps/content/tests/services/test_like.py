@@ -0,0 +1,97 @@
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.http import Http404
+from django.test import TestCase, override_settings
+from apps.account.models import User
+from ...models import Content, ContentLikeBucket, Post
+from ...enums import get_like_overlay_key
+from ...selectors.item import get_content_items
+from ...selectors.like import get_like_context
+from ...services.like import like_buffer, like_content, unlike_content
+
+
+class LikeServicesTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create(username="owner")
+        self.user1 = User.objects.create(username="user1")
+        self.user2 = User.objects.create(username="user2")
+        self.post = Post.objects.create(owner=self.owner, description="post")
+
+    def like_count(self):
+        return Content.objects.get(id=self.post.id).like_count
+
+    def test_like_increments_counter_once(self):
+        like_content(self.user1, self.post.id)
+        like_content(self.user1, self.post.id)
+        like_content(self.user2, self.post.id)
+
+        self.assertEqual(self.like_count(), 2)
+        self.assertEqual(self.post.likes.count(), 2)
+
+    def test_unlike_decrements_only_existing_like(self):
+        like_content(self.user1, self.post.id)
+        unlike_content(self.user1, self.post.id)
+        unlike_content(self.user1, self.post.id)
+        unlike_content(self.user2, self.post.id)
+
+        self.assertEqual(self.like_count(), 0)
+
+    def test_backfill_like_counts(self):
+        self.post.likes.add(self.user1, self.user2)
+        self.assertEqual(self.like_count(), 0)
+
+        call_command("backfill_like_counts", stdout=StringIO())
+        self.assertEqual(self.like_count(), 2)
+
+
+@override_settings(CONTENT_LIKE_WRITE_BEHIND=True)
+class WriteBehindLikeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username="owner")
+        self.user1 = User.objects.create(username="user1")
+        self.user2 = User.objects.create(username="user2")
+        self.post = Post.objects.create(owner=self.owner, description="post")
+
+    def tearDown(self):
+        like_buffer.pending.clear()
+
+    def test_intents_are_coalesced_and_flushed_in_bulk(self):
+        get_content_items([self.post.id], self.user1)  # the page the like came from
+        with self.assertNumQueries(0):
+            like_content(self.user1, self.post.id)
+            unlike_content(self.user1, self.post.id)
+            like_content(self.user1, self.post.id)
+            like_content(self.user2, self.post.id)
+            unlike_content(self.user2, self.post.id)
+        self.assertEqual(len(like_buffer.pending), 2)
+
+        like_buffer.flush()
+        post = Content.objects.get(id=self.post.id)
+        self.assertEqual(post.like_count, 1)
+        self.assertEqual(list(post.likes.all()), [self.user1])
+        self.assertEqual(ContentLikeBucket.objects.get(content=post).likes, 1)
+
+    def test_missing_content_is_not_found(self):
+        for action in (like_content, unlike_content):
+            with self.assertRaises(Http404):
+                action(self.user1, 999_999)
+        self.assertIsNone(cache.get(get_like_overlay_key(self.user1.id, 999_999)))
+        self.assertEqual(len(like_buffer.pending), 0)
+
+    def test_overlay_keeps_reads_consistent_before_flush(self):
+        self.post.likes.add(self.user2)
+        Content.objects.filter(id=self.post.id).update(like_count=1)
+        like_content(self.user1, self.post.id)
+        unlike_content(self.user2, self.post.id)
+
+        context = get_like_context(self.user1, [self.post])
+        self.assertEqual(context["liked_ids"], {self.post.id})
+        self.assertEqual(context["like_count_deltas"], {self.post.id: 1})
+        context = get_like_context(self.user2, [self.post])
+        self.assertEqual(context["like_count_deltas"], {self.post.id: -1})
+
+        like_buffer.flush()
+        self.assertEqual(get_like_context(self.user1, [self.post])["like_count_deltas"], {})
+        self.assertEqual(Content.objects.get(id=self.post.id).like_count, 1)
@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.account.models import User
+from ...services.content import create_post, update_content
+from ...services.like import like_content
+
+
+class AnonymousResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.owner = User.objects.create(username="owner")
+        self.other = User.objects.create(username="other")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post = create_post(self.owner, "hello #django")
+        self.list_url = reverse("api:content:user-post", args=["owner"])
+        self.hashtag_url = reverse("api:content:hashtag-search-post")
+
+    def get_hashtag_page(self):
+        return self.client.get(self.hashtag_url, {"q": "django"})
+
+    def test_repeated_anonymous_requests_skip_the_database(self):
+        first = self.client.get(self.list_url)
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(self.list_url)
+        self.assertEqual(cached.data, first.data)
+        self.assertEqual(cached["ETag"], first["ETag"])
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_tagging_a_content_invalidates_the_hashtag_page(self):
+        self.get_hashtag_page()
+        with self.captureOnCommitCallbacks(execute=True):
+            create_post(self.other, "me too #django")
+
+        self.assertEqual(len(self.get_hashtag_page().data["results"]), 2)
+
+    def test_owner_writes_invalidate_pages_listing_their_content(self):
+        self.get_hashtag_page()
+        with self.captureOnCommitCallbacks(execute=True):
+            like_content(self.other, self.post.id)
+        self.assertEqual(self.get_hashtag_page().data["results"][0]["count_likes"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            update_content(self.post, description="edited #django")
+        self.assertEqual(
+            self.client.get(self.list_url).data["results"][0]["description"],
+            "edited #django",
+        )
+
+    def test_authenticated_requests_are_not_shared(self):
+        self.client.get(self.list_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            like_content(self.other, self.post.id)
+
+        self.client.force_authenticate(self.other)
+        self.assertTrue(self.client.get(self.list_url).data["results"][0]["liked_by_me"])
+        self.client.force_authenticate(None)
+        self.assertFalse(self.client.get(self.list_url).data["results"][0]["liked_by_me"])
+
+    def test_unknown_owner_is_not_cached(self):
+        url = reverse("api:content:user-post", args=["newbie"])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+        newbie = User.objects.create(username="newbie")
+        with self.captureOnCommitCallbacks(execute=True):
+            create_post(newbie, "first")
+        self.assertEqual(len(self.client.get(url).data["results"]), 1)
@@ -0,0 +1,64 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.account.models import User
+from apps.connect.services.connection import (
+    request_connection,
+    accept_connection,
+    remove_connection,
+)
+from ...models import TimelineEntry
+from ...services.content import create_post, delete_post
+
+
+class TimelineServicesTests(TestCase):
+    def setUp(self):
+        self.user1 = User.objects.create(username="user1")
+        self.user2 = User.objects.create(username="user2")
+        self.user3 = User.objects.create(username="user3", is_private=True)
+        request_connection(self.user1, self.user2)
+
+    def get_recommended_ids(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        response = client.get(reverse("api:content:recommend-content"))
+        return [item["id"] for item in response.data["results"]]
+
+    def test_create_post_fan_out_to_connections(self):
+        post = create_post(self.user2, "hello")
+
+        self.assertTrue(
+            TimelineEntry.objects.filter(user=self.user1, content=post).exists()
+        )
+        self.assertFalse(TimelineEntry.objects.filter(user=self.user2).exists())
+        self.assertFalse(TimelineEntry.objects.filter(user=self.user3).exists())
+
+    def test_recommend_reads_timeline_newest_first(self):
+        first = create_post(self.user2, "first")
+        second = create_post(self.user2, "second")
+
+        self.assertEqual(self.get_recommended_ids(self.user1), [second.id, first.id])
+
+    def test_delete_post_prunes_timelines(self):
+        post = create_post(self.user2, "hello")
+        delete_post(post)
+
+        self.assertEqual(TimelineEntry.objects.count(), 0)
+        self.assertEqual(self.get_recommended_ids(self.user1), [])
+
+    def test_accept_connection_backfills_timeline(self):
+        post = create_post(self.user3, "private hello")
+        request_connection(self.user1, self.user3)
+        self.assertEqual(self.get_recommended_ids(self.user1), [])
+
+        accept_connection(self.user1, self.user3)
+        self.assertEqual(self.get_recommended_ids(self.user1), [post.id])
+        self.assertEqual(self.get_recommended_ids(self.user3), [])
+
+    def test_remove_connection_prunes_timelines(self):
+        create_post(self.user2, "hello")
+        create_post(self.user1, "hi")
+        remove_connection(self.user1, self.user2)
+
+        self.assertEqual(self.get_recommended_ids(self.user1), [])
+        self.assertEqual(self.get_recommended_ids(self.user2), [])
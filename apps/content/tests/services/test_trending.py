@@ -0,0 +1,63 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.account.models import User
+from ...models import ContentLikeBucket
+from ...selectors.trending import trending_content
+from ...services.content import create_post
+from ...services.like import like_content, unlike_content
+from ...services.trending import record_like_activity, rollover_trending
+
+
+class TrendingServicesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create(username="author")
+        self.fans = [User.objects.create(username=f"fan{i}") for i in range(3)]
+
+    def test_likes_are_bucketed_per_hour(self):
+        post = create_post(self.author, "post")
+        like_content(self.fans[0], post.id)
+        like_content(self.fans[1], post.id)
+        unlike_content(self.fans[0], post.id)
+
+        bucket = ContentLikeBucket.objects.get(content=post)
+        self.assertEqual(bucket.likes, 1)
+
+    def test_trending_ranks_by_window_likes(self):
+        quiet = create_post(self.author, "quiet")
+        popular = create_post(self.author, "popular")
+        for fan in self.fans:
+            like_content(fan, popular.id)
+        like_content(self.fans[0], quiet.id)
+
+        self.assertEqual([c["id"] for c in trending_content(self.fans[0])], [popular.id, quiet.id])
+
+    def test_rollover_drops_expired_buckets(self):
+        old = create_post(self.author, "old")
+        fresh = create_post(self.author, "fresh")
+        now = timezone.now()
+        record_like_activity({old.id: 5}, at=now - timedelta(hours=30))
+        record_like_activity({fresh.id: 1}, at=now)
+
+        self.assertEqual(rollover_trending(now), [fresh.id])
+        self.assertFalse(ContentLikeBucket.objects.filter(content=old).exists())
+        self.assertEqual([c["id"] for c in trending_content(self.author)], [fresh.id])
+
+    def test_trending_endpoint_skips_private_owners(self):
+        hidden = User.objects.create(username="hidden", is_private=True)
+        public = create_post(self.author, "public")
+        private = create_post(hidden, "private")
+        record_like_activity({public.id: 1, private.id: 5})
+
+        client = APIClient()
+        client.force_authenticate(self.fans[0])
+        like_content(self.fans[0], public.id)
+        response = client.get(reverse("api:content:trending-content"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["id"] for item in response.data], [public.id])
+        self.assertTrue(response.data[0]["liked_by_me"])
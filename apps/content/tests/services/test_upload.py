@@ -0,0 +1,93 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.account.models import User
+from ...models import MediaContent
+from ...services.upload import (
+    ErrorMessages,
+    complete_media_upload,
+    get_upload_checksum,
+    get_upload_path,
+    initiate_media_upload,
+    write_media_upload_chunk,
+)
+
+
+class MediaUploadServicesTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        settings_override = override_settings(
+            MEDIA_ROOT=self.media_root,
+            MEDIA_UPLOAD_TEMP_ROOT=os.path.join(self.media_root, "uploads", "tmp"),
+            MEDIA_UPLOAD_CHUNK_SIZE=4,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root)
+
+        self.owner = User.objects.create(username="owner")
+        self.data = b"0123456789"
+        self.upload = initiate_media_upload(
+            self.owner, "song", "audio", "song.mp3", len(self.data)
+        )
+
+    def write(self, offset, chunk, checksum=None):
+        return write_media_upload_chunk(
+            self.upload, offset, BytesIO(chunk), len(chunk), checksum=checksum
+        )
+
+    def test_resumable_upload_creates_media_content(self):
+        self.assertTrue(self.write(0, self.data[:4])[0])
+        # A retried chunk with a stale offset is refused; the client resumes from the stored offset.
+        self.assertEqual(self.write(0, self.data[:4]), (False, ErrorMessages.offset_mismatch))
+        self.assertTrue(self.write(4, self.data[4:8])[0])
+        self.assertEqual(complete_media_upload(self.upload), (False, ErrorMessages.incomplete))
+        self.assertTrue(self.write(8, self.data[8:])[0])
+
+        created, content = complete_media_upload(self.upload)
+        self.assertTrue(created)
+        self.assertEqual(MediaContent.objects.get().id, content.id)
+        with content.file.open("rb") as file:
+            self.assertEqual(file.read(), self.data)
+        self.assertFalse(os.path.exists(get_upload_path(self.upload)))
+
+        self.upload.refresh_from_db()
+        parts = b"".join(hashlib.sha256(self.data[i:i + 4]).digest() for i in (0, 4, 8))
+        self.assertEqual(
+            get_upload_checksum(self.upload), f"{hashlib.sha256(parts).hexdigest()}-3"
+        )
+
+    def test_rejected_chunks_do_not_move_the_offset(self):
+        self.assertEqual(self.write(0, self.data[:5]), (False, ErrorMessages.chunk_too_large))
+        self.assertEqual(
+            self.write(0, self.data[:4], checksum="00" * 32),
+            (False, ErrorMessages.checksum_mismatch),
+        )
+        self.upload.refresh_from_db()
+        self.assertEqual(self.upload.received_size, 0)
+        self.assertEqual(os.path.getsize(get_upload_path(self.upload)), 0)
+
+    def test_complete_rejects_a_non_image_thumbnail(self):
+        self.assertTrue(self.write(0, self.data[:4])[0])
+        self.assertTrue(self.write(4, self.data[4:8])[0])
+        self.assertTrue(self.write(8, self.data[8:])[0])
+        client = APIClient()
+        client.force_authenticate(self.owner)
+        thumbnail = SimpleUploadedFile(
+            "thumb.svg", b"<svg onload='alert(1)'/>", content_type="image/svg+xml"
+        )
+
+        response = client.post(
+            reverse("api:content:media-upload-complete", args=[self.upload.pk]),
+            {"thumbnail": thumbnail},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("thumbnail", response.data)
+        self.assertFalse(MediaContent.objects.exists())
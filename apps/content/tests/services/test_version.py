@@ -0,0 +1,83 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.account.models import User
+from core.conditional import get_versions
+from ...services.content import create_post
+from ...services.like import like_content
+from ...services.version import get_liker_version_key, get_owner_version_key
+
+
+class ContentVersionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create(username="owner")
+        self.viewer = User.objects.create(username="viewer")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post = create_post(self.owner, "first")
+        self.client = APIClient()
+        self.url = reverse("api:content:user-post", args=["owner"])
+
+    def test_writes_bump_versions_after_commit(self):
+        keys = [
+            get_owner_version_key(self.owner.id),
+            get_liker_version_key(self.viewer.id),
+        ]
+        before = get_versions(keys)
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            like_content(self.viewer, self.post.id)
+        self.assertEqual(get_versions(keys), before)
+
+        for callback in callbacks:
+            callback()
+        after = get_versions(keys)
+        self.assertGreater(after[0], before[0])
+        self.assertGreater(after[1], before[1])
+
+    def test_unchanged_list_is_not_modified(self):
+        self.client.force_authenticate(self.viewer)  # bypass the anonymous response cache
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+
+        with self.assertNumQueries(1):  # only the username lookup
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_new_content_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            create_post(self.owner, "second")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_differs_per_viewer_and_page(self):
+        anonymous = self.client.get(self.url)["ETag"]
+        self.assertNotEqual(self.client.get(self.url, {"limit": 1})["ETag"], anonymous)
+
+        self.client.force_authenticate(self.viewer)
+        self.assertNotEqual(self.client.get(self.url)["ETag"], anonymous)
+
+    def test_unknown_owner_has_no_validators(self):
+        self.client.force_authenticate(self.viewer)
+        url = reverse("api:content:user-post", args=["newbie"])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header("ETag"))
+
+        newbie = User.objects.create(username="newbie")
+        with self.captureOnCommitCallbacks(execute=True):
+            create_post(newbie, "first")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 1)
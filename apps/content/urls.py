@@ -5,13 +5,20 @@ from .views import (
     UserContentListAPIView,
     CreatePostAPIView,
     CreateMediaContentAPIView,
+    MediaUploadAPIView,
+    MediaUploadChunkAPIView,
+    MediaUploadCompleteAPIView,
     UpdateDeletePostAPIView,
     UpdateDeleteMediaAPIView,
     ContentSearchAPIView,
     HashtagSearchPostsAPIView,
     HashtagSearchMediaContentsAPIView,
+    HashtagSuggestAPIView,
     ExploreContentAPIView,
+    TrendingContentAPIView,
     RecommendContentAPIView,
+    ContentItemsAPIView,
+    ContentItemAPIView,
     LikeContentAPIView,
     UnLikeContentAPIView,
 )
@@ -26,6 +33,17 @@ urlpatterns = [
     path("user/contents/<str:username>/", UserContentListAPIView.as_view(), name="user-content"),
     path("post/", CreatePostAPIView.as_view(), name="create-post"),
     path("media/", CreateMediaContentAPIView.as_view(), name="create-media"),
+    path("media/uploads/", MediaUploadAPIView.as_view(), name="media-upload"),
+    path(
+        "media/uploads/<uuid:pk>/",
+        MediaUploadChunkAPIView.as_view(),
+        name="media-upload-chunk",
+    ),
+    path(
+        "media/uploads/<uuid:pk>/complete/",
+        MediaUploadCompleteAPIView.as_view(),
+        name="media-upload-complete",
+    ),
     path(
         "post/<int:pk>/", UpdateDeletePostAPIView.as_view(), name="update-delete-post"
     ),
@@ -45,8 +63,16 @@ urlpatterns = [
         HashtagSearchMediaContentsAPIView.as_view(),
         name="hashtag-search-media",
     ),
+    path(
+        "hashtag/suggest/",
+        HashtagSuggestAPIView.as_view(),
+        name="hashtag-suggest",
+    ),
     path('posts/explore/', ExploreContentAPIView.as_view(), name='explore-content'),
+    path("posts/trending/", TrendingContentAPIView.as_view(), name="trending-content"),
     path('posts/recommend/', RecommendContentAPIView.as_view(), name='recommend-content'),
+    path("items/", ContentItemsAPIView.as_view(), name="content-items"),
+    path("items/<int:content_id>/", ContentItemAPIView.as_view(), name="content-item"),
     path('content/like/', LikeContentAPIView.as_view(), name='content-like'),
     path('content/unlike/', UnLikeContentAPIView.as_view(), name='content-unlike'),
 ]
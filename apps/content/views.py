@@ -1,7 +1,15 @@
+import mimetypes
+from urllib.parse import quote
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views.static import serve
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from adrf.views import APIView as AsyncAPIView
+from core.pagination import PaginatedAPIViewMixin
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
@@ -9,7 +17,8 @@ from drf_spectacular.utils import (
     OpenApiParameter,
 )
 
-from .models import Post, MediaContent, Content
+from django.shortcuts import get_object_or_404
+from .models import Post, MediaContent, Content, MediaUpload
 from .base_view import (
     UserContentListAPIView,
     CreateContentAPIView,
@@ -23,10 +32,37 @@ from .serializers import (
     MediaContentOutputSerializer,
     ContentUpdateInputSerializer,
     ContentOutputSerializer,
+    HashtagSuggestionOutputSerializer,
+    MediaUploadInputSerializer,
+    MediaUploadCompleteInputSerializer,
+    MediaUploadOutputSerializer,
+    MEDIA_ACCESS_PARAM,
+)
+from .selectors.search import search_contents_page
+from .selectors.trending import trending_content
+from .selectors.explore import aexplore_content
+from .selectors.content import get_timeline_entries, get_content_rows
+from .selectors.hashtag import suggest_hashtags
+from .selectors.item import get_content_items
+from .selectors.like import get_like_context, get_like_context_for_ids
+from .selectors.media import (
+    can_view_media_file,
+    get_media_access_token,
+    get_media_access_user,
+    normalize_media_name,
 )
-from .selectors.search import search_contents
-from .selectors.explore import explore_content, recommend_content
 from .services.like import like_content, unlike_content
+from .services.upload import (
+    ErrorMessages as UploadErrorMessages,
+    initiate_media_upload,
+    write_media_upload_chunk,
+    complete_media_upload,
+    get_upload_checksum,
+)
+
+HASHTAG_SUGGEST_MAX_LIMIT = 20
+TRENDING_MAX_LIMIT = 50
+CONTENT_ITEMS_MAX_IDS = 100
 
 
 @extend_schema_view(
@@ -37,7 +73,6 @@ from .services.like import like_content, unlike_content
 class UserPostListAPIView(UserContentListAPIView):
     model = Post
     serializer_class = PostOutputSerializer
-    authentication_classes = []
 
 
 @extend_schema_view(
@@ -48,7 +83,6 @@ class UserPostListAPIView(UserContentListAPIView):
 class UserMediaListAPIView(UserContentListAPIView):
     model = MediaContent
     serializer_class = MediaContentOutputSerializer
-    authentication_classes = []
 
 
 @extend_schema_view(
@@ -60,7 +94,6 @@ class UserMediaListAPIView(UserContentListAPIView):
 class UserContentListAPIView(UserContentListAPIView):
     model = Content
     serializer_class = ContentOutputSerializer
-    authentication_classes = []
 
 
 @extend_schema_view(
@@ -90,6 +123,158 @@ class CreateMediaContentAPIView(CreateContentAPIView):
     output_serializer_class = MediaContentOutputSerializer
 
 
+@extend_schema_view(
+    post=extend_schema(
+        summary="start a chunked media upload",
+        description=(
+            "Returns an upload id. Send the file with PUT requests to the upload url, "
+            "each with an `Upload-Offset` header and at most `chunk_size` bytes, then "
+            "call the complete endpoint. An interrupted upload is resumed from the "
+            "`offset` returned by GET."
+        ),
+        request=MediaUploadInputSerializer,
+        responses={201: MediaUploadOutputSerializer},
+    ),
+)
+class MediaUploadAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        srz = MediaUploadInputSerializer(data=request.data)
+        srz.is_valid(raise_exception=True)
+        upload = initiate_media_upload(owner=request.user, **srz.validated_data)
+        return Response(
+            MediaUploadOutputSerializer(upload).data, status=status.HTTP_201_CREATED
+        )
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="get a chunked upload state",
+        responses={200: MediaUploadOutputSerializer},
+    ),
+    put=extend_schema(
+        summary="upload a chunk",
+        description=(
+            "Raw request body holding the bytes starting at the `Upload-Offset` header. "
+            "An optional `Upload-Checksum` header holds the hex sha256 of the chunk."
+        ),
+        request={"application/offset+octet-stream": bytes},
+        responses={
+            204: None,
+            400: OpenApiResponse(description="Invalid chunk"),
+            409: OpenApiResponse(description="Offset mismatch or concurrent write"),
+        },
+    ),
+)
+class MediaUploadChunkAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get_object(self, pk):
+        return get_object_or_404(MediaUpload, pk=pk, owner=self.request.user)
+
+    def get(self, request, pk):
+        upload = self.get_object(pk)
+        response = Response(MediaUploadOutputSerializer(upload).data)
+        response["Upload-Offset"] = upload.received_size
+        return response
+
+    def put(self, request, pk):
+        upload = self.get_object(pk)
+        try:
+            offset = int(request.headers["Upload-Offset"])
+            length = int(request.headers.get("Content-Length") or 0)
+        except (KeyError, ValueError):
+            return Response(
+                {"detail": "Upload-Offset and Content-Length headers are required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        written, result = write_media_upload_chunk(
+            upload,
+            offset=offset,
+            stream=request.stream,
+            length=length,
+            checksum=request.headers.get("Upload-Checksum"),
+        )
+        if not written:
+            conflict = result in (UploadErrorMessages.offset_mismatch, UploadErrorMessages.busy)
+            response = Response(
+                {"detail": result},
+                status=status.HTTP_409_CONFLICT if conflict else status.HTTP_400_BAD_REQUEST,
+            )
+            response["Upload-Offset"] = self.get_object(pk).received_size
+            return response
+
+        response = Response(status=status.HTTP_204_NO_CONTENT)
+        response["Upload-Offset"] = result.received_size
+        return response
+
+
+@extend_schema_view(
+    post=extend_schema(
+        summary="complete a chunked media upload",
+        description="Creates the media content. The `Upload-Checksum` response header holds the upload checksum.",
+        request={"multipart/form-data": MediaUploadCompleteInputSerializer},
+        responses={200: MediaContentOutputSerializer},
+    ),
+)
+class MediaUploadCompleteAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        upload = get_object_or_404(MediaUpload, pk=pk, owner=request.user)
+        srz = MediaUploadCompleteInputSerializer(data=request.data)
+        srz.is_valid(raise_exception=True)
+        created, result = complete_media_upload(
+            upload, thumbnail=srz.validated_data.get("thumbnail")
+        )
+        if not created:
+            return Response({"detail": result}, status=status.HTTP_400_BAD_REQUEST)
+
+        context = {"media_token": get_media_access_token(request.user)}
+        response = Response(MediaContentOutputSerializer(result, context=context).data)
+        response["Upload-Checksum"] = get_upload_checksum(upload)
+        return response
+
+
+@extend_schema(exclude=True)
+class MediaGatewayAPIView(APIView):
+    """
+    Serves files under MEDIA_URL after a visibility check. Behind nginx the
+    bytes (and Range requests) are handed off with X-Accel-Redirect, so the
+    worker is released as soon as the check is done.
+
+    Browsers load media from <img>/<video> tags without the Authorization
+    header; content payloads sign the file urls of private owners with the
+    viewer's `?access=` token instead.
+    """
+
+    throttle_classes = []
+
+    def get(self, request, name: str):
+        name = normalize_media_name(name)
+        user = request.user
+        token = request.query_params.get(MEDIA_ACCESS_PARAM)
+        if not user.is_authenticated and token:
+            user = get_media_access_user(token)
+        if name is None or not can_view_media_file(user, name):
+            raise Http404
+
+        if not settings.MEDIA_X_ACCEL_REDIRECT:
+            return serve(request._request, name, document_root=settings.MEDIA_ROOT)
+
+        content_type, encoding = mimetypes.guess_type(name)
+        response = HttpResponse(content_type=content_type or "application/octet-stream")
+        if encoding:
+            response["Content-Encoding"] = encoding
+        response["X-Accel-Redirect"] = quote(settings.MEDIA_X_ACCEL_PREFIX + name)
+        # Visibility depends on who is asking: the header, or the token in the url.
+        response["Cache-Control"] = "private"
+        response["Vary"] = "Authorization"
+        return response
+
+
 @extend_schema_view(
     patch=extend_schema(
         summary="update a post",
@@ -152,7 +337,6 @@ class UpdateDeleteMediaAPIView(UpdateDeleteContentAPIView):
 class HashtagSearchPostsAPIView(SearchContentAPIView):
     model = Post
     serializer_class = PostOutputSerializer
-    authentication_classes = []
 
 
 @extend_schema_view(
@@ -176,8 +360,6 @@ class HashtagSearchPostsAPIView(SearchContentAPIView):
     )
 )
 class HashtagSearchMediaContentsAPIView(SearchContentAPIView):
-    authentication_classes = []
-
     model = MediaContent
     serializer_class = MediaContentOutputSerializer
 
@@ -218,23 +400,67 @@ class HashtagSearchMediaContentsAPIView(SearchContentAPIView):
         },
     )
 )
-class ContentSearchAPIView(APIView):
-    authentication_classes = []
-
-    def get(self, request):
+class ContentSearchAPIView(PaginatedAPIViewMixin, AsyncAPIView):
+    async def get(self, request):
         query = request.query_params.get("q")
         content_type = request.query_params.get("type")  # post | media | None
         hashtag = request.query_params.get("hashtag")
-        queryset = search_contents(
-            query=query, content_type=content_type, hashtag=hashtag
+        # The search pipeline goes through the cache as well, run it as a whole.
+        page = await sync_to_async(search_contents_page)(
+            self.paginator,
+            request,
+            query=query,
+            content_type=content_type,
+            hashtag=hashtag,
         )
+        context = await sync_to_async(get_like_context)(request.user, page)
+        serializer = ContentOutputSerializer(page, many=True, context=context)
+        return self.get_paginated_response(serializer.data)
 
-        return Response(
-            ContentOutputSerializer(queryset, many=True).data, status=status.HTTP_200_OK
-        )
 
+@extend_schema_view(
+    get=extend_schema(
+        summary="Suggest hashtags",
+        description="Return the most used hashtags starting with the given prefix.",
+        parameters=[
+            OpenApiParameter(
+                name="prefix",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                required=True,
+                description="Beginning of the hashtag name, with or without '#'",
+            ),
+            OpenApiParameter(
+                name="limit",
+                type=int,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description=f"Number of suggestions (max {HASHTAG_SUGGEST_MAX_LIMIT})",
+            ),
+        ],
+        responses={200: HashtagSuggestionOutputSerializer(many=True)},
+    )
+)
+class HashtagSuggestAPIView(APIView):
+    authentication_classes = []
+
+    def get(self, request):
+        prefix = request.query_params.get("prefix", "")
+        try:
+            limit = min(int(request.query_params.get("limit", 10)), HASHTAG_SUGGEST_MAX_LIMIT)
+        except ValueError:
+            return Response(
+                {"detail": "limit must be an integer."}, status=status.HTTP_400_BAD_REQUEST
+            )
 
-class ExploreContentAPIView(APIView):
+        suggestions = [
+            {"name": name, "usage_count": usage}
+            for name, usage in suggest_hashtags(prefix, max(limit, 1))
+        ]
+        return Response(HashtagSuggestionOutputSerializer(suggestions, many=True).data)
+
+
+class ExploreContentAPIView(AsyncAPIView):
     permission_classes = [IsAuthenticated]
 
     @extend_schema(
@@ -242,13 +468,42 @@ class ExploreContentAPIView(APIView):
         description="Return a mixed list of trending and related contents for the authenticated user.",
         responses={200: ContentOutputSerializer(many=True)}
     )
-    def get(self, request):
-        results = explore_content(request.user)
-        serializer = ContentOutputSerializer(results, many=True)
+    async def get(self, request):
+        results = await aexplore_content(request.user)
+        context = await sync_to_async(get_like_context)(request.user, results)
+        serializer = ContentOutputSerializer(results, many=True, context=context)
         return Response(serializer.data)
 
 
-class RecommendContentAPIView(APIView):
+@extend_schema_view(
+    get=extend_schema(
+        summary="Trending contents",
+        description="Return the contents with the most likes received in the last 24 hours.",
+        parameters=[
+            OpenApiParameter(
+                name="limit",
+                type=int,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description=f"Number of contents (max {TRENDING_MAX_LIMIT})",
+            ),
+        ],
+        responses={200: ContentOutputSerializer(many=True)},
+    )
+)
+class TrendingContentAPIView(APIView):
+    def get(self, request):
+        try:
+            limit = min(int(request.query_params.get("limit", 20)), TRENDING_MAX_LIMIT)
+        except ValueError:
+            return Response(
+                {"detail": "limit must be an integer."}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(trending_content(request.user, max(limit, 1)))
+
+
+class RecommendContentAPIView(PaginatedAPIViewMixin, AsyncAPIView):
     permission_classes = [IsAuthenticated]
 
     @extend_schema(
@@ -256,10 +511,80 @@ class RecommendContentAPIView(APIView):
         description="Return the most recent posts by a user's accepted connections.",
         responses={200: ContentOutputSerializer(many=True)}
     )
+    async def get(self, request):
+        entries = await sync_to_async(self.paginate_queryset)(
+            get_timeline_entries(request.user)
+        )
+        content_ids = [entry.content_id for entry in entries]
+        rows = {
+            row["id"]: row
+            async for row in get_content_rows(
+                content_ids, ContentOutputSerializer.get_row_fields()
+            )
+        }
+        context = await sync_to_async(get_like_context_for_ids)(request.user, list(rows))
+        data = ContentOutputSerializer.rows_to_representation(
+            [rows[cid] for cid in content_ids if cid in rows], context
+        )
+        return self.get_paginated_response(data)
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Get contents by id",
+        description="Return the contents with the given ids, in the same order. Unknown ids are skipped.",
+        parameters=[
+            OpenApiParameter(
+                name="ids",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                required=True,
+                description=f"Comma separated content ids (max {CONTENT_ITEMS_MAX_IDS})",
+            ),
+        ],
+        responses={200: ContentOutputSerializer(many=True)},
+    )
+)
+class ContentItemsAPIView(APIView):
     def get(self, request):
-        results = recommend_content(request.user)
-        serializer = ContentOutputSerializer(results, many=True)
-        return Response(serializer.data)
+        try:
+            content_ids = [
+                int(cid)
+                for value in request.query_params.getlist("ids")
+                for cid in value.split(",")
+                if cid.strip()
+            ]
+        except ValueError:
+            return Response(
+                {"detail": "ids must be integers."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        content_ids = list(dict.fromkeys(content_ids))
+        if not content_ids or len(content_ids) > CONTENT_ITEMS_MAX_IDS:
+            return Response(
+                {"detail": f"Give between 1 and {CONTENT_ITEMS_MAX_IDS} ids."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(get_content_items(content_ids, request.user))
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Get a content",
+        responses={
+            200: ContentOutputSerializer,
+            404: OpenApiResponse(description="Content not found."),
+        },
+    )
+)
+class ContentItemAPIView(APIView):
+    def get(self, request, content_id):
+        items = get_content_items([content_id], request.user)
+        if not items:
+            return Response(
+                {"detail": "Content not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(items[0])
 
 
 class LikeContentAPIView(APIView):
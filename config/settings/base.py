@@ -6,6 +6,7 @@ Generated by 'django-admin startproject' using Django 5.0.7.
 
 # See https://docs.djangoproject.com/en/5.0/howto/deployment/checklist/
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -20,6 +21,7 @@ else:
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 DEBUG = os.getenv("DEBUG", "False") == "True"
+TESTING = sys.argv[1:2] == ["test"]
 SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "default_se@cret_key@#$fa")
 
 
@@ -47,11 +49,13 @@ INSTALLED_APPS = [
     "whitenoise.runserver_nostatic",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",
     *THIRD_PARTY_APPS,
     *LOCAL_APPS,
 ]
 
 MIDDLEWARE = [
+    "core.middleware.QueryInspectorMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -98,9 +102,19 @@ DATABASES = {
         "PASSWORD": url.password,
         "HOST": url.hostname,
         "PORT": url.port,
+        "OPTIONS": {
+            # Threshold of the pg_trgm `%` operator used by content search.
+            "options": "-c pg_trgm.similarity_threshold=0.11",
+        },
     }
 }
 
+# Thread pool of core.concurrency.gather_queries; its threads keep their connections
+# this long (request threads do not, CONN_MAX_AGE stays 0 under ASGI). Closed after
+# every call under tests, so the test database can be dropped.
+GATHER_QUERIES_THREADS = int(os.getenv("GATHER_QUERIES_THREADS", "8"))
+GATHER_QUERIES_CONN_MAX_AGE = 0 if TESTING else int(os.getenv("GATHER_QUERIES_CONN_MAX_AGE", "60"))
+
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -133,6 +147,20 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+# Chunked media uploads; parts are kept on the media volume so finalizing is a rename
+MEDIA_UPLOAD_TEMP_ROOT = MEDIA_ROOT / "uploads" / "tmp"
+MEDIA_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # keep below nginx client_max_body_size
+MEDIA_UPLOAD_MAX_SIZE = 2 * 1024 * 1024 * 1024
+# Hand authorized media responses to nginx (internal location below) instead of streaming them
+MEDIA_X_ACCEL_REDIRECT = os.getenv("MEDIA_X_ACCEL_REDIRECT", "False") == "True"
+MEDIA_X_ACCEL_PREFIX = "/protected-media/"
+# Lifetime of the signed `?access=` tokens on media urls of private owners
+MEDIA_ACCESS_TOKEN_MAX_AGE = int(os.getenv("MEDIA_ACCESS_TOKEN_MAX_AGE", str(60 * 60)))
+# Resized thumbnail/avatar variants, rendered by a process pool (0 workers = inline)
+IMAGE_VARIANT_WIDTHS = (80, 160, 480)  # list rows render at 60-80px
+IMAGE_VARIANT_FORMATS = ("webp", "jpeg")
+IMAGE_VARIANT_QUALITY = 80
+IMAGE_VARIANT_WORKERS = int(os.getenv("IMAGE_VARIANT_WORKERS", "2"))
 
 # STORAGES = {
 #     "default": {
@@ -148,13 +176,62 @@ MEDIA_ROOT = BASE_DIR / "media"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Shared cache tier; without REDIS_URL an in-process stand-in is used for tests and
+# runserver only (production settings refuse to start without it)
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+else:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "shared",
+        "OPTIONS": {"MAX_ENTRIES": 100_000},
+    }
+
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
-        "LOCATION": "/var/tmp/django_cache",
+        "BACKEND": "core.cache.TieredCache",
+        "OPTIONS": {
+            "SHARED": SHARED_CACHE,
+            # Only versioned or validated entries may be served from the process
+            "LOCAL_PREFIXES": ("trending:", "search:", "response:"),
+            "LOCAL_MAX_ENTRIES": 1000,
+            "LOCAL_TIMEOUT": 30,
+        },
     }
 }
 
+# Shared cache of anonymous read responses, invalidated by tag on write
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", str(60 * 60 * 24)))
+
+# Per-object cache of serialized contents, dropped on update, delete and like changes
+CONTENT_ITEM_CACHE_TIMEOUT = int(os.getenv("CONTENT_ITEM_CACHE_TIMEOUT", str(60 * 60)))
+
+# Report N+1 query patterns and requests over their query budget (by URL name);
+# meant for development and staging, raises instead of logging under tests
+QUERY_INSPECTOR = os.getenv("QUERY_INSPECTOR", "False") == "True" or TESTING
+QUERY_INSPECTOR_RAISE = TESTING
+QUERY_INSPECTOR_REPEAT_THRESHOLD = int(os.getenv("QUERY_INSPECTOR_REPEAT_THRESHOLD", "5"))
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "30"))
+QUERY_BUDGETS = {
+    "api:account:profile_detail": 4,
+    "api:content:user-content": 4,
+    "api:content:user-post": 4,
+    "api:content:user-media": 4,
+    "api:content:content-items": 3,
+    "api:content:content-search": 6,
+    "api:content:explore-content": 6,
+    "api:content:recommend-content": 4,
+    "api:comment:comment-list-create": 6,
+}
+
+# Buffer like/unlike intents in memory and write them to the database in batches
+CONTENT_LIKE_WRITE_BEHIND = os.getenv("CONTENT_LIKE_WRITE_BEHIND", "False") == "True"
+CONTENT_LIKE_FLUSH_INTERVAL = float(os.getenv("CONTENT_LIKE_FLUSH_INTERVAL", "1"))
+
 LOGGING_LEVEL = "DEBUG" if DEBUG else "INFO"
 LOGGING_FILE_PATH_ERROR = BASE_DIR / "logs" / "err.log"
 LOGGING_FILE_PATH_INFO = BASE_DIR / "logs" / "main.log"
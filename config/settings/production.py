@@ -1,5 +1,11 @@
+from django.core.exceptions import ImproperlyConfigured
 from .base import *
 
+# The in-process fallback is not shared between workers, so invalidation,
+# versions and the like buffer would silently diverge.
+if not REDIS_URL:
+    raise ImproperlyConfigured("REDIS_URL must be set in production.")
+
 DEBUG = False
 
 ALLOWED_HOSTS = [
@@ -17,8 +17,7 @@ Including another URLconf
 
 from django.contrib import admin
 from django.urls import path, include
-from django.conf import settings
-from django.conf.urls.static import static
+from apps.content.views import MediaGatewayAPIView
 
 from drf_spectacular.views import (
     SpectacularAPIView,
@@ -29,6 +28,8 @@ from drf_spectacular.views import (
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    # Media files, visibility checked by the application
+    path("media/<path:name>", MediaGatewayAPIView.as_view(), name="media-gateway"),
     # API urls
     path("", include(("apps.api.urls", "api"))),
     # API document
@@ -53,7 +54,3 @@ urlpatterns = [
         name="redoc",
     ),
 ]
-
-
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,170 @@
+import pickle
+import threading
+import time
+from collections import Counter, OrderedDict
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.utils.module_loading import import_string
+
+_MISSING = object()
+
+
+class TieredCache(BaseCache):
+    """
+    A bounded per-process LRU in front of a shared cache backend.
+
+    Only keys starting with one of `LOCAL_PREFIXES` are kept in the local
+    tier, and for at most `LOCAL_TIMEOUT` seconds, since other processes'
+    writes only reach it through the shared tier. Use it for keys that are
+    immutable (versioned) or validated against the shared tier; counters,
+    versions, tokens and throttles always go to the shared tier, which also
+    does the atomic increments. Writes go through to both tiers.
+
+    OPTIONS:
+        SHARED: cache config of the shared tier (BACKEND, LOCATION, OPTIONS...)
+        LOCAL_PREFIXES: key prefixes cached in process
+        LOCAL_MAX_ENTRIES: size of the local LRU (default 1000)
+        LOCAL_TIMEOUT: max age of a local copy in seconds (default 30)
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        shared = dict(options["SHARED"])
+        backend = import_string(shared.pop("BACKEND"))
+        self.shared = backend(shared.pop("LOCATION", ""), shared)
+        self.local_prefixes = tuple(options.get("LOCAL_PREFIXES", ()))
+        self.local_max_entries = options.get("LOCAL_MAX_ENTRIES", 1000)
+        self.local_timeout = options.get("LOCAL_TIMEOUT", 30)
+        self.local = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = Counter()
+
+    # Local tier
+
+    def is_local(self, key) -> bool:
+        return key.startswith(self.local_prefixes)
+
+    def local_key(self, key, version):
+        return self.shared.make_and_validate_key(key, version=version)
+
+    def local_get(self, key, version):
+        local_key = self.local_key(key, version)
+        with self.lock:
+            entry = self.local.get(local_key)
+            if entry is None or entry[0] <= time.monotonic():
+                self.local.pop(local_key, None)
+                self.stats["local_misses"] += 1
+                return _MISSING
+            self.local.move_to_end(local_key)
+            self.stats["local_hits"] += 1
+        return pickle.loads(entry[1])
+
+    def local_set(self, key, value, timeout, version):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.shared.default_timeout
+        if timeout is not None and timeout <= 0:
+            return self.local_delete(key, version)
+
+        ttl = self.local_timeout if timeout is None else min(timeout, self.local_timeout)
+        entry = (time.monotonic() + ttl, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        local_key = self.local_key(key, version)
+        with self.lock:
+            self.local[local_key] = entry
+            self.local.move_to_end(local_key)
+            while len(self.local) > self.local_max_entries:
+                self.local.popitem(last=False)
+                self.stats["local_evictions"] += 1
+
+    def local_delete(self, key, version):
+        with self.lock:
+            self.local.pop(self.local_key(key, version), None)
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {**self.stats, "local_entries": len(self.local)}
+
+    # Cache API
+
+    def get(self, key, default=None, version=None):
+        if not self.is_local(key):
+            return self.shared.get(key, default, version=version)
+
+        value = self.local_get(key, version)
+        if value is _MISSING:
+            value = self.shared.get(key, _MISSING, version=version)
+            if value is _MISSING:
+                return default
+            self.local_set(key, value, DEFAULT_TIMEOUT, version)
+        return value
+
+    def get_many(self, keys, version=None):
+        found, remote = {}, []
+        for key in keys:
+            value = self.local_get(key, version) if self.is_local(key) else _MISSING
+            if value is _MISSING:
+                remote.append(key)
+            else:
+                found[key] = value
+        if remote:
+            fetched = self.shared.get_many(remote, version=version)
+            for key, value in fetched.items():
+                if self.is_local(key):
+                    self.local_set(key, value, DEFAULT_TIMEOUT, version)
+            found.update(fetched)
+        return found
+
+    def has_key(self, key, version=None):
+        if self.is_local(key) and self.local_get(key, version) is not _MISSING:
+            return True
+        return self.shared.has_key(key, version=version)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout, version=version)
+        if self.is_local(key):
+            if added:
+                self.local_set(key, value, timeout, version)
+            else:
+                self.local_delete(key, version)
+        return added
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout, version=version)
+        if self.is_local(key):
+            self.local_set(key, value, timeout, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, timeout, version=version)
+        for key, value in data.items():
+            if self.is_local(key) and key not in failed:
+                self.local_set(key, value, timeout, version)
+        return failed
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        value = self.shared.incr(key, delta, version=version)
+        if self.is_local(key):
+            self.local_delete(key, version)
+        return value
+
+    def decr(self, key, delta=1, version=None):
+        return self.incr(key, -delta, version=version)
+
+    def delete(self, key, version=None):
+        self.local_delete(key, version)
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        for key in keys:
+            self.local_delete(key, version)
+        self.shared.delete_many(keys, version=version)
+
+    def clear(self):
+        with self.lock:
+            self.local.clear()
+        self.shared.clear()
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
@@ -0,0 +1,59 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+
+@functools.cache
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Threads of `gather_queries`, shared by the process. They outlive requests,
+    so each keeps its database connection between calls instead of opening
+    one per query; at most GATHER_QUERIES_THREADS connections per process.
+    """
+    return ThreadPoolExecutor(
+        max_workers=settings.GATHER_QUERIES_THREADS,
+        thread_name_prefix="gather-queries",
+    )
+
+
+def _run_on_own_connection(func):
+    opened = {
+        connection.alias
+        for connection in connections.all(initialized_only=True)
+        if connection.connection is not None
+    }
+    try:
+        return func()
+    finally:
+        # Like Django between requests, with GATHER_QUERIES_CONN_MAX_AGE
+        # instead of CONN_MAX_AGE (which stays 0 for the request threads):
+        # connections that broke or outlived it are closed, the rest reused.
+        close_at = time.monotonic() + settings.GATHER_QUERIES_CONN_MAX_AGE
+        for connection in connections.all(initialized_only=True):
+            if connection.connection is not None and connection.alias not in opened:
+                connection.close_at = close_at
+            connection.close_if_unusable_or_obsolete()
+
+
+async def gather_queries(*funcs) -> list:
+    """
+    Run independent blocking ORM calls concurrently and return their results
+    in order. Django's async ORM runs every query of a request on the same
+    thread and connection, one after the other; each call here runs on a
+    thread of `get_executor()` with its own database connection instead.
+
+    Only use it outside transactions: the other connections do not see
+    uncommitted rows.
+    """
+    return await asyncio.gather(
+        *(
+            sync_to_async(
+                _run_on_own_connection, thread_sensitive=False, executor=get_executor()
+            )(func)
+            for func in funcs
+        )
+    )
@@ -0,0 +1,68 @@
+import hashlib
+import json
+import time
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def get_versions(keys) -> list[int]:
+    """
+    Current value of each version counter. Versions are `time.time_ns()` of
+    the last change; a counter missing from the cache starts now, which
+    only ever makes clients refetch.
+    """
+    keys = list(keys)
+    versions = cache.get_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def bump_versions(keys) -> None:
+    """
+    Mark the data behind `keys` as changed. Deferred until the surrounding
+    transaction commits, so a reader can never pair the new version with
+    rows it read before the commit.
+    """
+    keys = list(keys)
+    if keys:
+        transaction.on_commit(
+            lambda: cache.set_many({key: time.time_ns() for key in keys}, None)
+        )
+
+
+def get_validators(request, keys, since: int = 0) -> tuple[str, int]:
+    """
+    ETag and Last-Modified for a response built from the data behind `keys`.
+    The ETag also covers the url and the viewer, since pages and per-user
+    fields (likes, email) differ between them. `since` (ns) counts as one
+    more version, for parts of a response that change on a schedule.
+    """
+    versions = [*get_versions(keys), since]
+    user_id = request.user.id if request.user.is_authenticated else None
+    digest = hashlib.sha1(
+        json.dumps([request.get_full_path(), user_id, versions]).encode()
+    ).hexdigest()
+    return f'"{digest}"', max(versions) // 10**9
+
+
+def get_not_modified_response(request, etag: str, last_modified: int):
+    """A 304 response when the client's copy is still current, otherwise None."""
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag: str, last_modified: int):
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    # Let clients keep the copy but always revalidate it.
+    response["Cache-Control"] = "private, no-cache"
+    return response
@@ -0,0 +1,144 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from .logger import get_application_logger
+
+logger = get_application_logger()
+
+IMAGE_VARIANT_EXTENSIONS = {"webp": ".webp", "jpeg": ".jpg"}
+
+
+def get_variant_name(name: str, width: int, fmt: str) -> str:
+    """
+    `content/img/cat.png` -> `content/img/cat.png.320w.webp`, stored next to the
+    original. The original extension is kept, so `cat.png` and `cat.jpg` (both
+    valid storage names) never share variant files.
+    """
+    return f"{name}.{width}w{IMAGE_VARIANT_EXTENSIONS[fmt]}"
+
+
+def render_image_variants(root: str, name: str, widths, formats, quality: int = 80) -> dict:
+    """
+    Resize the image at `root/name` to every width in `widths` and save it in
+    every format. Images are never upscaled: the first width at or past the
+    original size gets a recompressed copy and larger widths are skipped. Runs inside a pool worker, so it only deals
+    with paths and returns plain data: `{fmt: {width: variant name}}`.
+    """
+    from PIL import Image, ImageOps
+
+    variants = {fmt: {} for fmt in formats}
+    with Image.open(os.path.join(root, name)) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+        for width in sorted(set(widths)):
+            resized = image.copy()
+            resized.thumbnail((width, image.height))
+            for fmt in formats:
+                frame = resized
+                if fmt == "jpeg" and frame.mode != "RGB":
+                    frame = frame.convert("RGB")
+                variant = get_variant_name(name, width, fmt)
+                frame.save(os.path.join(root, variant), fmt.upper(), quality=quality)
+                variants[fmt][str(width)] = variant
+            if width >= image.width:
+                break  # larger widths would be the same recompressed original
+    return variants
+
+
+def get_variant_urls(variants: dict, request=None) -> dict:
+    """Map a stored variant dict to public urls, absolute when a request is given."""
+    from django.core.files.storage import default_storage
+
+    urls = {}
+    for fmt, names in (variants or {}).items():
+        urls[fmt] = {}
+        for width, name in names.items():
+            url = default_storage.url(name)
+            urls[fmt][width] = request.build_absolute_uri(url) if request else url
+    return urls
+
+
+class ImageVariantPool:
+    """
+    Lazily started process pool for image resizing, so request workers never
+    spend CPU on Pillow. The pool is per process and recreated after fork().
+    With `IMAGE_VARIANT_WORKERS = 0` the work runs inline instead.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.executor = None
+        self.pid = None
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None or self.pid != os.getpid():
+                self.executor = ProcessPoolExecutor(
+                    max_workers=settings.IMAGE_VARIANT_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                self.pid = os.getpid()
+            return self.executor
+
+    def submit(self, name: str, on_done) -> None:
+        args = (
+            str(settings.MEDIA_ROOT),
+            name,
+            settings.IMAGE_VARIANT_WIDTHS,
+            settings.IMAGE_VARIANT_FORMATS,
+            settings.IMAGE_VARIANT_QUALITY,
+        )
+        if not settings.IMAGE_VARIANT_WORKERS:
+            try:
+                variants = render_image_variants(*args)
+            except Exception:
+                logger.exception(f"Generating image variants of {name} failed")
+                return
+            return on_done(variants)
+
+        future = self.get_executor().submit(render_image_variants, *args)
+
+        def done(future):
+            # Runs on the pool's management thread, which needs its own connection.
+            try:
+                on_done(future.result())
+            except Exception:
+                logger.exception(f"Generating image variants of {name} failed")
+            finally:
+                close_old_connections()
+
+        future.add_done_callback(done)
+
+
+image_variant_pool = ImageVariantPool()
+
+
+def schedule_image_variants(
+    instance, field: str, variants_field: str, on_stored=None
+) -> None:
+    """
+    Generate variants of `instance.<field>` once the current transaction has
+    committed and store them in `instance.<variants_field>`. The row is only
+    updated while it still points at the same file, so a newer upload is
+    never overwritten with the variants of an older one. `on_stored` is
+    called after the row was updated.
+    """
+    name = getattr(instance, field).name
+    if not name:
+        return
+
+    manager = type(instance)._base_manager
+
+    def store(variants: dict) -> None:
+        updated = manager.filter(pk=instance.pk, **{field: name}).update(
+            **{variants_field: variants}
+        )
+        if updated and on_stored is not None:
+            on_stored()
+
+    transaction.on_commit(lambda: image_variant_pool.submit(name, store))
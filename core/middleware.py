@@ -0,0 +1,118 @@
+import re
+import traceback
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from .logger import get_application_logger
+
+logger = get_application_logger()
+
+IN_LIST_RE = re.compile(r"\((?:%s, )+%s\)")
+NUMBER_RE = re.compile(r"\b\d+\b")
+STRING_RE = re.compile(r"'(?:[^']|'')*'")
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def get_sql_fingerprint(sql: str) -> str:
+    """Shape of a statement: literals and `IN (...)` lists of any size look the same."""
+    sql = STRING_RE.sub("%s", sql)
+    sql = NUMBER_RE.sub("%s", sql)
+    return IN_LIST_RE.sub("(...)", sql)
+
+
+def get_caller(base_dir: str) -> str:
+    """Innermost frame of the project's own code that ran the query."""
+    for frame in reversed(traceback.extract_stack()):
+        if (
+            frame.filename.startswith(base_dir)
+            and "site-packages" not in frame.filename
+            and frame.filename != __file__
+        ):
+            return f"{frame.filename[len(base_dir):].lstrip('/')}:{frame.lineno} in {frame.name}"
+    return "unknown"
+
+
+class QueryInspector:
+    """Database execute wrapper counting the statements of one request by shape."""
+
+    def __init__(self):
+        self.total = 0
+        self.counts = Counter()
+        self.samples = {}
+        self.callers = defaultdict(Counter)
+        self.base_dir = str(settings.BASE_DIR)
+
+    def __call__(self, execute, sql, params, many, context):
+        fingerprint = get_sql_fingerprint(sql)
+        self.total += 1
+        self.counts[fingerprint] += 1
+        if self.counts[fingerprint] == 1:
+            self.samples[fingerprint] = sql
+        else:
+            # Stacks are only walked for repeats, the first run is often elsewhere
+            self.callers[fingerprint][get_caller(self.base_dir)] += 1
+        return execute(sql, params, many, context)
+
+    def get_repeated(self, threshold: int) -> list[tuple[int, str, str]]:
+        return [
+            (
+                count,
+                self.samples[fingerprint],
+                self.callers[fingerprint].most_common(1)[0][0],
+            )
+            for fingerprint, count in self.counts.most_common()
+            if count >= threshold
+        ]
+
+
+class QueryInspectorMiddleware:
+    """
+    Development/staging aid: reports statements repeated at least
+    QUERY_INSPECTOR_REPEAT_THRESHOLD times in a request (N+1 patterns), with
+    the project code location that ran them, and requests over their query
+    budget. Budgets are set per URL name in QUERY_BUDGETS, with
+    QUERY_BUDGET_DEFAULT for the rest. Problems are logged, or raised as
+    `QueryBudgetExceeded` when QUERY_INSPECTOR_RAISE is set (tests).
+
+    Only queries run on the request thread are seen; the threads of
+    `core.concurrency.gather_queries` have their own connections.
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_INSPECTOR:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        inspector = QueryInspector()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(inspector))
+            response = self.get_response(request)
+
+        problems = self.get_problems(request, inspector)
+        if problems:
+            message = f"{request.method} {request.path}: " + "; ".join(problems)
+            if settings.QUERY_INSPECTOR_RAISE:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+    def get_problems(self, request, inspector: QueryInspector) -> list[str]:
+        problems = [
+            f"N+1: {count}x {sql[:200]} at {caller}"
+            for count, sql, caller in inspector.get_repeated(
+                settings.QUERY_INSPECTOR_REPEAT_THRESHOLD
+            )
+        ]
+
+        view_name = request.resolver_match.view_name if request.resolver_match else None
+        budget = settings.QUERY_BUDGETS.get(view_name, settings.QUERY_BUDGET_DEFAULT)
+        if budget is not None and inspector.total > budget:
+            problems.append(f"{inspector.total} queries over the budget of {budget} ({view_name})")
+        return problems
@@ -0,0 +1,177 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination driven by the queryset's own `order_by`.
+
+    The ordering must only reference local fields or annotations and must end
+    with a unique column (normally `-id`), e.g. `("-created_at", "-id")`.
+    The cursor is an opaque token holding the ordering values of the last row
+    of the page, so every page is a single index range scan of `page_size + 1`
+    rows no matter how deep the client goes.
+    """
+
+    page_size = api_settings.PAGE_SIZE or 20
+    max_page_size = 100
+    page_size_query_param = "limit"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        self.next_position = None
+
+        position = self.decode_cursor(request, queryset)
+        if position is not None:
+            queryset = queryset.filter(self.get_seek_filter(position))
+
+        rows = list(queryset[: self.page_size + 1])
+        if len(rows) > self.page_size:
+            rows = rows[: self.page_size]
+            self.next_position = self.get_position(rows[-1])
+        return rows
+
+    def restore_page(self, request, next_position):
+        """Set up the paginator for a page whose rows were resolved elsewhere (e.g. a cache)."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.next_position = next_position
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Number of results to return per page (max {self.max_page_size}).",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_ordering(self, queryset):
+        ordering = [
+            (name.lstrip("-"), name.startswith("-"))
+            for name in queryset.query.order_by
+            if isinstance(name, str)
+        ]
+        assert ordering, "KeysetPagination requires an ordered queryset."
+        return ordering
+
+    def get_seek_filter(self, position):
+        seek = Q()
+        for index, (name, descending) in enumerate(self.ordering):
+            lookup = "lt" if descending else "gt"
+            step = Q(**{f"{name}__{lookup}": position[index]})
+            for prev_index, (prev_name, _) in enumerate(self.ordering[:index]):
+                step &= Q(**{prev_name: position[prev_index]})
+            seek |= step
+        return seek
+
+    def get_position(self, row):
+        if isinstance(row, dict):
+            return [row[name] for name, _ in self.ordering]
+        return [getattr(row, name) for name, _ in self.ordering]
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.cursor_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    def encode_cursor(self, position):
+        values = [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in position
+        ]
+        payload = json.dumps(values, separators=(",", ":")).encode()
+        return urlsafe_b64encode(payload).decode().rstrip("=")
+
+    def decode_cursor(self, request, queryset):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            values = json.loads(urlsafe_b64decode(padded.encode()))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self.parse_value(queryset.model, name, value)
+                for (name, _), value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def parse_value(self, model, name, value):
+        try:
+            field = model._meta.get_field("id" if name == "pk" else name)
+        except FieldDoesNotExist:  # annotation
+            return value
+        if isinstance(field, models.DateTimeField):
+            return datetime.fromisoformat(value)
+        return field.to_python(value)
+
+
+class PaginatedAPIViewMixin:
+    """Gives plain `APIView`s the `GenericAPIView` pagination helpers."""
+
+    pagination_class = KeysetPagination
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            self._paginator = self.pagination_class()
+        return self._paginator
+
+    def paginate_queryset(self, queryset):
+        return self.paginator.paginate_queryset(queryset, self.request, view=self)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
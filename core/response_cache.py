@@ -0,0 +1,83 @@
+import hashlib
+import time
+from functools import wraps
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+from .conditional import get_versions
+
+RESPONSE_CACHE_PREFIX = "response"
+RESPONSE_CACHE_HEADERS = ("ETag", "Last-Modified", "Cache-Control")
+
+
+def get_response_cache_key(request) -> str:
+    digest = hashlib.sha1(request.get_full_path().encode()).hexdigest()
+    return f"{RESPONSE_CACHE_PREFIX}:{digest}"
+
+
+def is_fresh(entry: dict) -> bool:
+    """
+    Tags are version keys whose value is the time of the last write behind
+    them. An entry is fresh while no tag was bumped after it started to be
+    built, so a write racing with the build always invalidates it.
+    """
+    return max(get_versions(entry["tags"]), default=0) < entry["built_at"]
+
+
+def restore_response(request, entry: dict):
+    headers = entry["headers"]
+    if "ETag" in headers:
+        not_modified = get_conditional_response(
+            request,
+            etag=headers["ETag"],
+            last_modified=parse_http_date_safe(headers.get("Last-Modified", "")),
+        )
+        if not_modified is not None:
+            for header, value in headers.items():
+                not_modified[header] = value
+            return not_modified
+    return Response(entry["data"], status=entry["status"], headers=headers)
+
+
+def cache_anonymous_response(view_method):
+    """
+    Cache the responses of an APIView method for anonymous requests, shared
+    by every client. The view declares what the response depends on by
+    setting `self.response_cache_tags` to version keys; writes bump those
+    keys, so entries can live for RESPONSE_CACHE_TIMEOUT without going stale.
+    Views whose output also changes with time can set a shorter
+    `response_cache_timeout`. Responses without tags are not cached.
+    """
+
+    @wraps(view_method)
+    def wrapper(view, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return view_method(view, request, *args, **kwargs)
+
+        key = get_response_cache_key(request)
+        entry = cache.get(key)
+        if entry is not None and is_fresh(entry):
+            return restore_response(request, entry)
+
+        built_at = time.time_ns()
+        view.response_cache_tags = None
+        response = view_method(view, request, *args, **kwargs)
+        if view.response_cache_tags and response.status_code in (200, 204):
+            entry = {
+                "data": response.data,
+                "status": response.status_code,
+                "headers": {
+                    header: response[header]
+                    for header in RESPONSE_CACHE_HEADERS
+                    if header in response
+                },
+                "tags": list(view.response_cache_tags),
+                "built_at": built_at,
+            }
+            timeout = getattr(view, "response_cache_timeout", None)
+            cache.set(key, entry, timeout or settings.RESPONSE_CACHE_TIMEOUT)
+        return response
+
+    return wrapper
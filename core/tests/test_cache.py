@@ -0,0 +1,73 @@
+from unittest import mock
+from django.test import SimpleTestCase
+from core.cache import TieredCache
+
+
+def make_cache(**options):
+    return TieredCache(
+        "",
+        {
+            "OPTIONS": {
+                "SHARED": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "LOCATION": "tiered-cache-tests",
+                },
+                "LOCAL_PREFIXES": ("search:",),
+                "LOCAL_MAX_ENTRIES": 2,
+                **options,
+            }
+        },
+    )
+
+
+class TieredCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.cache = make_cache()
+        self.cache.clear()
+
+    def test_local_keys_are_served_from_the_process(self):
+        self.cache.set("search:a", [1, 2])
+        self.cache.shared.set("search:a", "changed elsewhere")
+
+        self.assertEqual(self.cache.get("search:a"), [1, 2])
+        self.assertEqual(self.cache.get_stats()["local_hits"], 1)
+
+    def test_other_keys_always_read_the_shared_tier(self):
+        self.cache.set("throttle_user_1", [1])
+        self.cache.shared.set("throttle_user_1", [1, 2])
+
+        self.assertEqual(self.cache.get("throttle_user_1"), [1, 2])
+        self.assertEqual(self.cache.get_stats()["local_entries"], 0)
+
+    def test_lru_eviction(self):
+        for key in ("search:a", "search:b"):
+            self.cache.set(key, key)
+        self.cache.get("search:a")  # b is now the least recently used
+        self.cache.set("search:c", "search:c")
+
+        self.assertEqual(set(self.cache.local), {":1:search:a", ":1:search:c"})
+        self.assertEqual(self.cache.get_stats()["local_evictions"], 1)
+        self.assertEqual(self.cache.get("search:b"), "search:b")  # still shared
+
+    def test_local_copies_expire(self):
+        cache = make_cache(LOCAL_TIMEOUT=5)
+        with mock.patch("core.cache.time.monotonic", return_value=100):
+            cache.set("search:a", 1, timeout=None)
+        cache.shared.set("search:a", 2)
+
+        with mock.patch("core.cache.time.monotonic", return_value=104):
+            self.assertEqual(cache.get("search:a"), 1)
+        with mock.patch("core.cache.time.monotonic", return_value=106):
+            self.assertEqual(cache.get("search:a"), 2)
+
+    def test_atomic_increments_and_deletes(self):
+        self.assertTrue(self.cache.add("stats:hits", 1, None))
+        self.assertFalse(self.cache.add("stats:hits", 5, None))
+        self.assertEqual(self.cache.incr("stats:hits", 2), 3)
+
+        self.cache.set_many({"search:a": 1, "search:b": 2})
+        self.cache.delete_many(["search:a"])
+        self.assertEqual(
+            self.cache.get_many(["search:a", "search:b", "stats:hits"]),
+            {"search:b": 2, "stats:hits": 3},
+        )
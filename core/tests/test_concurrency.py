@@ -0,0 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from asgiref.sync import async_to_sync
+from django.db import connection, connections
+from django.test import TransactionTestCase, override_settings
+from core.concurrency import gather_queries
+
+
+class GatherQueriesTests(TransactionTestCase):
+    def test_reuses_thread_connections(self):
+        def get_backend_pid():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_backend_pid()")
+                return cursor.fetchone()[0]
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        with mock.patch("core.concurrency.get_executor", return_value=executor):
+            with override_settings(GATHER_QUERIES_CONN_MAX_AGE=60):
+                first = async_to_sync(gather_queries)(get_backend_pid)
+                second = async_to_sync(gather_queries)(get_backend_pid)
+            async_to_sync(gather_queries)(connections.close_all)
+        executor.shutdown()
+        self.assertEqual(first, second)
@@ -0,0 +1,27 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.account.models import User
+from apps.content.services.content import create_post
+from core.middleware import QueryBudgetExceeded, get_sql_fingerprint
+
+
+class QueryInspectorTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create(username="owner")
+        create_post(self.owner, "hello")
+
+    def test_fingerprint_ignores_literals_and_in_list_sizes(self):
+        self.assertEqual(
+            get_sql_fingerprint('SELECT * FROM "t" WHERE "id" IN (%s, %s) AND "n" = 5'),
+            get_sql_fingerprint("SELECT * FROM \"t\" WHERE \"id\" IN (%s, %s, %s) AND \"n\" = 'x'"),
+        )
+
+    def test_query_budget(self):
+        url = reverse("api:content:user-content", args=["owner"])
+        client = APIClient()
+        client.force_authenticate(self.owner)  # not served by the response cache
+        with override_settings(QUERY_BUDGETS={"api:content:user-content": 1}):
+            with self.assertRaisesMessage(QueryBudgetExceeded, "over the budget of 1"):
+                client.get(url)
+        self.assertEqual(client.get(url).status_code, 200)
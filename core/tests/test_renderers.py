@@ -0,0 +1,89 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+from apps.account.models import User
+from apps.comment.services import create_comment
+from apps.content.services.content import create_post
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def assertSameOutput(self, data, accepted_media_type=None):
+        self.assertEqual(
+            ORJSONRenderer().render(data, accepted_media_type),
+            JSONRenderer().render(data, accepted_media_type),
+        )
+
+    def test_matches_the_stdlib_renderer(self):
+        self.assertSameOutput(
+            ReturnDict(
+                {
+                    "aware": datetime.datetime(2024, 5, 1, 10, 30, 1, 123456, tzinfo=datetime.timezone.utc),
+                    "naive": datetime.datetime(2024, 5, 1, 10, 30),
+                    "date": datetime.date(2024, 5, 1),
+                    "time": datetime.time(10, 30, 1, 500),
+                    "duration": datetime.timedelta(minutes=3),
+                    "decimal": Decimal("1.10"),
+                    "lazy": gettext_lazy("This profile is private."),
+                    "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+                    "text": "héllo ✓ 😀 \u2028 \u2029 \"quoted\" \\ \n",
+                    "numbers": (0, -1, 2**63 - 1, 0.1, 1729238400.123456, True, None),
+                    "keys": {1: "int key", "2": "str key"},
+                    "rows": ReturnList([{"id": 1}, {"id": 2}], serializer=None),
+                },
+                serializer=None,
+            )
+        )
+
+    def test_falls_back_for_indent_and_big_integers(self):
+        self.assertSameOutput({"a": [1, 2]}, "application/json; indent=4")
+        self.assertSameOutput({"big": 2**70})
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+
+class ORJSONRendererResponseTests(TestCase):
+    def test_api_payloads_are_byte_identical(self):
+        cache.clear()
+        owner = User.objects.create(username="owner")
+        post = create_post(owner, "héllo #django ✓")
+        create_comment(user=owner, content_id=post.id, text="first 😀")
+
+        client = APIClient()
+        for url in (
+            reverse("api:content:user-content", args=["owner"]),
+            reverse("api:comment:comment-list-create", args=[post.id]),
+            reverse("api:account:profile_detail", args=["owner"]),
+        ):
+            with self.subTest(url=url):
+                response = client.get(url)
+                self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+                self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+
+class ORJSONParserTests(SimpleTestCase):
+    def test_matches_the_stdlib_parser(self):
+        body = '{"text": "héllo \\u2028", "n": [1, 2.5, null, true]}'.encode()
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body))
+        )
+        latin = '{"text": "héllo"}'.encode("latin-1")
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO(latin), parser_context={"encoding": "latin-1"}),
+            {"text": "héllo"},
+        )
+
+    def test_invalid_json(self):
+        for body in (b"{", b'{"a": NaN}'):
+            with self.assertRaises(ParseError):
+                ORJSONParser().parse(io.BytesIO(body))
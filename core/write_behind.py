@@ -0,0 +1,73 @@
+import atexit
+import os
+import threading
+from django.db import close_old_connections
+from .logger import get_application_logger
+
+logger = get_application_logger()
+
+
+class WriteBehindBuffer:
+    """
+    Coalesces keyed writes in memory and hands them to `flush_func` in batches.
+
+    Writing the same key again replaces the pending value, so a burst of
+    toggles costs one row in the next batch. A daemon thread flushes every
+    `interval` seconds (or as soon as `max_size` keys are pending) and the
+    buffer is drained once more when the process exits. The buffer is per
+    process: anything that must be visible to other workers before the flush
+    has to be published by the caller.
+    """
+
+    def __init__(self, flush_func, interval: float, max_size: int = 10_000, name: str = "write-behind"):
+        self.flush_func = flush_func
+        self.interval = interval
+        self.max_size = max_size
+        self.name = name
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.pending = {}
+        self.thread = None
+        self.pid = None
+
+    def start(self) -> None:
+        with self.lock:
+            if self.thread is not None and self.pid == os.getpid():
+                return
+            # Also covers forked workers: the parent's thread does not survive fork().
+            self.pending = {}
+            self.pid = os.getpid()
+            self.thread = threading.Thread(target=self.run, name=self.name, daemon=True)
+            self.thread.start()
+        atexit.register(self.flush)
+
+    def add(self, key, value) -> None:
+        if self.thread is not None and self.pid != os.getpid():
+            self.start()
+        with self.lock:
+            self.pending[key] = value
+            full = len(self.pending) >= self.max_size
+        if full:
+            self.wakeup.set()
+
+    def run(self) -> None:
+        while True:
+            self.wakeup.wait(self.interval)
+            self.wakeup.clear()
+            close_old_connections()
+            self.flush()
+
+    def flush(self) -> None:
+        with self.flush_lock:
+            with self.lock:
+                batch, self.pending = self.pending, {}
+            if not batch:
+                return
+            try:
+                self.flush_func(batch)
+            except Exception:
+                logger.exception(f"{self.name}: flush of {len(batch)} items failed, retrying later")
+                with self.lock:
+                    for key, value in batch.items():
+                        self.pending.setdefault(key, value)  # newer writes win
@@ -1,4 +1,8 @@
 #!/bin/sh
 python manage.py migrate
 python manage.py collectstatic --no-input --clear
-gunicorn config.wsgi:application --bind 0.0.0.0:8000
+if [ "$SERVER_MODE" = "asgi" ]; then
+    gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker --bind 0.0.0.0:8000
+else
+    gunicorn config.wsgi:application --bind 0.0.0.0:8000
+fi